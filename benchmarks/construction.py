@@ -0,0 +1,49 @@
+"""
+Compare building objects whose fields are described with `TIMESTAMP_FIELDS`
+and `ID_FIELDS` against building the same objects dynamically.
+"""
+
+from benchmarks.memory import make_submission
+from benchmarks.util import report
+from canvasapi.canvas_object import CanvasObject
+from canvasapi.submission import Submission
+
+SUBMISSION = make_submission(5)
+
+
+class DynamicSubmission(CanvasObject):
+    # A submission with no fields described.
+    pass
+
+
+def read_dates(obj):
+    for field in SUBMISSION:
+        getattr(obj, field + "_date", None)
+
+
+def main():
+    print("Construction only (per object)")
+    report("  dynamic", lambda: DynamicSubmission(None, SUBMISSION), 20000)
+    report("  described", lambda: Submission(None, SUBMISSION), 20000)
+
+    print("Construction and reading every *_date attribute (per object)")
+    report("  dynamic", lambda: read_dates(DynamicSubmission(None, SUBMISSION)), 2000)
+    report("  described", lambda: read_dates(Submission(None, SUBMISSION)), 2000)
+
+    print("Reading the declared timestamps only (per object)")
+    fields = [field + "_date" for field in Submission.TIMESTAMP_FIELDS]
+
+    def read_timestamps(obj):
+        for name in fields:
+            getattr(obj, name, None)
+
+    report(
+        "  dynamic",
+        lambda: read_timestamps(DynamicSubmission(None, SUBMISSION)),
+        2000,
+    )
+    report("  described", lambda: read_timestamps(Submission(None, SUBMISSION)), 2000)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Compare the native ISO 8601 parser used for `*_date` attributes against the
+`arrow` based parsing it replaced.
+"""
+
+import arrow
+import pytz
+
+from benchmarks.util import report
+from canvasapi.canvas_object import CanvasObject, _parse_date
+
+SAMPLES = {
+    "utc timestamp": "2012-05-05T00:00:00Z",
+    "offset timestamp": "2018-05-21T13:52:25+04:30",
+    "fractional seconds": "2012-05-05T00:00:00.123Z",
+    "date only": "2012-08-05",
+    "uncommon format": "2012-05-05T10",
+    "not a date": "Introduction to Biology",
+}
+
+SUBMISSION = {
+    "id": 1234,
+    "assignment_id": 42,
+    "user_id": 7,
+    "attempt": 1,
+    "body": None,
+    "grade": "A",
+    "score": 98.5,
+    "submitted_at": "2024-02-01T12:00:00Z",
+    "graded_at": "2024-02-03T08:30:00Z",
+    "cached_due_date": "2024-02-01T23:59:59Z",
+    "posted_at": "2024-02-03T08:30:00Z",
+    "workflow_state": "graded",
+    "late": False,
+    "missing": False,
+    "excused": None,
+    "submission_type": "online_upload",
+    "preview_url": "https://example.com/courses/1/assignments/42/submissions/7",
+}
+
+
+def parse_with_arrow(value):
+    # The parsing previously done for every attribute of every object.
+    try:
+        naive = arrow.get(str(value)).datetime
+        return naive.replace(tzinfo=pytz.utc) - naive.utcoffset()
+    except (arrow.ParserError, ValueError):
+        return None
+
+
+def build_with_arrow(attributes):
+    obj = CanvasObject(None, {})
+    for attribute, value in attributes.items():
+        obj.__dict__[attribute] = value
+        aware = parse_with_arrow(value)
+        if aware is not None:
+            obj.__dict__[attribute + "_date"] = aware
+    return obj
+
+
+def build_with_native(attributes):
+    obj = CanvasObject(None, attributes)
+    for attribute in attributes:
+        getattr(obj, attribute + "_date", None)
+    return obj
+
+
+def main():
+    for label, value in SAMPLES.items():
+        assert parse_with_arrow(value) == _parse_date(value), label
+
+    print("Parsing a single value (per call)")
+    for label, value in SAMPLES.items():
+        report("  arrow, {}".format(label), lambda: parse_with_arrow(value), 2000)
+        report("  native, {}".format(label), lambda: _parse_date(value), 2000)
+
+    print("Building a submission (per object)")
+    report("  arrow, all dates", lambda: build_with_arrow(SUBMISSION), 2000)
+    report("  native, all dates read", lambda: build_with_native(SUBMISSION), 2000)
+    report("  native, no dates read", lambda: CanvasObject(None, SUBMISSION), 2000)
+
+
+if __name__ == "__main__":
+    main()
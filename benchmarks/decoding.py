@@ -0,0 +1,62 @@
+"""
+Compare decoding response bodies with `requests` (stdlib `json`) against
+`decode_json`, which uses `orjson` when it is installed.
+
+Payloads are every fixture in `tests/fixtures` joined into one list, and a
+page of typical submissions.
+"""
+
+import glob
+import json
+import os
+
+import requests
+
+from benchmarks.memory import make_submission
+from benchmarks.util import report
+from canvasapi import requester
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "..", "tests", "fixtures")
+
+
+def fixture_payload():
+    data = []
+    for path in sorted(glob.glob(os.path.join(FIXTURES, "*.json"))):
+        with open(path) as fixture:
+            for endpoint in json.load(fixture).values():
+                if isinstance(endpoint, dict) and "data" in endpoint:
+                    data.append(endpoint["data"])
+    return data
+
+
+def make_response(data):
+    response = requests.Response()
+    response._content = json.dumps(data).encode("utf-8")
+    response.status_code = 200
+    return response
+
+
+def main():
+    print("orjson installed: {}".format(requester.orjson is not None))
+
+    payloads = [
+        ("fixtures", fixture_payload()),
+        ("submissions page (100)", [make_submission(i) for i in range(100)]),
+    ]
+    for name, data in payloads:
+        response = make_response(data)
+        print("{} ({} bytes, per decode)".format(name, len(response.content)))
+        report("  requests", lambda: requests.Response.json(response), 200)
+        report("  decode_json", lambda: requester.decode_json(response), 200)
+
+        prefixed = make_response(data)
+        prefixed._content = b"while(1);" + prefixed._content
+        report(
+            "  decode_json, while(1); prefix",
+            lambda: requester.decode_json(prefixed),
+            200,
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Measure the cold start of importing `canvasapi` and building a `Canvas`, and
+list the slowest modules imported along the way, using `python -X importtime`.
+"""
+
+import subprocess
+import sys
+
+from benchmarks.util import report
+
+STARTUP = "import canvasapi; canvasapi.Canvas('https://example.com', 'token')"
+
+
+def import_times(code):
+    """
+    Run `code` in a fresh interpreter and return the cumulative import time of
+    each module it imported.
+
+    :param code: The code to run.
+    :type code: str
+    :returns: Module names mapped to their cumulative import time, in
+        microseconds.
+    :rtype: dict
+    """
+    output = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        check=True,
+        text=True,
+    ).stderr
+
+    times = {}
+    for line in output.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split(":", 1)[1].split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def main():
+    print("Cold start (per process)")
+    report("  python only", lambda: import_times("pass"))
+    report("  import canvasapi and build Canvas", lambda: import_times(STARTUP))
+
+    times = import_times(STARTUP)
+    print("Slowest imports (cumulative)")
+    for name in sorted(times, key=times.get, reverse=True)[:10]:
+        print("  {:<48} {:>12} us".format(name, times[name]))
+    print(
+        "canvasapi modules imported: {}".format(
+            sorted(name for name in times if name.startswith("canvasapi"))
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""
+Compare `combine_kwargs` against the original recursive implementation on
+large nested payloads, like those sent by `submissions_bulk_update` and
+`column_data_bulk_update`.
+"""
+
+from benchmarks.util import report
+from canvasapi.util import combine_kwargs
+from tests.test_util import recursive_combine_kwargs
+
+STUDENTS = 5000
+
+
+def grade_data():
+    return {
+        "grade_data": {
+            user_id: {
+                "posted_grade": "A-",
+                "text_comment": "Well done",
+                "rubric_assessment": {
+                    "crit1": {"points": 4, "comments": "Clear"},
+                    "crit2": {"points": 3},
+                },
+            }
+            for user_id in range(STUDENTS)
+        }
+    }
+
+
+def column_data():
+    return {
+        "column_data": [
+            {"column_id": 7, "user_id": user_id, "content": "Extension granted"}
+            for user_id in range(STUDENTS)
+        ]
+    }
+
+
+def main():
+    for name, kwargs in (
+        ("grade_data ({} students)".format(STUDENTS), grade_data()),
+        ("column_data ({} rows)".format(STUDENTS), column_data()),
+    ):
+        count = len(combine_kwargs(**kwargs))
+        print("{}, {} parameters (per call)".format(name, count))
+        report("  recursive", lambda: recursive_combine_kwargs(**kwargs), 5)
+        report("  combine_kwargs", lambda: combine_kwargs(**kwargs), 5)
+
+
+if __name__ == "__main__":
+    main()
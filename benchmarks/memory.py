@@ -0,0 +1,118 @@
+"""
+Measure the memory held by a large list of submissions, with and without
+`compact_objects`, using `tracemalloc`.
+
+Usage::
+
+    python -m benchmarks.memory [submissions]
+
+The default of one million submissions takes a long time to run, as
+`tracemalloc` slows allocation down considerably.
+"""
+
+import gc
+import sys
+import tracemalloc
+
+from benchmarks.util import BASE_URL, make_canvas
+from canvasapi.paginated_list import PaginatedList
+from canvasapi.submission import Submission
+
+SUBMISSIONS = 1000000
+PER_PAGE = 100
+
+
+def make_page(page):
+    def build():
+        return [make_submission(page * PER_PAGE + i) for i in range(PER_PAGE)]
+
+    return build
+
+
+def make_submission(user_id):
+    # The fields of a typical submission returned by
+    # `GET /api/v1/courses/:course_id/students/submissions`.
+    return {
+        "id": 100000 + user_id,
+        "body": None,
+        "url": None,
+        "grade": "A",
+        "score": 98.5,
+        "submitted_at": "2024-02-01T12:{:02d}:00Z".format(user_id % 60),
+        "assignment_id": 42,
+        "user_id": user_id,
+        "submission_type": "online_upload",
+        "workflow_state": "graded",
+        "grade_matches_current_submission": True,
+        "graded_at": "2024-02-03T08:30:00Z",
+        "grader_id": 7,
+        "attempt": 1,
+        "cached_due_date": "2024-02-01T23:59:59Z",
+        "excused": False,
+        "late_policy_status": None,
+        "points_deducted": None,
+        "grading_period_id": None,
+        "extra_attempts": None,
+        "posted_at": "2024-02-03T08:30:00Z",
+        "redo_request": False,
+        "custom_grade_status_id": None,
+        "sticker": None,
+        "late": False,
+        "missing": False,
+        "seconds_late": 0,
+        "entered_grade": "A",
+        "entered_score": 98.5,
+        "preview_url": "{}/courses/1/assignments/42/submissions/{}?preview=1".format(
+            BASE_URL, user_id
+        ),
+        "anonymous_id": "a{:05d}".format(user_id % 100000),
+        "course_id": 1,
+    }
+
+
+def register_submissions(adapter, count):
+    base = BASE_URL + "/api/v1/courses/1/students/submissions"
+    pages = -(-count // PER_PAGE)
+    for page in range(pages):
+        url = base + ("?per_page=100" if page == 0 else "?page={}".format(page))
+        headers = {}
+        if page + 1 < pages:
+            headers["Link"] = '<{}?page={}>; rel="next"'.format(base, page + 1)
+        adapter.register(url, make_page(page), headers)
+
+
+def measure(count, compact_objects):
+    canvas, adapter = make_canvas(compact_objects=compact_objects)
+    register_submissions(adapter, count)
+    requester = canvas._Canvas__requester
+
+    gc.collect()
+    tracemalloc.start()
+    submissions = PaginatedList(
+        Submission, requester, "GET", "courses/1/students/submissions"
+    )
+    for _ in submissions:
+        pass
+    requester._cache.clear()
+    gc.collect()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    label = "compact" if compact_objects else "default"
+    print(
+        "{:<10} {:>10.1f} MiB held {:>10.1f} MiB peak {:>8.0f} bytes/submission".format(
+            label, current / 2**20, peak / 2**20, current / count
+        )
+    )
+    return current
+
+
+def main(count=SUBMISSIONS):
+    print("{} submissions".format(count))
+    default = measure(count, compact_objects=False)
+    compact = measure(count, compact_objects=True)
+    print("compact uses {:.0%} of the default".format(compact / default))
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]))
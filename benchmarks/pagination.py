@@ -0,0 +1,92 @@
+"""
+Measure the per-page overhead of :class:`canvasapi.paginated_list.PaginatedList`.
+
+Pages are served from memory so that only the pagination machinery itself
+is timed.
+"""
+
+import re
+import sys
+
+from benchmarks.util import BASE_URL, make_canvas, report
+from canvasapi.paginated_list import PaginatedList, _next_url_pattern
+from canvasapi.user import User
+
+PAGES = 1000
+PER_PAGE = 10
+
+
+def register_pages(adapter, endpoint, pages, per_page, api="/api/v1/"):
+    base = BASE_URL + api + endpoint
+    for page in range(1, pages + 1):
+        url = base + ("?per_page=100" if page == 1 else "?page={}".format(page))
+        headers = {}
+        if page < pages:
+            headers["Link"] = (
+                '<{}?page={}>; rel="next", <{}?page=1>; rel="first"'.format(
+                    base, page + 1, base
+                )
+            )
+        data = [
+            {"id": page * per_page + i, "name": "User {}".format(i)}
+            for i in range(per_page)
+        ]
+        adapter.register(url, data, headers)
+
+
+def strip_with_rebuilt_regex(requester, url):
+    # The approach used before patterns were cached: build and look up the
+    # regex again for every page.
+    regex = r"(?:{}|{})(.*)".format(
+        re.escape(requester.base_url), re.escape(requester.new_quizzes_url)
+    )
+    return re.search(regex, url).group(1)
+
+
+def strip_with_cached_pattern(requester, url):
+    pattern = _next_url_pattern(requester.base_url, requester.new_quizzes_url)
+    return pattern.search(url).group(1)
+
+
+def main(pages=PAGES):
+    canvas, adapter = make_canvas()
+    requester = canvas._Canvas__requester
+
+    rest_url = BASE_URL + "/api/v1/users?page=2&per_page=10"
+    quiz_url = BASE_URL + "/api/quiz/v1/courses/1/quizzes?page=2"
+
+    print("URL stripping (per call)")
+    for label, url in (("rest", rest_url), ("new quizzes", quiz_url)):
+        report(
+            "  rebuilt regex, {}".format(label),
+            lambda: strip_with_rebuilt_regex(requester, url),
+            number=10000,
+        )
+        report(
+            "  cached pattern, {}".format(label),
+            lambda: strip_with_cached_pattern(requester, url),
+            number=10000,
+        )
+
+    register_pages(adapter, "users", pages, PER_PAGE)
+    register_pages(adapter, "quizzes", pages, PER_PAGE, api="/api/quiz/v1/")
+
+    def iterate(endpoint, url_override=None):
+        paginated = PaginatedList(
+            User, requester, "GET", endpoint, _url_override=url_override
+        )
+        for _ in paginated:
+            pass
+
+    print("Full iteration over {} pages (per page)".format(pages))
+    report("  rest", lambda: iterate("users"), repeat=3, per=pages)
+    report(
+        "  new quizzes",
+        lambda: iterate("quizzes", "new_quizzes"),
+        repeat=3,
+        per=pages,
+    )
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]))
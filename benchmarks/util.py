@@ -0,0 +1,101 @@
+"""
+Helpers shared by the benchmark scripts.
+
+Benchmarks are run from the repository root, e.g.::
+
+    python -m benchmarks.pagination
+"""
+
+import json
+import timeit
+
+import requests
+from requests.adapters import BaseAdapter
+
+from canvasapi import Canvas
+
+BASE_URL = "https://example.com"
+API_KEY = "123"
+
+
+class InMemoryAdapter(BaseAdapter):
+    """
+    A `requests` transport adapter that answers requests from memory.
+
+    Mounting it on a requester's session removes all network and socket
+    overhead, leaving only the work done by `requests` and canvasapi.
+    """
+
+    def __init__(self):
+        super(InMemoryAdapter, self).__init__()
+        self._responses = {}
+
+    def close(self):
+        pass
+
+    def register(self, url, data, headers=None, status_code=200):
+        """
+        Register a JSON response for a full URL, including the query string.
+
+        :param url: The URL to answer.
+        :type url: str
+        :param data: The JSON-serializable body of the response, or a
+            callable returning it for page sets too large to hold in memory.
+        :param headers: Headers to include with the response.
+        :type headers: dict
+        :param status_code: The status code of the response.
+        :type status_code: int
+        """
+        self._responses[url] = (data, headers or {}, status_code)
+
+    def send(self, request, **kwargs):
+        data, headers, status_code = self._responses[request.url]
+        if callable(data):
+            data = data()
+        body = data if isinstance(data, bytes) else json.dumps(data).encode("utf-8")
+
+        response = requests.Response()
+        response.status_code = status_code
+        response.headers.update(headers)
+        response._content = body
+        response.encoding = "utf-8"
+        response.url = request.url
+        response.request = request
+        return response
+
+
+def make_canvas(**kwargs):
+    """
+    Create a :class:`canvasapi.Canvas` whose requests are served from memory.
+
+    :param kwargs: Extra arguments for :class:`canvasapi.Canvas`.
+    :returns: The Canvas instance and the adapter serving its requests.
+    :rtype: tuple
+    """
+    canvas = Canvas(BASE_URL, API_KEY, **kwargs)
+    adapter = InMemoryAdapter()
+    canvas._Canvas__requester._session.mount("https://", adapter)
+    return canvas, adapter
+
+
+def report(name, func, number=1, repeat=5, per=1):
+    """
+    Time `func` and print the best time per call, or per item if `per` is
+    the number of items each call processes.
+
+    :param name: A label for the measurement.
+    :type name: str
+    :param func: A callable taking no arguments.
+    :param number: How many calls make up one timing run.
+    :type number: int
+    :param repeat: How many timing runs to take the best of.
+    :type repeat: int
+    :param per: How many items each call processes.
+    :type per: int
+
+    :returns: The best time per call or item, in seconds.
+    :rtype: float
+    """
+    best = min(timeit.repeat(func, number=number, repeat=repeat)) / number / per
+    print("{:<50} {:>12.3f} us".format(name, best * 1e6))
+    return best
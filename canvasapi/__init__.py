@@ -1,7 +1,22 @@
 # -*- coding: utf-8 -*-
 
+import importlib
+
 from canvasapi.canvas import Canvas
 
 __all__ = ["Canvas"]
 
 __version__ = "3.4.0"
+
+
+def __getattr__(name):
+    # Submodules are imported lazily, but stay reachable as attributes of the
+    # package, as in `canvasapi.course`.
+    if not name.startswith("_"):
+        try:
+            return importlib.import_module("{}.{}".format(__name__, name))
+        except ModuleNotFoundError as error:
+            if error.name != "{}.{}".format(__name__, name):
+                raise
+
+    raise AttributeError("module '{}' has no attribute '{}'".format(__name__, name))
@@ -1,3 +1,11 @@
+import csv
+import io
+import itertools
+import shutil
+import tempfile
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+
 from canvasapi.account_calendar import AccountCalendar
 from canvasapi.authentication_event import AuthenticationEvent
 from canvasapi.authentication_provider import AuthenticationProvider
@@ -7,9 +15,10 @@ from canvasapi.course import Course
 from canvasapi.course_event import CourseEvent
 from canvasapi.enrollment import Enrollment
 from canvasapi.enrollment_term import EnrollmentTerm
-from canvasapi.exceptions import CanvasException, RequiredFieldMissing
+from canvasapi.exceptions import CanvasException, ReportFailed, RequiredFieldMissing
 from canvasapi.external_tool import ExternalTool
 from canvasapi.feature import Feature, FeatureFlag
+from canvasapi.file import DOWNLOAD_CHUNK_SIZE, File
 from canvasapi.grading_period import GradingPeriod
 from canvasapi.grading_standard import GradingStandard
 from canvasapi.group import Group, GroupCategory
@@ -21,10 +30,18 @@ from canvasapi.rubric import Rubric
 from canvasapi.scope import Scope
 from canvasapi.sis_import import SisImport
 from canvasapi.user import User
-from canvasapi.util import combine_kwargs, file_or_path, obj_or_id, obj_or_str
+from canvasapi.util import (
+    combine_kwargs,
+    file_or_path,
+    obj_or_id,
+    obj_or_str,
+    wait_for_jobs,
+)
 
 
 class Account(CanvasObject):
+    IDENTITY_MAPPED = True
+
     def __str__(self):
         return "{} ({})".format(self.name, self.id)
 
@@ -232,6 +249,32 @@ class Account(CanvasObject):
         )
         return Course(self._requester, response.json())
 
+    def create_delta_sis_import(self, files, snapshot_directory, **kwargs):
+        """
+        Import only the rows of SIS CSV files that changed since the last
+        successful import, and wait for the import to finish.
+
+        See :func:`canvasapi.sis_delta.create_delta_sis_import` for how rows
+        are compared and the supported options.
+
+        :calls: `POST /api/v1/accounts/:account_id/sis_imports \
+        <https://canvas.instructure.com/doc/api/sis_imports.html#method.sis_imports_api.create>`_
+
+        :param files: The paths of the full CSV files, each named after the
+            kind of data it holds, such as `users.csv`.
+        :type files: list of str
+        :param snapshot_directory: The directory holding the files of the last
+            successful import.
+        :type snapshot_directory: str
+
+        :returns: The finished import, or None if nothing changed, and the
+            number of rows added, updated and deleted for each kind of data.
+        :rtype: tuple
+        """
+        from canvasapi.sis_delta import create_delta_sis_import
+
+        return create_delta_sis_import(self, files, snapshot_directory, **kwargs)
+
     def create_enrollment_term(self, **kwargs):
         """
         Create an enrollment term.
@@ -1705,6 +1748,94 @@ class Account(CanvasObject):
             _kwargs=combine_kwargs(**kwargs),
         )
 
+    def run_reports(
+        self,
+        reports,
+        max_workers=4,
+        timeout=None,
+        interval=1.0,
+        backoff=1.5,
+        max_interval=30.0,
+        return_exceptions=False,
+    ):
+        """
+        Generate many reports at once and wait for them to finish.
+
+        Up to `max_workers` reports are requested at the same time. The
+        reports are then polled in one loop with a shared delay that grows
+        by `backoff` between rounds, and each is yielded as soon as it is
+        complete. Its rows can then be read with
+        :meth:`AccountReport.iter_rows` or its file saved with
+        :meth:`AccountReport.download`.
+
+        :calls: `POST /api/v1/accounts/:account_id/reports/:report \
+        <https://canvas.instructure.com/doc/api/account_reports.html#method.account_reports.create>`_
+            `GET /api/v1/accounts/:account_id/reports/:report/:id \
+        <https://canvas.instructure.com/doc/api/account_reports.html#method.account_reports.show>`_
+
+        :param reports: The reports to generate. Each is either a report type,
+            or a `(report_type, parameters)` tuple where `parameters` is a dict
+            of the report's parameters.
+        :type reports: iterable of str or tuple
+        :param max_workers: The maximum number of requests to make at once.
+        :type max_workers: int
+        :param timeout: The most seconds to wait for the reports, or None to
+            wait for as long as they run.
+        :type timeout: float
+        :param interval: The seconds to wait before the first round of polls.
+        :type interval: float
+        :param backoff: What the delay is multiplied by after each round.
+        :type backoff: float
+        :param max_interval: The longest delay between two rounds.
+        :type max_interval: float
+        :param return_exceptions: If True, a
+            :class:`canvasapi.exceptions.ReportFailed` is yielded in place of
+            a report that failed, as is the exception raised while requesting
+            a report, and the remaining reports carry on. If False, they are
+            raised.
+        :type return_exceptions: bool
+
+        :raises TimeoutError: If any report is still running after `timeout`.
+        :returns: An iterator of the reports, in the order they finish, after
+            any that couldn't be requested.
+        :rtype: iterator of :class:`canvasapi.account.AccountReport`
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1.")
+
+        def create(report):
+            try:
+                if isinstance(report, str):
+                    return self.create_report(report), None
+                report_type, parameters = report
+                return self.create_report(report_type, parameters=parameters), None
+            except Exception as error:
+                return None, error
+
+        # Every report is requested, even if some of the requests fail, so
+        # that none of them are left running without being waited on.
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(create, reports))
+
+        errors = [error for _, error in results if error is not None]
+        if errors and not return_exceptions:
+            raise errors[0]
+
+        return itertools.chain(
+            errors,
+            wait_for_jobs(
+                [report for report, error in results if error is None],
+                _report_finished,
+                _report_failure,
+                timeout=timeout,
+                interval=interval,
+                backoff=backoff,
+                max_interval=max_interval,
+                max_workers=max_workers,
+                return_exceptions=return_exceptions,
+            ),
+        )
+
     def show_account_auth_settings(self, **kwargs):
         """
         Return the current state of each account level setting
@@ -1854,6 +1985,9 @@ class AccountNotification(CanvasObject):
 
 
 class AccountReport(CanvasObject):
+    # The statuses of a report that has stopped running.
+    FINISHED_STATES = ("complete", "error", "aborted", "deleted")
+
     def __str__(self):
         try:
             return "{} ({})".format(self.report, self.id)
@@ -1878,6 +2012,134 @@ class AccountReport(CanvasObject):
 
         return AccountReport(self._requester, response.json())
 
+    def download(self, location, **kwargs):
+        """
+        Stream the file of a complete report to a path or file-like object.
+
+        :param location: The path to download to, or a writable binary
+            file-like object.
+        :type location: str, :class:`os.PathLike` or file
+        :param kwargs: Passed to :meth:`canvasapi.file.File.download`, such as
+            `resume` or `checksum`.
+
+        :returns: The hex digest of the file if `checksum` was given, None
+            otherwise.
+        :rtype: str
+        """
+        return self._attachment().download(location, **kwargs)
+
+    def iter_rows(self, member=None, chunk_size=DOWNLOAD_CHUNK_SIZE):
+        """
+        Stream the rows of a complete CSV report, parsing each as it arrives
+        so reports of any size are read in constant memory.
+
+        Reports that Canvas delivers as a zip archive, such as provisioning
+        reports covering several kinds of data, are first streamed to a
+        temporary file, and the rows of one CSV file within it are read.
+
+        :param member: The name of the CSV file to read from a zip archive.
+            May be left out if the archive holds only one file.
+        :type member: str
+        :param chunk_size: The number of bytes to read from the response at a
+            time.
+        :type chunk_size: int
+
+        :returns: An iterator of the rows, each a dict keyed by the CSV header.
+        :rtype: iterator of dict
+        """
+        attachment = self._attachment()
+        response = self._requester.request("GET", _url=attachment.url, _stream=True)
+        stream = io.BufferedReader(_ResponseStream(response, chunk_size))
+
+        if not _is_zip(attachment):
+            with stream:
+                yield from _read_csv(stream)
+            return
+
+        with tempfile.TemporaryFile() as spooled, stream:
+            shutil.copyfileobj(stream, spooled, chunk_size)
+            with zipfile.ZipFile(spooled) as archive:
+                names = archive.namelist()
+                if member is None:
+                    if len(names) != 1:
+                        raise ValueError(
+                            "The report holds {}, so a member must be given.".format(
+                                ", ".join(names)
+                            )
+                        )
+                    member = names[0]
+
+                with archive.open(member) as member_file:
+                    yield from _read_csv(member_file)
+
+    def query(self, **kwargs):
+        """
+        Update this report with its current status.
+
+        :calls: `GET /api/v1/accounts/:account_id/reports/:report/:id \
+        <https://canvas.instructure.com/doc/api/account_reports.html#method.account_reports.show>`_
+
+        :rtype: :class:`canvasapi.account.AccountReport`
+        """
+        response = self._requester.request(
+            "GET",
+            "accounts/{}/reports/{}/{}".format(self.account_id, self.report, self.id),
+            _kwargs=combine_kwargs(**kwargs),
+        )
+
+        response_json = response.json()
+        response_json.update({"account_id": self.account_id})
+        super(AccountReport, self).set_attributes(response_json)
+
+        return AccountReport(self._requester, response_json)
+
+    def wait(self, timeout=None, interval=1.0, backoff=1.5, max_interval=30.0):
+        """
+        Wait for the report to finish, polling its status with an increasing
+        delay between polls.
+
+        :calls: `GET /api/v1/accounts/:account_id/reports/:report/:id \
+        <https://canvas.instructure.com/doc/api/account_reports.html#method.account_reports.show>`_
+
+        :param timeout: The most seconds to wait, or None to wait for as long
+            as the report runs.
+        :type timeout: float
+        :param interval: The seconds to wait before the first poll.
+        :type interval: float
+        :param backoff: What the delay is multiplied by after each poll.
+        :type backoff: float
+        :param max_interval: The longest delay between two polls.
+        :type max_interval: float
+
+        :raises TimeoutError: If the report is still running after `timeout`.
+        :raises ReportFailed: If the report failed.
+        :rtype: :class:`canvasapi.account.AccountReport`
+        """
+        for _ in wait_for_jobs(
+            [self],
+            _report_finished,
+            _report_failure,
+            timeout=timeout,
+            interval=interval,
+            backoff=backoff,
+            max_interval=max_interval,
+            max_workers=1,
+            return_exceptions=False,
+        ):
+            pass
+        return self
+
+    def _attachment(self):
+        # The file holding the output of a complete report.
+        attachment = getattr(self, "attachment", None)
+        if not attachment:
+            raise CanvasException(
+                "Report {} has no file. Its status is {}.".format(
+                    getattr(self, "id", None), getattr(self, "status", None)
+                )
+            )
+        return File(self._requester, attachment)
+
 
 class Role(CanvasObject):
     def __str__(self):  # pragma: no cover
@@ -1892,3 +2154,57 @@ class SSOSettings(CanvasObject):
 class Admin(CanvasObject):
     def __str__(self):  # pragma: no cover
         return "{} {} ({})".format(self.user["name"], self.user["id"], self.id)
+
+
+class _ResponseStream(io.RawIOBase):
+    """
+    A readable stream over the body of a streamed response, so it can be
+    wrapped by :class:`io.BufferedReader` and :class:`io.TextIOWrapper`.
+    """
+
+    def __init__(self, response, chunk_size):
+        self._response = response
+        self._chunks = response.iter_content(chunk_size)
+        self._pending = b""
+
+    def close(self):
+        if not self.closed:
+            self._response.close()
+        super(_ResponseStream, self).close()
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        while not self._pending:
+            try:
+                self._pending = next(self._chunks)
+            except StopIteration:
+                return 0
+
+        size = min(len(buffer), len(self._pending))
+        buffer[:size] = self._pending[:size]
+        self._pending = self._pending[size:]
+        return size
+
+
+def _is_zip(attachment):
+    # Whether a report's file is a zip archive rather than a single CSV.
+    content_type = getattr(attachment, "content-type", None) or ""
+    name = getattr(attachment, "display_name", None) or ""
+    return content_type == "application/zip" or name.lower().endswith(".zip")
+
+
+def _read_csv(stream):
+    # Parse the rows of a binary CSV stream as it is read.
+    text = io.TextIOWrapper(stream, encoding="utf-8-sig", newline="")
+    yield from csv.DictReader(text)
+
+
+def _report_failure(report):
+    # The exception for a finished report, or None if it is complete.
+    return None if report.status == "complete" else ReportFailed(report)
+
+
+def _report_finished(report):
+    return getattr(report, "status", None) in AccountReport.FINISHED_STATES
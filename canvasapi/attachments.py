@@ -0,0 +1,190 @@
+import functools
+import os
+import posixpath
+import shutil
+import tempfile
+import zipfile
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from canvasapi.file import File
+from canvasapi.util import safe_filename
+
+
+def download_attachments(
+    submissions, destination, max_workers=4, include_history=False
+):
+    """
+    Download the attachments of many submissions at once.
+
+    Attachments are named after the assignment, user and attachment IDs, so
+    the same submissions always produce the same paths::
+
+        <assignment_id>/<user_id>/<attachment_id>-<display_name>
+
+    With `include_history`, every version of each submission is downloaded
+    and an `<attempt>` directory is added below the user ID.
+
+    When `destination` is a directory, each attachment is first written to a
+    `.part` file, which a later run resumes with an HTTP Range request, and
+    attachments that were already downloaded in full are skipped. When it is a
+    file-like object, a zip archive is streamed to it, and its entries are
+    written in the order the submissions are listed.
+
+    :param submissions: The submissions to download the attachments of.
+        Any iterable is accepted, such as a paginated list, and submissions are
+        only drawn from it as downloads finish.
+    :type submissions: iterable of :class:`canvasapi.submission.Submission`
+    :param destination: The directory to download to, or a writable binary
+        file-like object to stream a zip archive to.
+    :type destination: str, :class:`os.PathLike` or file
+    :param max_workers: The maximum number of attachments to download at once.
+    :type max_workers: int
+    :param include_history: Whether to download the attachments of every
+        version of each submission, which must have been listed with
+        `include=["submission_history"]`, rather than only the latest one.
+    :type include_history: bool
+
+    :returns: The paths of the attachments that were `"downloaded"` and, for
+        directories, that were `"skipped"` because they were already
+        complete, and a list of `(path, exception)` tuples for those that
+        `"failed"`. A zip archive leaves out the attachments that failed.
+    :rtype: dict
+    """
+    if max_workers < 1:
+        raise ValueError("max_workers must be at least 1.")
+
+    summary = {"downloaded": [], "skipped": [], "failed": []}
+    attachments = _list_attachments(submissions, include_history)
+
+    if isinstance(destination, (os.PathLike, str)):
+        archive = None
+        task = functools.partial(_download_to_directory, directory=destination)
+    else:
+        archive = zipfile.ZipFile(destination, "w")
+        task = _download_to_temporary_file
+
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    running = deque()
+
+    def start_next():
+        try:
+            attachment, path = next(attachments)
+        except StopIteration:
+            return False
+
+        running.append((path, executor.submit(task, attachment, path)))
+        return True
+
+    try:
+        # Keep the next few attachments downloading while the oldest one is
+        # waited on, so results can be handled in order.
+        while len(running) < max_workers * 2 and start_next():
+            pass
+
+        while running:
+            path, future = running.popleft()
+            error = future.exception()
+            if error is not None:
+                summary["failed"].append((path, error))
+            elif archive is not None:
+                with future.result() as temporary_file:
+                    with archive.open(path, "w", force_zip64=True) as entry:
+                        shutil.copyfileobj(temporary_file, entry)
+                summary["downloaded"].append(path)
+            else:
+                summary[future.result()].append(path)
+
+            start_next()
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+        for _, future in running:
+            future.add_done_callback(_close_result)
+        if archive is not None:
+            archive.close()
+
+    return summary
+
+
+def _close_result(future):
+    # Close the temporary file of a download whose result is never used.
+    if not future.cancelled() and future.exception() is None:
+        result = future.result()
+        if hasattr(result, "close"):
+            result.close()
+
+
+def _download_to_directory(attachment, path, directory):
+    """
+    Download `attachment` to `path` within `directory`, resuming an earlier
+    partial download if there is one.
+
+    :returns: `"skipped"` if the attachment was already downloaded in full,
+        `"downloaded"` otherwise.
+    :rtype: str
+    """
+    local_path = os.path.join(directory, *path.split("/"))
+    if os.path.isfile(local_path) and os.path.getsize(local_path) == getattr(
+        attachment, "size", None
+    ):
+        return "skipped"
+
+    os.makedirs(os.path.dirname(local_path), exist_ok=True)
+    attachment.download(local_path + ".part", resume=True)
+    os.replace(local_path + ".part", local_path)
+    return "downloaded"
+
+
+def _download_to_temporary_file(attachment, path):
+    """
+    Download `attachment` to a temporary file, which is rewound to the start.
+
+    :rtype: file
+    """
+    temporary_file = tempfile.TemporaryFile()
+    try:
+        attachment.download(temporary_file)
+        temporary_file.seek(0)
+    except BaseException:
+        temporary_file.close()
+        raise
+    return temporary_file
+
+
+def _list_attachments(submissions, include_history):
+    """
+    List the attachments of `submissions`, with the path each is saved to.
+
+    :returns: An iterator of `(file, path)` tuples.
+    :rtype: iterator
+    """
+    for submission in submissions:
+        base = posixpath.join(str(submission.assignment_id), str(submission.user_id))
+
+        if not include_history:
+            versions = [(base, submission.attachments)]
+        else:
+            versions = []
+            seen = set()
+            for version in getattr(submission, "submission_history", None) or []:
+                attempt = version.get("attempt")
+                if attempt in seen:
+                    continue
+                seen.add(attempt)
+                versions.append(
+                    (
+                        posixpath.join(base, str(attempt)),
+                        [
+                            File(submission._requester, attachment)
+                            for attachment in version.get("attachments") or []
+                        ],
+                    )
+                )
+
+        for directory, attachments in versions:
+            for attachment in attachments:
+                name = "{}-{}".format(
+                    attachment.id,
+                    safe_filename(getattr(attachment, "display_name", "") or ""),
+                )
+                yield attachment, posixpath.join(directory, name)
@@ -0,0 +1,205 @@
+import math
+import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+
+from canvasapi.exceptions import ProgressFailed, RequestEntityTooLarge
+from canvasapi.progress import wait_all
+from canvasapi.util import is_transient_error
+
+
+def run_in_chunks(
+    submit,
+    chunks,
+    max_workers=4,
+    retries=2,
+    timeout=None,
+    interval=1.0,
+    backoff=1.5,
+    max_interval=30.0,
+    split=None,
+):
+    """
+    Start an asynchronous job for each chunk of a large update, wait for all
+    of them, and retry the chunks that failed.
+
+    Up to `max_workers` chunks are submitted at once, and the resulting jobs
+    are waited on together with :func:`canvasapi.progress.wait_all`. A chunk
+    is retried, up to `retries` more times, if its job failed or submitting it
+    raised a transient error: a server error, a connection error or the rate
+    limit being hit. Each round of retries waits `interval` seconds,
+    multiplied by `backoff` for every earlier round. Other errors, such as a
+    bad request, aren't retried.
+
+    A chunk that Canvas rejects as too large is split with `split` and its
+    parts are submitted straight away. It fails if it can't be split.
+
+    :param submit: Called with a chunk to start its job.
+    :type submit: callable returning :class:`canvasapi.progress.Progress`
+    :param chunks: The chunks to submit.
+    :type chunks: iterable
+    :param max_workers: The maximum number of requests to make at once.
+    :type max_workers: int
+    :param retries: How many times to retry a chunk that failed.
+    :type retries: int
+    :param timeout: The most seconds to wait for each round of jobs, or None
+        to wait for as long as they run.
+    :type timeout: float
+    :param interval: The seconds to wait before polling the jobs, and before
+        the first round of retries.
+    :type interval: float
+    :param backoff: What the delays are multiplied by after each poll and
+        each round of retries.
+    :type backoff: float
+    :param max_interval: The longest delay between two polls.
+    :type max_interval: float
+    :param split: Called with a chunk that was too large to return smaller
+        chunks, or None if chunks can't be split.
+    :type split: callable
+
+    :raises TimeoutError: If any job is still running after `timeout`.
+    :returns: The jobs that `"completed"`, and a list of `(chunk, exception)`
+        tuples for the chunks that `"failed"` on their last attempt.
+    :rtype: dict
+    """
+    if max_workers < 1:
+        raise ValueError("max_workers must be at least 1.")
+
+    pending = list(chunks)
+    completed = []
+    failed = []
+
+    for attempt in range(retries + 1):
+        if attempt:
+            time.sleep(interval * backoff ** (attempt - 1))
+
+        retry = []
+        chunk_of = {}
+        progresses = []
+        while pending:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                started = list(
+                    executor.map(lambda chunk: _start(submit, chunk), pending)
+                )
+
+            smaller = []
+            for chunk, (progress, error) in zip(pending, started):
+                if error is None:
+                    chunk_of[id(progress)] = chunk
+                    progresses.append(progress)
+                elif isinstance(error, RequestEntityTooLarge):
+                    parts = split(chunk) if split is not None else []
+                    if len(parts) > 1:
+                        smaller.extend(parts)
+                    else:
+                        failed.append((chunk, error))
+                elif is_transient_error(error):
+                    retry.append((chunk, error))
+                else:
+                    failed.append((chunk, error))
+            pending = smaller
+
+        for result in wait_all(
+            progresses,
+            timeout=timeout,
+            interval=interval,
+            backoff=backoff,
+            max_interval=max_interval,
+            max_workers=max_workers,
+            return_exceptions=True,
+        ):
+            if isinstance(result, ProgressFailed):
+                retry.append((chunk_of[id(result.progress)], result))
+            else:
+                completed.append(result)
+
+        if not retry:
+            break
+        if attempt == retries:
+            failed.extend(retry)
+        pending = [chunk for chunk, _ in retry]
+
+    return {"completed": completed, "failed": failed}
+
+
+def halve_grade_data(grade_data, by_assignment=True):
+    """
+    Split the `grade_data` of a bulk submissions update in two halves that
+    differ in size by no more than one grade.
+
+    :param grade_data: Grades keyed by assignment, then by student, or only by
+        student when `by_assignment` is False.
+    :type grade_data: dict
+    :param by_assignment: Whether `grade_data` is keyed by assignment first.
+    :type by_assignment: bool
+    :returns: Two chunks, or one if `grade_data` holds a single grade.
+    :rtype: list of dict
+    """
+    if by_assignment:
+        count = sum(len(students) for students in grade_data.values())
+    else:
+        count = len(grade_data)
+    return split_grade_data(grade_data, max(1, math.ceil(count / 2)), by_assignment)
+
+
+def split_evenly(items, chunk_size):
+    """
+    Split `items` into the fewest lists of at most `chunk_size` items, with
+    sizes that differ by no more than one.
+
+    :param items: The items to split.
+    :type items: list
+    :param chunk_size: The most items in a list.
+    :type chunk_size: int
+    :rtype: list of list
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1.")
+
+    count = math.ceil(len(items) / chunk_size)
+    iterator = iter(items)
+    return [
+        list(islice(iterator, len(items) // count + (index < len(items) % count)))
+        for index in range(count)
+    ]
+
+
+def split_grade_data(grade_data, chunk_size, by_assignment=True):
+    """
+    Split the `grade_data` of a bulk submissions update into smaller ones of
+    at most `chunk_size` grades each.
+
+    :param grade_data: Grades keyed by assignment, then by student, or only by
+        student when `by_assignment` is False.
+    :type grade_data: dict
+    :param chunk_size: The most grades in a chunk.
+    :type chunk_size: int
+    :param by_assignment: Whether `grade_data` is keyed by assignment first.
+    :type by_assignment: bool
+    :rtype: list of dict
+    """
+    if not by_assignment:
+        return [
+            dict(chunk) for chunk in split_evenly(list(grade_data.items()), chunk_size)
+        ]
+
+    entries = [
+        (assignment, student, data)
+        for assignment, students in grade_data.items()
+        for student, data in students.items()
+    ]
+    chunks = []
+    for chunk in split_evenly(entries, chunk_size):
+        grades = {}
+        for assignment, student, data in chunk:
+            grades.setdefault(assignment, {})[student] = data
+        chunks.append(grades)
+    return chunks
+
+
+def _start(submit, chunk):
+    # Submit a chunk, returning its job and None, or None and the exception.
+    try:
+        return submit(chunk), None
+    except Exception as error:
+        return None, error
@@ -1,30 +1,8 @@
 import warnings
 
-from canvasapi.account import Account
-from canvasapi.account_calendar import AccountCalendar
-from canvasapi.appointment_group import AppointmentGroup
-from canvasapi.calendar_event import CalendarEvent
-from canvasapi.comm_message import CommMessage
-from canvasapi.conversation import Conversation
-from canvasapi.course import Course, CourseNickname
-from canvasapi.course_epub_export import CourseEpubExport
-from canvasapi.current_user import CurrentUser
-from canvasapi.discussion_topic import DiscussionTopic
-from canvasapi.eportfolio import EPortfolio
 from canvasapi.exceptions import RequiredFieldMissing
-from canvasapi.file import File
-from canvasapi.folder import Folder
-from canvasapi.group import Group, GroupCategory
-from canvasapi.jwt import JWT
-from canvasapi.outcome import Outcome, OutcomeGroup
 from canvasapi.paginated_list import PaginatedList
-from canvasapi.planner import PlannerNote, PlannerOverride
-from canvasapi.poll import Poll
-from canvasapi.progress import Progress
 from canvasapi.requester import Requester
-from canvasapi.section import Section
-from canvasapi.todo import Todo
-from canvasapi.user import User
 from canvasapi.util import combine_kwargs, get_institution_url, obj_or_id
 
 
@@ -33,12 +11,29 @@ class Canvas(object):
     The main class to be instantiated to provide access to Canvas's API.
     """
 
-    def __init__(self, base_url, access_token):
+    def __init__(
+        self, base_url, access_token, compact_objects=False, identity_map=False
+    ):
         """
         :param base_url: The base URL of the Canvas instance's API.
         :type base_url: str
         :param access_token: The API key to authenticate requests with.
         :type access_token: str
+        :param compact_objects: If True, objects keep the values of their
+            fields in a tuple, with short strings interned, and look attributes
+            up through a mapping of field name to position that is shared by
+            every object with the same fields, rather than copying every field
+            onto the instance. This roughly halves the memory used by large
+            result sets.
+        :type compact_objects: bool
+        :param identity_map: If True, building an object with the same class
+            and id as one still in use returns that object, updated with the
+            new data, instead of a copy. Entities repeated across many
+            responses then share a single object. Only weak references are
+            kept, so objects are freed as usual once nothing else uses them.
+            This applies to the resources whose ids are unique across Canvas,
+            such as courses, users, assignments, submissions and files.
+        :type identity_map: bool
         """
         if "api/v1" in base_url:
             raise ValueError(
@@ -70,7 +65,45 @@ class Canvas(object):
         access_token = access_token.strip()
         base_url = get_institution_url(base_url)
 
-        self.__requester = Requester(base_url, access_token)
+        self.__requester = Requester(
+            base_url,
+            access_token,
+            compact_objects=compact_objects,
+            identity_map=identity_map,
+        )
+
+    def account(self, account, use_sis_id=False, **kwargs):
+        """
+        Return an account holding only its ID, without making a request.
+
+        The rest of the account is retrieved the first time an attribute it
+        doesn't have yet is accessed, so calls that only need its ID, such as
+        :func:`canvasapi.account.Account.get_users`, don't need to retrieve it first.
+
+        :calls: `GET /api/v1/accounts/:id \
+        <https://canvas.instructure.com/doc/api/accounts.html#method.accounts.show>`_
+
+        :param account: The object or ID of the account.
+        :type account: int, str or :class:`canvasapi.account.Account`
+        :param use_sis_id: Whether or not account_id is an sis ID.
+            Defaults to `False`.
+        :type use_sis_id: bool
+
+        :rtype: :class:`canvasapi.account.Account`
+        """
+        from canvasapi.account import Account
+
+        if use_sis_id:
+            account_id = "sis_account_id:{}".format(account)
+        else:
+            account_id = obj_or_id(account, "account", (Account,))
+
+        return Account._stub(
+            self.__requester,
+            account_id,
+            "accounts/{}".format(account_id),
+            _kwargs=combine_kwargs(**kwargs),
+        )
 
     def clear_course_nicknames(self, **kwargs):
         """
@@ -103,21 +136,9 @@ class Canvas(object):
         :type event: `str`
         :rtype: :class:`canvasapi.progress.Progress`
         """
-        ALLOWED_EVENTS = [
-            "mark_as_read",
-            "mark_as_unread",
-            "star",
-            "unstar",
-            "archive",
-            "destroy",
-        ]
+        from canvasapi.progress import Progress
 
-        if event not in ALLOWED_EVENTS:
-            raise ValueError(
-                "{} is not a valid action. Please use one of the following: {}".format(
-                    event, ",".join(ALLOWED_EVENTS)
-                )
-            )
+        _check_conversation_event(event)
 
         if len(conversation_ids) > 500:
             raise ValueError(
@@ -137,6 +158,72 @@ class Canvas(object):
         return_progress = Progress(self.__requester, response.json())
         return return_progress
 
+    def conversations_batch_update_chunked(
+        self,
+        conversation_ids,
+        event,
+        chunk_size=500,
+        max_workers=4,
+        retries=2,
+        timeout=None,
+        **kwargs,
+    ):
+        """
+        Update any number of conversations, working around the limit of 500
+        conversations per batch update.
+
+        The conversations are split into evenly sized chunks of at most
+        `chunk_size`, which are submitted concurrently with
+        :meth:`conversations_batch_update`. See
+        :func:`canvasapi.batch.run_in_chunks` for how the jobs are waited on
+        and retried. A chunk that Canvas rejects as too large is split in half
+        and submitted again.
+
+        :calls: `PUT /api/v1/conversations \
+        <https://canvas.instructure.com/doc/api/conversations.html#method.conversations.batch_update>`_
+
+        :param conversation_ids: The conversations to update, such as the
+            paginated list returned by :meth:`get_conversations`.
+        :type conversation_ids: iterable of int, str or
+            :class:`canvasapi.conversation.Conversation`
+        :param event: The action to take on each conversation.
+        :type event: `str`
+        :param chunk_size: The most conversations to update in one request.
+        :type chunk_size: int
+        :param max_workers: The maximum number of requests to make at once.
+        :type max_workers: int
+        :param retries: How many times to retry a chunk that failed.
+        :type retries: int
+        :param timeout: The most seconds to wait for each round of jobs, or
+            None to wait for as long as they run.
+        :type timeout: float
+
+        :raises TimeoutError: If any job is still running after `timeout`.
+        :returns: The jobs that `"completed"`, and a list of `(chunk, exception)`
+            tuples for the chunks of conversation IDs that `"failed"`.
+        :rtype: dict
+        """
+        from canvasapi.batch import run_in_chunks, split_evenly
+        from canvasapi.conversation import Conversation
+
+        _check_conversation_event(event)
+        if chunk_size > 500:
+            raise ValueError("chunk_size must be at most 500.")
+
+        ids = [
+            obj_or_id(conversation, "conversation_ids", (Conversation,))
+            for conversation in conversation_ids
+        ]
+
+        return run_in_chunks(
+            lambda chunk: self.conversations_batch_update(chunk, event, **kwargs),
+            split_evenly(ids, chunk_size),
+            max_workers=max_workers,
+            retries=retries,
+            timeout=timeout,
+            split=lambda chunk: split_evenly(chunk, (len(chunk) + 1) // 2),
+        )
+
     def conversations_get_running_batches(self, **kwargs):
         """
         Returns any currently running conversation batches for the current user.
@@ -186,6 +273,39 @@ class Canvas(object):
 
         return response.json()
 
+    def course(self, course, use_sis_id=False, **kwargs):
+        """
+        Return a course holding only its ID, without making a request.
+
+        The rest of the course is retrieved the first time an attribute it
+        doesn't have yet is accessed, so calls that only need its ID, such as
+        :func:`canvasapi.course.Course.get_assignments`, don't need to retrieve it first.
+
+        :calls: `GET /api/v1/courses/:id \
+        <https://canvas.instructure.com/doc/api/courses.html#method.courses.show>`_
+
+        :param course: The object or ID of the course.
+        :type course: int, str or :class:`canvasapi.course.Course`
+        :param use_sis_id: Whether or not course_id is an sis ID.
+            Defaults to `False`.
+        :type use_sis_id: bool
+
+        :rtype: :class:`canvasapi.course.Course`
+        """
+        from canvasapi.course import Course
+
+        if use_sis_id:
+            course_id = "sis_course_id:{}".format(course)
+        else:
+            course_id = obj_or_id(course, "course", (Course,))
+
+        return Course._stub(
+            self.__requester,
+            course_id,
+            "courses/{}".format(course_id),
+            _kwargs=combine_kwargs(**kwargs),
+        )
+
     def create_account(self, **kwargs):
         """
         Create a new root account.
@@ -195,6 +315,8 @@ class Canvas(object):
 
         :rtype: :class:`canvasapi.account.Account`
         """
+        from canvasapi.account import Account
+
         response = self.__requester.request(
             "POST", "accounts", _kwargs=combine_kwargs(**kwargs)
         )
@@ -213,6 +335,8 @@ class Canvas(object):
         :type title: `str`
         :rtype: :class:`canvasapi.appointment_group.AppointmentGroup`
         """
+        from canvasapi.appointment_group import AppointmentGroup
+
         if (
             isinstance(appointment_group, dict)
             and "context_codes" in appointment_group
@@ -248,6 +372,8 @@ class Canvas(object):
         :type calendar_event: `dict`
         :rtype: :class:`canvasapi.calendar_event.CalendarEvent`
         """
+        from canvasapi.calendar_event import CalendarEvent
+
         if isinstance(calendar_event, dict) and "context_code" in calendar_event:
             kwargs["calendar_event"] = calendar_event
         else:
@@ -277,6 +403,8 @@ class Canvas(object):
         :type body: `str`
         :rtype: list of :class:`canvasapi.conversation.Conversation`
         """
+        from canvasapi.conversation import Conversation
+
         kwargs["recipients"] = recipients
         kwargs["body"] = body
 
@@ -294,6 +422,8 @@ class Canvas(object):
 
         :rtype: :class:`canvasapi.group.Group`
         """
+        from canvasapi.group import Group
+
         response = self.__requester.request(
             "POST", "groups", _kwargs=combine_kwargs(**kwargs)
         )
@@ -308,6 +438,8 @@ class Canvas(object):
 
         :rtype: list of :class:`canvasapi.jwt.JWT`
         """
+        from canvasapi.jwt import JWT
+
         response = self.__requester.request(
             "POST", "jwts", _kwargs=combine_kwargs(**kwargs)
         )
@@ -323,6 +455,8 @@ class Canvas(object):
 
         :rtype: :class:`canvasapi.planner.PlannerNote`
         """
+        from canvasapi.planner import PlannerNote
+
         response = self.__requester.request(
             "POST", "planner_notes", _kwargs=combine_kwargs(**kwargs)
         )
@@ -343,6 +477,8 @@ class Canvas(object):
 
         :rtype: :class:`canvasapi.planner.PlannerOverride`
         """
+        from canvasapi.planner import PlannerOverride
+
         if isinstance(plannable_type, str):
             kwargs["plannable_type"] = plannable_type
         else:
@@ -368,6 +504,8 @@ class Canvas(object):
         :type polls: list of dict
         :rtype: :class:`canvasapi.poll.Poll`
         """
+        from canvasapi.poll import Poll
+
         if (
             isinstance(polls, list)
             and isinstance(polls[0], dict)
@@ -399,6 +537,8 @@ class Canvas(object):
 
         :rtype: :class:`canvasapi.account.Account`
         """
+        from canvasapi.account import Account
+
         if use_sis_id:
             account_id = account
             uri_str = "accounts/sis_account_id:{}"
@@ -421,6 +561,8 @@ class Canvas(object):
         :rtype: :class:`canvasapi.paginated_list.PaginatedList` of
             :class:`canvasapi.account_calendar.AccountCalendar`
         """
+        from canvasapi.account_calendar import AccountCalendar
+
         return PaginatedList(
             AccountCalendar,
             self.__requester,
@@ -443,6 +585,8 @@ class Canvas(object):
         :rtype: :class:`canvasapi.paginated_list.PaginatedList` of
             :class:`canvasapi.account.Account`
         """
+        from canvasapi.account import Account
+
         return PaginatedList(
             Account,
             self.__requester,
@@ -480,6 +624,9 @@ class Canvas(object):
         :rtype: :class:`canvasapi.paginated_list.PaginatedList` of
                 :class:`canvasapi.discussion_topic.DiscussionTopic`
         """
+        from canvasapi.course import Course
+        from canvasapi.discussion_topic import DiscussionTopic
+
         if type(context_codes) is not list or len(context_codes) == 0:
             raise RequiredFieldMissing("context_codes need to be passed as a list")
 
@@ -519,6 +666,8 @@ class Canvas(object):
 
         :rtype: :class:`canvasapi.appointment_group.AppointmentGroup`
         """
+        from canvasapi.appointment_group import AppointmentGroup
+
         appointment_group_id = obj_or_id(
             appointment_group, "appointment_group", (AppointmentGroup,)
         )
@@ -540,6 +689,8 @@ class Canvas(object):
         :rtype: :class:`canvasapi.paginated_list.PaginatedList` of
             :class:`canvasapi.appointment_group.AppointmentGroup`
         """
+        from canvasapi.appointment_group import AppointmentGroup
+
         return PaginatedList(
             AppointmentGroup,
             self.__requester,
@@ -575,6 +726,8 @@ class Canvas(object):
 
         :rtype: :class:`canvasapi.calendar_event.CalendarEvent`
         """
+        from canvasapi.calendar_event import CalendarEvent
+
         calendar_event_id = obj_or_id(
             calendar_event, "calendar_event", (CalendarEvent,)
         )
@@ -596,6 +749,8 @@ class Canvas(object):
         :rtype: :class:`canvasapi.paginated_list.PaginatedList` of
             :class:`canvasapi.calendar_event.CalendarEvent`
         """
+        from canvasapi.calendar_event import CalendarEvent
+
         return PaginatedList(
             CalendarEvent,
             self.__requester,
@@ -619,6 +774,8 @@ class Canvas(object):
             :class:`canvasapi.comm_message.CommMessage`
 
         """
+        from canvasapi.comm_message import CommMessage
+        from canvasapi.user import User
 
         kwargs["user_id"] = obj_or_id(user, "user", (User,))
 
@@ -642,6 +799,8 @@ class Canvas(object):
 
         :rtype: :class:`canvasapi.conversation.Conversation`
         """
+        from canvasapi.conversation import Conversation
+
         conversation_id = obj_or_id(conversation, "conversation", (Conversation,))
 
         response = self.__requester.request(
@@ -661,6 +820,8 @@ class Canvas(object):
         :rtype: :class:`canvasapi.paginated_list.PaginatedList` of \
         :class:`canvasapi.conversation.Conversation`
         """
+        from canvasapi.conversation import Conversation
+
         return PaginatedList(
             Conversation,
             self.__requester,
@@ -684,6 +845,8 @@ class Canvas(object):
 
         :rtype: :class:`canvasapi.course.Course`
         """
+        from canvasapi.course import Course
+
         if use_sis_id:
             course_id = course
             uri_str = "courses/sis_course_id:{}"
@@ -710,6 +873,8 @@ class Canvas(object):
         :rtype: :class:`canvasapi.paginated_list.PaginatedList` of
             :class:`canvasapi.account.Account`
         """
+        from canvasapi.account import Account
+
         return PaginatedList(
             Account,
             self.__requester,
@@ -730,6 +895,8 @@ class Canvas(object):
 
         :rtype: :class:`canvasapi.course.CourseNickname`
         """
+        from canvasapi.course import Course, CourseNickname
+
         course_id = obj_or_id(course, "course", (Course,))
 
         response = self.__requester.request(
@@ -749,6 +916,8 @@ class Canvas(object):
         :rtype: :class:`canvasapi.paginated_list.PaginatedList` of
             :class:`canvasapi.course.CourseNickname`
         """
+        from canvasapi.course import CourseNickname
+
         return PaginatedList(
             CourseNickname,
             self.__requester,
@@ -767,6 +936,8 @@ class Canvas(object):
         :rtype: :class:`canvasapi.paginated_list.PaginatedList` of
             :class:`canvasapi.course.Course`
         """
+        from canvasapi.course import Course
+
         return PaginatedList(
             Course, self.__requester, "GET", "courses", _kwargs=combine_kwargs(**kwargs)
         )
@@ -780,6 +951,8 @@ class Canvas(object):
 
         :rtype: :class:`canvasapi.current_user.CurrentUser`
         """
+        from canvasapi.current_user import CurrentUser
+
         return CurrentUser(self.__requester)
 
     def get_eportfolio(self, eportfolio, **kwargs):
@@ -794,6 +967,8 @@ class Canvas(object):
 
         :rtype: :class:`canvasapi.eportfolio.EPortfolio`
         """
+        from canvasapi.eportfolio import EPortfolio
+
         eportfolio_id = obj_or_id(eportfolio, "eportfolio", (EPortfolio,))
         response = self.__requester.request(
             "GET",
@@ -813,6 +988,7 @@ class Canvas(object):
         :rtype: :class:`canvasapi.paginated_list.PaginatedList` of
             :class:`canvasapi.course_epub_export.CourseEpubExport`
         """
+        from canvasapi.course_epub_export import CourseEpubExport
 
         return PaginatedList(
             CourseEpubExport,
@@ -835,6 +1011,8 @@ class Canvas(object):
 
         :rtype: :class:`canvasapi.file.File`
         """
+        from canvasapi.file import File
+
         file_id = obj_or_id(file, "file", (File,))
 
         response = self.__requester.request(
@@ -854,6 +1032,8 @@ class Canvas(object):
 
         :rtype: :class:`canvasapi.folder.Folder`
         """
+        from canvasapi.folder import Folder
+
         folder_id = obj_or_id(folder, "folder", (Folder,))
 
         response = self.__requester.request(
@@ -878,6 +1058,7 @@ class Canvas(object):
 
         :rtype: :class:`canvasapi.group.Group`
         """
+        from canvasapi.group import Group
 
         if use_sis_id:
             group_id = group
@@ -903,6 +1084,8 @@ class Canvas(object):
 
         :rtype: :class:`canvasapi.group.GroupCategory`
         """
+        from canvasapi.group import GroupCategory
+
         category_id = obj_or_id(category, "category", (GroupCategory,))
 
         response = self.__requester.request(
@@ -924,6 +1107,9 @@ class Canvas(object):
 
         :rtype: :class:`canvasapi.paginated_list.PaginatedList` of :class:`canvasapi.group.Group`
         """
+        from canvasapi.appointment_group import AppointmentGroup
+        from canvasapi.group import Group
+
         appointment_group_id = obj_or_id(
             appointment_group, "appointment_group", (AppointmentGroup,)
         )
@@ -949,6 +1135,8 @@ class Canvas(object):
         :returns: An Outcome object.
         :rtype: :class:`canvasapi.outcome.Outcome`
         """
+        from canvasapi.outcome import Outcome
+
         outcome_id = obj_or_id(outcome, "outcome", (Outcome,))
         response = self.__requester.request(
             "GET", "outcomes/{}".format(outcome_id), _kwargs=combine_kwargs(**kwargs)
@@ -968,6 +1156,8 @@ class Canvas(object):
         :returns: An outcome group object.
         :rtype: :class:`canvasapi.outcome.OutcomeGroup`
         """
+        from canvasapi.outcome import OutcomeGroup
+
         outcome_group_id = obj_or_id(group, "group", (OutcomeGroup,))
 
         response = self.__requester.request(
@@ -990,6 +1180,8 @@ class Canvas(object):
 
         :rtype: :class:`canvasapi.planner.PlannerNote`
         """
+        from canvasapi.planner import PlannerNote
+
         if isinstance(planner_note, int) or isinstance(planner_note, PlannerNote):
             planner_note_id = obj_or_id(planner_note, "planner_note", (PlannerNote,))
         else:
@@ -1015,6 +1207,8 @@ class Canvas(object):
         :rtype: :class:`canvasapi.paginated_list.PaginatedList` of
             :class:`canvasapi.planner.PlannerNote`
         """
+        from canvasapi.planner import PlannerNote
+
         return PaginatedList(
             PlannerNote,
             self.__requester,
@@ -1035,6 +1229,8 @@ class Canvas(object):
 
         :rtype: :class:`canvasapi.planner.PlannerOverride`
         """
+        from canvasapi.planner import PlannerOverride
+
         if isinstance(planner_override, int) or isinstance(
             planner_override, PlannerOverride
         ):
@@ -1064,6 +1260,8 @@ class Canvas(object):
         :rtype: :class:`canvasapi.paginated_list.PaginatedList` of
             :class:`canvasapi.planner.PlannerOverride`
         """
+        from canvasapi.planner import PlannerOverride
+
         return PaginatedList(
             PlannerOverride,
             self.__requester,
@@ -1083,6 +1281,8 @@ class Canvas(object):
         :type poll: int
         :rtype: :class:`canvasapi.poll.Poll`
         """
+        from canvasapi.poll import Poll
+
         poll_id = obj_or_id(poll, "poll", (Poll,))
 
         response = self.__requester.request(
@@ -1100,6 +1300,8 @@ class Canvas(object):
         :rtype: :class:`canvasapi.paginated_list.PaginatedList` of
             :class:`canvasapi.poll.Poll`
         """
+        from canvasapi.poll import Poll
+
         return PaginatedList(
             Poll,
             self.__requester,
@@ -1121,6 +1323,8 @@ class Canvas(object):
 
         :rtype: :class:`canvasapi.progress.Progress`
         """
+        from canvasapi.progress import Progress
+
         progress_id = obj_or_id(progress, "progress", (Progress,))
 
         response = self.__requester.request(
@@ -1138,6 +1342,8 @@ class Canvas(object):
         :returns: The OutcomeGroup of the context.
         :rtype: :class:`canvasapi.outcome.OutcomeGroup`
         """
+        from canvasapi.outcome import OutcomeGroup
+
         response = self.__requester.request(
             "GET", "global/root_outcome_group", _kwargs=combine_kwargs(**kwargs)
         )
@@ -1158,6 +1364,8 @@ class Canvas(object):
 
         :rtype: :class:`canvasapi.section.Section`
         """
+        from canvasapi.section import Section
+
         if use_sis_id:
             section_id = section
             uri_str = "sections/sis_section_id:{}"
@@ -1179,6 +1387,8 @@ class Canvas(object):
 
         :rtype: dict
         """
+        from canvasapi.todo import Todo
+
         return PaginatedList(
             Todo,
             self.__requester,
@@ -1221,6 +1431,8 @@ class Canvas(object):
 
         :rtype: :class:`canvasapi.user.User`
         """
+        from canvasapi.user import User
+
         if id_type:
             uri = "users/{}:{}".format(id_type, user)
         elif user == "self":
@@ -1246,6 +1458,9 @@ class Canvas(object):
 
         :rtype: :class:`canvasapi.paginated_list.PaginatedList` of :class:`canvasapi.user.User`
         """
+        from canvasapi.appointment_group import AppointmentGroup
+        from canvasapi.user import User
+
         appointment_group_id = obj_or_id(
             appointment_group, "appointment_group", (AppointmentGroup,)
         )
@@ -1287,6 +1502,39 @@ class Canvas(object):
 
         return response.json()
 
+    def group(self, group, use_sis_id=False, **kwargs):
+        """
+        Return a group holding only its ID, without making a request.
+
+        The rest of the group is retrieved the first time an attribute it
+        doesn't have yet is accessed, so calls that only need its ID, such as
+        :func:`canvasapi.group.Group.get_users`, don't need to retrieve it first.
+
+        :calls: `GET /api/v1/groups/:id \
+        <https://canvas.instructure.com/doc/api/groups.html#method.groups.show>`_
+
+        :param group: The object or ID of the group.
+        :type group: int, str or :class:`canvasapi.group.Group`
+        :param use_sis_id: Whether or not group_id is an sis ID.
+            Defaults to `False`.
+        :type use_sis_id: bool
+
+        :rtype: :class:`canvasapi.group.Group`
+        """
+        from canvasapi.group import Group
+
+        if use_sis_id:
+            group_id = "sis_group_id:{}".format(group)
+        else:
+            group_id = obj_or_id(group, "group", (Group,))
+
+        return Group._stub(
+            self.__requester,
+            group_id,
+            "groups/{}".format(group_id),
+            _kwargs=combine_kwargs(**kwargs),
+        )
+
     def refresh_jwt(self, jwt, **kwargs):
         """
         Refreshes a JWT for reuse with other canvas services. It generates a
@@ -1299,6 +1547,8 @@ class Canvas(object):
         :type jwt: str or :class:`canvasapi.jwt.JWT`
         :rtype: :class:`canvasapi.jwt.JWT`
         """
+        from canvasapi.jwt import JWT
+
         if isinstance(jwt, JWT):
             jwt = jwt.token
 
@@ -1323,6 +1573,8 @@ class Canvas(object):
 
         :rtype: :class:`canvasapi.calendar_event.CalendarEvent`
         """
+        from canvasapi.calendar_event import CalendarEvent
+
         calendar_event_id = obj_or_id(
             calendar_event, "calendar_event", (CalendarEvent,)
         )
@@ -1388,6 +1640,39 @@ class Canvas(object):
         )
         return response.json()
 
+    def section(self, section, use_sis_id=False, **kwargs):
+        """
+        Return a section holding only its ID, without making a request.
+
+        The rest of the section is retrieved the first time an attribute it
+        doesn't have yet is accessed, so calls that only need its ID, such as
+        :func:`canvasapi.section.Section.get_enrollments`, don't need to retrieve it first.
+
+        :calls: `GET /api/v1/sections/:id \
+        <https://canvas.instructure.com/doc/api/sections.html#method.sections.show>`_
+
+        :param section: The object or ID of the section.
+        :type section: int, str or :class:`canvasapi.section.Section`
+        :param use_sis_id: Whether or not section_id is an sis ID.
+            Defaults to `False`.
+        :type use_sis_id: bool
+
+        :rtype: :class:`canvasapi.section.Section`
+        """
+        from canvasapi.section import Section
+
+        if use_sis_id:
+            section_id = "sis_section_id:{}".format(section)
+        else:
+            section_id = obj_or_id(section, "section", (Section,))
+
+        return Section._stub(
+            self.__requester,
+            section_id,
+            "sections/{}".format(section_id),
+            _kwargs=combine_kwargs(**kwargs),
+        )
+
     def set_course_nickname(self, course, nickname, **kwargs):
         """
         Set a nickname for the given course. This will replace the
@@ -1404,6 +1689,8 @@ class Canvas(object):
 
         :rtype: :class:`canvasapi.course.CourseNickname`
         """
+        from canvasapi.course import Course, CourseNickname
+
         course_id = obj_or_id(course, "course", (Course,))
 
         kwargs["nickname"] = nickname
@@ -1414,3 +1701,57 @@ class Canvas(object):
             _kwargs=combine_kwargs(**kwargs),
         )
         return CourseNickname(self.__requester, response.json())
+
+    def user(self, user, id_type=None, **kwargs):
+        """
+        Return a user holding only their ID, without making a request.
+
+        The rest of the user is retrieved the first time an attribute they
+        don't have yet is accessed, so calls that only need their ID, such as
+        :func:`canvasapi.user.User.get_courses`, don't need to retrieve them
+        first.
+
+        :calls: `GET /api/v1/users/:id \
+        <https://canvas.instructure.com/doc/api/users.html#method.users.api_show>`_
+
+        :param user: The user's object or ID, or "self".
+        :type user: :class:`canvasapi.user.User`, int or str
+        :param id_type: The ID type, as in
+            :func:`canvasapi.canvas.Canvas.get_user`.
+        :type id_type: str
+
+        :rtype: :class:`canvasapi.user.User`
+        """
+        from canvasapi.user import User
+
+        if id_type:
+            user_id = "{}:{}".format(id_type, user)
+        elif user == "self":
+            user_id = user
+        else:
+            user_id = obj_or_id(user, "user", (User,))
+
+        return User._stub(
+            self.__requester,
+            user_id,
+            "users/{}".format(user_id),
+            _kwargs=combine_kwargs(**kwargs),
+        )
+
+
+def _check_conversation_event(event):
+    allowed_events = [
+        "mark_as_read",
+        "mark_as_unread",
+        "star",
+        "unstar",
+        "archive",
+        "destroy",
+    ]
+
+    if event not in allowed_events:
+        raise ValueError(
+            "{} is not a valid action. Please use one of the following: {}".format(
+                event, ",".join(allowed_events)
+            )
+        )
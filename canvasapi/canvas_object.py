@@ -1,5 +1,109 @@
-import arrow
-import pytz
+import copy
+import importlib
+import re
+import sys
+from datetime import datetime, timezone
+
+# A cheap check that a value looks like an ISO 8601 date or datetime before
+# trying to parse it.
+_DATE_SHAPE = re.compile(r"\d{4}-\d{2}-\d{2}(?:[T ]|$)")
+
+# The timestamp formats Canvas emits, all of which `datetime.fromisoformat`
+# can parse on every supported Python version.
+_ISO_8601 = re.compile(
+    r"\d{4}-\d{2}-\d{2}"
+    r"(?:[T ]\d{2}:\d{2}(?::\d{2}(?:\.\d{3}(?:\d{3})?)?)?(?:Z|[+-]\d{2}:\d{2})?)?$"
+)
+
+
+# Attributes used by `CanvasObject` itself rather than holding fields.
+_INTERNAL_ATTRIBUTES = frozenset(
+    ("_layout", "_loader", "_parsed_dates", "_requester", "_values")
+)
+
+# Key layouts shared by every compact object built from the same set of fields.
+_LAYOUTS = {}
+
+# The most layouts kept in `_LAYOUTS`. Objects with fields beyond that many
+# distinct sets still work, but get a layout of their own.
+_MAX_LAYOUTS = 1024
+
+# Strings up to this length are interned in compact objects. Short values such
+# as states, types and timestamps tend to repeat across many objects.
+_INTERN_MAX_LENGTH = 64
+
+
+def _compact_value(value):
+    if type(value) is str and len(value) <= _INTERN_MAX_LENGTH:
+        return sys.intern(value)
+    return value
+
+
+def _shared_layout(keys):
+    """
+    Return the mapping of field name to position for a tuple of field names,
+    shared between all compact objects with the same fields.
+
+    :param keys: The field names, in order.
+    :type keys: tuple
+    :rtype: dict
+    """
+    layout = _LAYOUTS.get(keys)
+    if layout is None:
+        layout = {key: index for index, key in enumerate(keys)}
+        if len(_LAYOUTS) < _MAX_LAYOUTS:
+            layout = _LAYOUTS.setdefault(keys, layout)
+    return layout
+
+
+def _is_json_list(value):
+    # Whether `value` is a list of JSON objects that has yet to be built into
+    # child objects.
+    return isinstance(value, list) and bool(value) and isinstance(value[0], dict)
+
+
+def _parse_date(value):
+    """
+    Parse an ISO 8601 string into a datetime in UTC.
+
+    Common Canvas timestamps are handled by `datetime.fromisoformat`. Any other
+    string that looks like a date, or one `fromisoformat` rejects, falls back
+    to `arrow`, which is only imported when such a value is seen.
+
+    :param value: The string to parse.
+    :type value: str
+    :returns: The parsed datetime, or None if `value` is not a valid date.
+    :rtype: :class:`datetime.datetime`
+    """
+    parsed = None
+    if _ISO_8601.match(value):
+        try:
+            parsed = datetime.fromisoformat(
+                value[:-1] + "+00:00" if value.endswith("Z") else value
+            )
+        except ValueError:
+            # Values such as a 24:00 end of day are still accepted by `arrow`.
+            pass
+
+    if parsed is None:
+        if not _DATE_SHAPE.match(value):
+            return None
+
+        import arrow
+
+        try:
+            parsed = arrow.get(value).datetime
+        except (arrow.ParserError, ValueError):
+            return None
+
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc)
+
+    # Dates have always been returned with pytz's UTC as their tzinfo, so keep
+    # doing so.
+    import pytz
+
+    return parsed.replace(tzinfo=pytz.utc)
 
 
 class CanvasObject(object):
@@ -8,10 +112,90 @@ class CanvasObject(object):
 
     This makes a call to :func:`canvasapi.canvas_object.CanvasObject.set_attributes`
     to dynamically construct this object's attributes with a JSON object.
+
+    Subclasses may also describe the fields they expect, so that less has to be
+    worked out for every instance. `TIMESTAMP_FIELDS` lists fields holding an
+    ISO 8601 timestamp, whose `*_date` attribute is then parsed directly.
+    `ID_FIELDS` lists fields that never hold a date. Nested objects are
+    declared with :class:`NestedList`. Fields that aren't described are still
+    accepted and handled dynamically.
+
+    Subclasses whose ids are unique across the whole Canvas instance, rather
+    than only within a parent object, set `IDENTITY_MAPPED` so that their
+    objects are shared when the requester has an identity map.
     """
 
-    def __getattribute__(self, name):
-        return super(CanvasObject, self).__getattribute__(name)
+    IDENTITY_MAPPED = False
+    ID_FIELDS = ()
+    TIMESTAMP_FIELDS = ()
+
+    # Maps described fields to whether they hold a timestamp. Built for each
+    # subclass from its `ID_FIELDS` and `TIMESTAMP_FIELDS`.
+    _date_plan = {}
+
+    def __copy__(self):
+        # Copies keep the requester, and the loader of a stub, which are only
+        # left out when pickling.
+        obj = type(self).__new__(type(self))
+        obj.__dict__.update(self.__dict__)
+        if "_parsed_dates" in obj.__dict__:
+            obj.__dict__["_parsed_dates"] = set(obj.__dict__["_parsed_dates"])
+        return obj
+
+    def __deepcopy__(self, memo):
+        # The requester, the loader and the shared key layout are kept as they
+        # are, while the fields are copied.
+        obj = type(self).__new__(type(self))
+        memo[id(self)] = obj
+        for name, value in self.__dict__.items():
+            if name not in ("_layout", "_loader", "_requester"):
+                value = copy.deepcopy(value, memo)
+            obj.__dict__[name] = value
+        return obj
+
+    def __delattr__(self, name):
+        fields = self._compact_fields()
+        if name in fields and name not in self.__dict__:
+            del fields[name]
+            self._store_compact_fields(fields)
+        else:
+            super(CanvasObject, self).__delattr__(name)
+
+    def __getattr__(self, name):
+        # Only called when normal lookup fails, i.e. for the fields of a
+        # compact object, for the missing fields of a stub and for `*_date`
+        # attributes of fields that aren't described, which are built here on
+        # first access and memoized.
+        layout = self.__dict__.get("_layout")
+        if layout is not None:
+            index = layout.get(name)
+            if index is not None:
+                return self.__dict__["_values"][index]
+
+        loader = self.__dict__.get("_loader")
+        if loader is not None and not name.startswith("__"):
+            self.set_attributes(loader())
+            self.__dict__.pop("_loader", None)
+            return getattr(self, name)
+
+        if name.endswith("_date"):
+            base = name[:-5]
+            if base not in self._date_plan:
+                value = getattr(self, base, None)
+                if isinstance(value, str):
+                    aware = _parse_date(value)
+                    if aware is not None:
+                        self._memoize_date(name, aware)
+                        return aware
+
+        raise AttributeError(
+            "'{}' object has no attribute '{}'".format(type(self).__name__, name)
+        )
+
+    def __getstate__(self):
+        # Pickle only the object's fields. The requester holds a live session
+        # and the access token, so it is left out.
+        return self.to_dict()
 
     def __init__(self, requester, attributes):
         """
@@ -23,17 +207,135 @@ class CanvasObject(object):
         self._requester = requester
         self.set_attributes(attributes)
 
+    def __init_subclass__(cls, **kwargs):
+        super(CanvasObject, cls).__init_subclass__(**kwargs)
+
+        plan = dict(cls._date_plan)
+        for field in cls.__dict__.get("ID_FIELDS", ()):
+            plan[field] = False
+        for field in cls.__dict__.get("TIMESTAMP_FIELDS", ()):
+            plan[field] = True
+            setattr(cls, field + "_date", DateField(field))
+        cls._date_plan = plan
+
+    def __new__(cls, requester=None, attributes=None, *args, **kwargs):
+        # With an identity map, reuse the live object with this class and id.
+        # `__init__` still runs on it, bringing it up to date with the new data.
+        # Only classes with globally unique ids opt in, and only numeric ids
+        # are used, so that `"7"` and `7` are the same object.
+        identity_map = getattr(requester, "identity_map", None)
+        if identity_map is not None and attributes and cls.IDENTITY_MAPPED:
+            object_id = attributes.get("id")
+            if type(object_id) is int or (
+                isinstance(object_id, str) and object_id.isdigit()
+            ):
+                key = (cls, int(object_id))
+                obj = identity_map.get(key)
+                if obj is None:
+                    obj = super(CanvasObject, cls).__new__(cls)
+                    identity_map[key] = obj
+                return obj
+
+        return super(CanvasObject, cls).__new__(cls)
+
     def __repr__(self):  # pragma: no cover
         classname = self.__class__.__name__
+        attributes = self._compact_fields()
+        attributes.update(self.__dict__)
         attrs = ", ".join(
             [
                 "{}={}".format(attr, val)
-                for attr, val in self.__dict__.items()
-                if attr != "attributes"
+                for attr, val in attributes.items()
+                if attr
+                not in ("attributes", "_layout", "_loader", "_values", "_parsed_dates")
             ]
         )  # noqa
         return "{}({})".format(classname, attrs)
 
+    def __setstate__(self, state):
+        self._requester = None
+        self.set_attributes(state)
+
+    def _compact_fields(self):
+        """
+        Return a new dict of the fields stored compactly on this object.
+
+        Empty unless the object was built with `compact_objects` enabled.
+
+        :rtype: dict
+        """
+        layout = self.__dict__.get("_layout")
+        if layout is None:
+            return {}
+        return dict(zip(layout, self.__dict__["_values"]))
+
+    def _memoize_date(self, name, value):
+        """
+        Keep a parsed `*_date` attribute, remembering that it was derived so
+        it can be dropped when its field changes.
+
+        :param name: The name of the date attribute.
+        :type name: str
+        :param value: The parsed date.
+        :type value: :class:`datetime.datetime`
+        """
+        self.__dict__[name] = value
+        parsed_dates = self.__dict__.get("_parsed_dates")
+        if parsed_dates is None:
+            self.__dict__["_parsed_dates"] = {name}
+        else:
+            parsed_dates.add(name)
+
+    def _store_compact_fields(self, fields):
+        """
+        Store `fields` as a tuple of values plus a key layout shared with
+        every other compact object that has the same fields.
+
+        :param fields: The fields to store.
+        :type fields: dict
+        """
+        self._layout = _shared_layout(tuple(fields))
+        self._values = tuple(_compact_value(value) for value in fields.values())
+
+    @classmethod
+    def _stub(cls, requester, object_id, uri, _kwargs=None):
+        """
+        Build an object holding only its ID, without making a request.
+
+        The full object is retrieved from `uri` the first time an attribute it
+        doesn't have yet is accessed.
+
+        :param requester: The requester to pass HTTP requests through.
+        :type requester: :class:`canvasapi.requester.Requester`
+        :param object_id: The ID of the object.
+        :type object_id: int or str
+        :param uri: The URI to retrieve the full object from.
+        :type uri: str
+        :param _kwargs: The combined keyword arguments to send along when the
+            full object is retrieved.
+        :type _kwargs: list
+        :rtype: :class:`CanvasObject`
+        """
+        obj = cls(requester, {"id": object_id})
+        # With an identity map, the object may already be live and loaded.
+        if obj.to_dict().keys() == {"id"}:
+            obj._loader = lambda: requester.request("GET", uri, _kwargs=_kwargs).json()
+        return obj
+
+    @classmethod
+    def from_dict(cls, requester, attributes):
+        """
+        Rebuild an object from the output of
+        :func:`canvasapi.canvas_object.CanvasObject.to_dict`.
+
+        :param requester: The requester to pass HTTP requests through.
+        :type requester: :class:`canvasapi.requester.Requester`
+        :param attributes: The object's fields.
+        :type attributes: dict
+        :rtype: :class:`CanvasObject`
+        """
+        return cls(requester, attributes)
+
     def set_attributes(self, attributes):
         """
         Load this object with attributes.
@@ -52,20 +354,177 @@ class CanvasObject(object):
             }
 
         The `start_at` and `end_at` fields match a date in ISO8601 format,
-        so two additional datetime attributes are created, `start_at_date`
-        and `end_at_date`.
+        so two additional datetime attributes are available, `start_at_date`
+        and `end_at_date`. These are parsed the first time they are accessed.
+
+        If the requester was created with `compact_objects` enabled, fields are
+        kept in a tuple whose key layout is shared with other objects, and are
+        looked up on access instead of being set on the instance.
 
         :param attributes: The JSON object to build this object with.
         :type attributes: dict
         """
+        # A stub given more than its id no longer needs to be loaded.
+        if "_loader" in self.__dict__ and attributes.keys() - {"id"}:
+            del self.__dict__["_loader"]
+
+        # Forget any dates parsed from the previous values of these fields.
+        parsed_dates = self.__dict__.get("_parsed_dates")
+        if parsed_dates:
+            for attribute in attributes:
+                date_attribute = attribute + "_date"
+                if date_attribute in parsed_dates:
+                    parsed_dates.discard(date_attribute)
+                    del self.__dict__[date_attribute]
+
+        if getattr(self._requester, "compact_objects", False):
+            if "_layout" in self.__dict__:
+                fields = self._compact_fields()
+                fields.update(attributes)
+            else:
+                fields = attributes
+            self._store_compact_fields(fields)
+
+            for attribute in attributes:
+                self.__dict__.pop(attribute, None)
+            return
+
         for attribute, value in attributes.items():
-            self.__setattr__(attribute, value)
-
-            try:
-                naive = arrow.get(str(value)).datetime
-                aware = naive.replace(tzinfo=pytz.utc) - naive.utcoffset()
-                self.__setattr__(attribute + "_date", aware)
-            except arrow.ParserError:
-                pass
-            except ValueError:
-                pass
+            setattr(self, attribute, value)
+
+    def to_dict(self):
+        """
+        Return this object's fields as a new dict of JSON-compatible values.
+
+        The requester and parsed `*_date` attributes are left out, and child
+        objects are converted back to dicts, so the result can be cached or
+        sent to another process and passed to
+        :func:`canvasapi.canvas_object.CanvasObject.from_dict`.
+
+        Canvas objects can also be pickled, which stores the same fields. An
+        unpickled object has no requester until one is assigned to its
+        `_requester` attribute.
+
+        :rtype: dict
+        """
+        fields = self._compact_fields()
+        parsed_dates = self.__dict__.get("_parsed_dates", ())
+        for name, value in self.__dict__.items():
+            if name not in _INTERNAL_ATTRIBUTES and name not in parsed_dates:
+                fields[name] = value
+
+        for name, value in fields.items():
+            if isinstance(value, CanvasObject):
+                fields[name] = value.to_dict()
+            elif (
+                isinstance(value, list) and value and isinstance(value[0], CanvasObject)
+            ):
+                fields[name] = [
+                    item.to_dict() if isinstance(item, CanvasObject) else item
+                    for item in value
+                ]
+        return fields
+
+
+class DateField(object):
+    """
+    The `*_date` attribute of a field described in `TIMESTAMP_FIELDS`.
+
+    The timestamp is parsed the first time it is accessed and memoized on the
+    instance, without the checks needed for fields that aren't described.
+    """
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+
+        value = getattr(instance, self.field, None)
+        if isinstance(value, str):
+            aware = _parse_date(value)
+            if aware is not None:
+                instance._memoize_date(self.name, aware)
+                return aware
+
+        raise AttributeError(
+            "'{}' object has no attribute '{}'".format(owner.__name__, self.name)
+        )
+
+    def __init__(self, field):
+        """
+        :param field: The name of the field holding the timestamp.
+        :type field: str
+        """
+        self.field = field
+        self.name = field + "_date"
+
+
+class NestedList(object):
+    """
+    A list of child objects built from a field of the parent's JSON the first
+    time it is accessed, then cached on the parent.
+
+    Used as a class attribute of a :class:`CanvasObject` subclass::
+
+        class Submission(CanvasObject):
+            attachments = NestedList(File, default=list)
+    """
+
+    def __delete__(self, instance):
+        try:
+            del instance.__dict__[self.name]
+        except KeyError:
+            raise AttributeError(self.name)
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+
+        if self.name in instance.__dict__:
+            value = instance.__dict__[self.name]
+            if not _is_json_list(value):
+                return value
+        else:
+            layout = instance.__dict__.get("_layout")
+            if layout is not None and self.name in layout:
+                value = instance.__dict__["_values"][layout[self.name]]
+            elif self._default is not None:
+                value = self._default()
+            else:
+                raise AttributeError(
+                    "'{}' object has no attribute '{}'".format(
+                        owner.__name__, self.name
+                    )
+                )
+
+        if _is_json_list(value):
+            content_class = self._resolve_content_class()
+            value = [content_class(instance._requester, item) for item in value]
+
+        instance.__dict__[self.name] = value
+        return value
+
+    def __init__(self, content_class, default=None):
+        """
+        :param content_class: The class to build each child with, or its
+            dotted path if it can't be imported where the parent is defined.
+        :type content_class: class or str
+        :param default: Called to create the value when the field is missing
+            from the JSON. If None, the attribute is missing too.
+        :type default: callable
+        """
+        self._content_class = content_class
+        self._default = default
+        self.name = None
+
+    def __set__(self, instance, value):
+        instance.__dict__[self.name] = value
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def _resolve_content_class(self):
+        if isinstance(self._content_class, str):
+            module_name, _, class_name = self._content_class.rpartition(".")
+            module = importlib.import_module(module_name)
+            self._content_class = getattr(module, class_name)
+        return self._content_class
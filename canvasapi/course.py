@@ -49,6 +49,16 @@ from canvasapi.util import (
 
 
 class Course(CanvasObject):
+    IDENTITY_MAPPED = True
+    ID_FIELDS = (
+        "id",
+        "account_id",
+        "root_account_id",
+        "enrollment_term_id",
+        "grading_standard_id",
+    )
+    TIMESTAMP_FIELDS = ("created_at", "start_at", "end_at")
+
     def __str__(self):
         return "{} {} ({})".format(self.course_code, self.name, self.id)
 
@@ -676,6 +686,48 @@ class Course(CanvasObject):
         )
         return ExternalFeed(self._requester, response.json())
 
+    def download_attachments(
+        self, destination, max_workers=4, include_history=False, **kwargs
+    ):
+        """
+        Download the attachments of every submission in this course.
+
+        See :func:`canvasapi.attachments.download_attachments` for how
+        attachments are named and written.
+
+        :calls: `GET /api/v1/courses/:course_id/students/submissions \
+        <https://canvas.instructure.com/doc/api/submissions.html#method.submissions_api.for_students>`_
+
+        :param destination: The directory to download to, or a writable binary
+            file-like object to stream a zip archive to.
+        :type destination: str, :class:`os.PathLike` or file
+        :param max_workers: The maximum number of attachments to download at
+            once.
+        :type max_workers: int
+        :param include_history: Whether to download the attachments of every
+            version of each submission rather than only the latest one.
+        :type include_history: bool
+
+        :returns: The paths of the attachments that were downloaded, skipped
+            or failed to download.
+        :rtype: dict
+        """
+        from canvasapi.attachments import download_attachments
+
+        if include_history:
+            include = kwargs.get("include", [])
+            if isinstance(include, str):
+                include = [include]
+            kwargs["include"] = list(include) + ["submission_history"]
+        kwargs.setdefault("student_ids", "all")
+
+        return download_attachments(
+            self.get_multiple_submissions(**kwargs),
+            destination,
+            max_workers=max_workers,
+            include_history=include_history,
+        )
+
     def edit_front_page(self, **kwargs):
         """
         Update the title or contents of the front page.
@@ -2816,6 +2868,51 @@ class Course(CanvasObject):
         )
         return Progress(self._requester, response.json())
 
+    def submissions_bulk_update_chunked(
+        self,
+        grade_data,
+        chunk_size=500,
+        max_workers=4,
+        retries=2,
+        timeout=None,
+        **kwargs,
+    ):
+        """
+        Update the grading and comments on any number of submissions, split
+        into evenly sized asynchronous jobs that run at the same time.
+
+        A chunk that Canvas rejects as too large is split in half and sent
+        again. See :func:`canvasapi.batch.run_in_chunks` for how jobs are
+        retried.
+
+        :param grade_data: The grades to post, keyed by assignment ID and then
+            by student ID, as for :meth:`submissions_bulk_update`.
+        :type grade_data: dict
+        :param chunk_size: The most grades to send in one job.
+        :type chunk_size: int
+        :param max_workers: The maximum number of requests to make at once.
+        :type max_workers: int
+        :param retries: How many times to retry a chunk that failed.
+        :type retries: int
+        :param timeout: The most seconds to wait for each round of jobs, or
+            None to wait for as long as they run.
+        :type timeout: float
+
+        :returns: The jobs that `"completed"`, and a list of
+            `(grade_data, exception)` tuples for the chunks that `"failed"`.
+        :rtype: dict
+        """
+        from canvasapi.batch import halve_grade_data, run_in_chunks, split_grade_data
+
+        return run_in_chunks(
+            lambda chunk: self.submissions_bulk_update(grade_data=chunk, **kwargs),
+            split_grade_data(grade_data, chunk_size),
+            max_workers=max_workers,
+            retries=retries,
+            timeout=timeout,
+            split=halve_grade_data,
+        )
+
     def update(self, **kwargs):
         """
         Update this course.
@@ -3,6 +3,24 @@ from canvasapi.util import combine_kwargs
 
 
 class Enrollment(CanvasObject):
+    IDENTITY_MAPPED = True
+    ID_FIELDS = (
+        "id",
+        "course_id",
+        "course_section_id",
+        "root_account_id",
+        "user_id",
+        "associated_user_id",
+    )
+    TIMESTAMP_FIELDS = (
+        "created_at",
+        "updated_at",
+        "start_at",
+        "end_at",
+        "last_activity_at",
+        "last_attended_at",
+    )
+
     def __str__(self):
         return "{} ({})".format(self.type, self.id)
 
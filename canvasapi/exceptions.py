@@ -1,9 +1,13 @@
 class CanvasException(Exception):  # pragma: no cover
     """
     Base class for all errors returned by the Canvas API.
+
+    Errors without a more specific subclass keep the HTTP status code of the
+    response as `status_code`.
     """
 
-    def __init__(self, message):
+    def __init__(self, message, status_code=None):
+        self.status_code = status_code
         if isinstance(message, dict):
             self.error_report_id = message.get("error_report_id", None)
 
@@ -70,7 +74,51 @@ class Conflict(CanvasException):
     pass
 
 
+class RequestEntityTooLarge(CanvasException):
+    """The request was larger than Canvas accepts."""
+
+    pass
+
+
 class UnprocessableEntity(CanvasException):
     """Canvas was unable to process the entity."""
 
     pass
+
+
+class ProgressFailed(CanvasException):
+    """An asynchronous job tracked by a :class:`canvasapi.progress.Progress` failed."""
+
+    def __init__(self, progress):
+        self.progress = progress
+        super(ProgressFailed, self).__init__(
+            getattr(progress, "message", None)
+            or "Job {} failed.".format(getattr(progress, "id", None))
+        )
+
+
+class ReportFailed(CanvasException):
+    """An account report finished with an error, or was aborted or deleted."""
+
+    def __init__(self, report):
+        self.report = report
+        super(ReportFailed, self).__init__(
+            "Report {} ({}) finished with status {}.".format(
+                getattr(report, "report", None),
+                getattr(report, "id", None),
+                getattr(report, "status", None),
+            )
+        )
+
+
+class SisImportFailed(CanvasException):
+    """A SIS import failed or was aborted."""
+
+    def __init__(self, sis_import):
+        self.sis_import = sis_import
+        super(SisImportFailed, self).__init__(
+            "SIS import {} finished with state {}.".format(
+                getattr(sis_import, "id", None),
+                getattr(sis_import, "workflow_state", None),
+            )
+        )
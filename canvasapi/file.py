@@ -1,11 +1,62 @@
+import hashlib
+import os
+
 from canvasapi.canvas_object import CanvasObject
+from canvasapi.exceptions import CanvasException
 from canvasapi.util import combine_kwargs
 
+# The number of bytes `File.download` reads and writes at a time by default.
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+
+def _hash_file(path, hasher, chunk_size):
+    # Update `hasher` with the contents of the file at `path`.
+    with open(path, "rb") as file_in:
+        for chunk in iter(lambda: file_in.read(chunk_size), b""):
+            hasher.update(chunk)
+
 
 class File(CanvasObject):
+    IDENTITY_MAPPED = True
+    ID_FIELDS = ("id", "folder_id")
+    TIMESTAMP_FIELDS = (
+        "created_at",
+        "updated_at",
+        "modified_at",
+        "lock_at",
+        "unlock_at",
+    )
+
     def __str__(self):
         return "{}".format(self.display_name)
 
+    def _write_chunks(
+        self, response, file_out, chunk_size, hasher, progress, written, total
+    ):
+        """
+        Write the body of a streamed response to `file_out` in chunks.
+
+        :param response: The streamed response.
+        :type response: :class:`requests.Response`
+        :param file_out: The binary file-like object to write to.
+        :param chunk_size: The number of bytes to read and write at a time.
+        :type chunk_size: int
+        :param hasher: The hash to update with each chunk, if any.
+        :param progress: Called after each chunk, if given.
+        :type progress: callable
+        :param written: The number of bytes of the file already written.
+        :type written: int
+        :param total: The size of the file, if known.
+        :type total: int
+        """
+        for chunk in response.iter_content(chunk_size):
+            file_out.write(chunk)
+            if hasher:
+                hasher.update(chunk)
+            written += len(chunk)
+            if progress:
+                progress(written, total)
+
     def delete(self, **kwargs):
         """
         Delete this file.
@@ -20,17 +71,98 @@ class File(CanvasObject):
         )
         return File(self._requester, response.json())
 
-    def download(self, location):
+    def download(
+        self,
+        location,
+        chunk_size=DOWNLOAD_CHUNK_SIZE,
+        resume=False,
+        checksum=None,
+        progress=None,
+    ):
         """
         Download the file to specified location.
 
-        :param location: The path to download to.
-        :type location: str
+        The file is streamed and written `chunk_size` bytes at a time, so it is
+        never held in memory as a whole.
+
+        :param location: The path to download to, or a writable binary
+            file-like object.
+        :type location: str, :class:`os.PathLike` or file-like object
+        :param chunk_size: The number of bytes to read and write at a time.
+        :type chunk_size: int
+        :param resume: Whether to continue a partial download at `location`,
+            a path, by requesting only the remaining bytes with an HTTP Range
+            header. If the server sends the whole file instead, the partial
+            download is overwritten.
+        :type resume: bool
+        :param checksum: The name of a :mod:`hashlib` algorithm, such as
+            "sha256", to hash the whole file with as it is written.
+        :type checksum: str
+        :param progress: Called after each chunk with the number of bytes of
+            the file written so far and its total size, or None if the size is
+            unknown.
+        :type progress: callable
+
+        :returns: The hex digest of the file if `checksum` is given,
+            otherwise None.
+        :rtype: str or None
         """
-        response = self._requester.request("GET", _url=self.url)
+        hasher = hashlib.new(checksum) if checksum else None
+        is_path = isinstance(location, (str, os.PathLike))
+
+        offset = 0
+        if resume and is_path and os.path.exists(location):
+            offset = os.path.getsize(location)
+
+        headers = {}
+        if offset:
+            if offset == getattr(self, "size", None):
+                # Already complete, so there is nothing left to request.
+                if hasher:
+                    _hash_file(location, hasher, chunk_size)
+                if progress:
+                    progress(offset, offset)
+                return hasher.hexdigest() if hasher else None
+
+            headers["Range"] = "bytes={}-".format(offset)
+
+        response = self._requester.request(
+            "GET", _url=self.url, headers=headers, _stream=True
+        )
+        with response:
+            if response.status_code != 206:
+                # The server sent the whole file.
+                offset = 0
+            elif not response.headers.get("Content-Range", "").startswith(
+                "bytes {}-".format(offset)
+            ):
+                raise CanvasException(
+                    "Unexpected Content-Range when resuming download: {}".format(
+                        response.headers.get("Content-Range")
+                    )
+                )
+            elif hasher and offset:
+                _hash_file(location, hasher, chunk_size)
+
+            total = getattr(self, "size", None)
+            length = response.headers.get("Content-Length")
+            content_range = response.headers.get("Content-Range", "")
+            if content_range.rpartition("/")[2].isdigit():
+                total = int(content_range.rpartition("/")[2])
+            elif length is not None and "Content-Encoding" not in response.headers:
+                total = offset + int(length)
+
+            if is_path:
+                with open(location, "ab" if offset else "wb") as file_out:
+                    self._write_chunks(
+                        response, file_out, chunk_size, hasher, progress, offset, total
+                    )
+            else:
+                self._write_chunks(
+                    response, location, chunk_size, hasher, progress, offset, total
+                )
 
-        with open(location, "wb") as file_out:
-            file_out.write(response.content)
+        return hasher.hexdigest() if hasher else None
 
     def get_contents(self, binary=False):
         """
@@ -1,10 +1,12 @@
 from canvasapi.canvas_object import CanvasObject
 from canvasapi.paginated_list import PaginatedList
-from canvasapi.upload import FileOrPathLike, Uploader
+from canvasapi.upload import DeduplicatingUploader, FileOrPathLike, Uploader
 from canvasapi.util import combine_kwargs, obj_or_id
 
 
 class Folder(CanvasObject):
+    IDENTITY_MAPPED = True
+
     def __str__(self):
         return "{}".format(self.full_name)
 
@@ -101,6 +103,24 @@ class Folder(CanvasObject):
             Folder, self._requester, "GET", "folders/{}/folders".format(self.id)
         )
 
+    def mirror(self, directory, **kwargs):
+        """
+        Mirror this folder, its files and all of its subfolders to a local
+        directory, downloading only the files that changed since the last run.
+
+        See :func:`canvasapi.mirror.mirror_folder` for the supported options.
+
+        :param directory: The local directory to mirror the folder to.
+        :type directory: str or :class:`os.PathLike`
+
+        :returns: The paths of the files that were downloaded, moved, deleted,
+            left unchanged or failed to download.
+        :rtype: dict
+        """
+        from canvasapi.mirror import mirror_folder
+
+        return mirror_folder(self, directory, **kwargs)
+
     def update(self, **kwargs):
         """
         Updates a folder.
@@ -119,7 +139,7 @@ class Folder(CanvasObject):
 
         return Folder(self._requester, response.json())
 
-    def upload(self, file: FileOrPathLike, **kwargs):
+    def upload(self, file: FileOrPathLike, manifest=None, **kwargs):
         """
         Upload a file to this folder.
 
@@ -128,9 +148,18 @@ class Folder(CanvasObject):
 
         :param file: The file or path of the file to upload.
         :type file: file or str
+        :param manifest: If given, the file isn't uploaded when a file with the
+            same name and contents is recorded in the manifest. It is reused if
+            it is in this folder, or copied here otherwise.
+        :type manifest: :class:`canvasapi.upload.UploadManifest`
         :returns: True if the file uploaded successfully, False otherwise, \
                     and the JSON response from the API.
         :rtype: tuple
         """
+        if manifest is not None:
+            return DeduplicatingUploader(
+                self._requester, self, file, manifest, **kwargs
+            ).start()
+
         my_path = "folders/{}/files".format(self.id)
         return Uploader(self._requester, my_path, file, **kwargs).start()
@@ -13,6 +13,8 @@ from canvasapi.util import combine_kwargs, is_multivalued, obj_or_id
 
 
 class Group(CanvasObject):
+    IDENTITY_MAPPED = True
+
     def __str__(self):
         return "{} ({})".format(self.name, self.id)
 
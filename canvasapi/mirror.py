@@ -0,0 +1,275 @@
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from canvasapi.paginated_list import iterate_concurrently
+from canvasapi.util import safe_filename
+
+# The name of the manifest kept at the top of a mirrored directory.
+MANIFEST_FILENAME = ".canvasapi-manifest.json"
+
+
+def mirror_folder(
+    folder, directory, max_workers=4, prune=True, manifest_filename=MANIFEST_FILENAME
+):
+    """
+    Mirror a folder, its files and all of its subfolders to a local directory.
+
+    Only files that are new or have changed since the last run are downloaded.
+    A manifest in `directory` records the ID, size, `updated_at` and SHA-256
+    hash of each mirrored file, and a file is downloaded again when its size
+    or `updated_at` changes, or its local copy is missing. Files that were
+    moved or renamed in Canvas are moved locally rather than downloaded.
+
+    The folder tree is listed one level at a time, with up to `max_workers`
+    folders listed at once, and up to `max_workers` files are downloaded at
+    once.
+
+    :param folder: The folder to mirror.
+    :type folder: :class:`canvasapi.folder.Folder`
+    :param directory: The local directory to mirror the folder to.
+    :type directory: str or :class:`os.PathLike`
+    :param max_workers: The maximum number of requests to make at once.
+    :type max_workers: int
+    :param prune: Whether to delete local copies of files that were deleted
+        from the folder. Only files recorded in the manifest are deleted.
+    :type prune: bool
+    :param manifest_filename: The name of the manifest in `directory`.
+    :type manifest_filename: str
+
+    :returns: The paths, relative to `directory`, of the files that were
+        `"downloaded"`, `"moved"`, `"deleted"` and `"unchanged"`, and a list
+        of `(path, exception)` tuples for the files that `"failed"` to download.
+        Failed files keep their earlier manifest entry, if any, so they are
+        retried on the next run and their earlier local copy is still tracked.
+    :rtype: dict
+    """
+    os.makedirs(directory, exist_ok=True)
+    manifest_path = os.path.join(directory, manifest_filename)
+    manifest = _load_manifest(manifest_path)
+
+    summary = {
+        "downloaded": [],
+        "moved": [],
+        "deleted": [],
+        "unchanged": [],
+        "failed": [],
+    }
+    seen = set()
+    downloads = []
+    moves = []
+    replaced = []
+
+    try:
+        for file, path in _walk_files(folder, max_workers):
+            key = str(file.id)
+            seen.add(key)
+            entry = manifest.get(key)
+
+            if entry is None or not _is_unchanged(file, entry, directory):
+                downloads.append((file, path))
+            elif entry["path"] != path:
+                moves.append((entry, path))
+            else:
+                summary["unchanged"].append(path)
+
+        _move_files(moves, directory)
+        summary["moved"].extend(path for _, path in moves)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = executor.map(
+                lambda download: _download(directory, *download), downloads
+            )
+            for (file, path), (entry, error) in zip(downloads, results):
+                if error is None:
+                    # A file that was renamed and changed at once leaves its
+                    # earlier copy behind.
+                    previous = manifest.get(str(file.id))
+                    if previous is not None and previous["path"] != path:
+                        replaced.append(previous["path"])
+                    manifest[str(file.id)] = entry
+                    summary["downloaded"].append(path)
+                else:
+                    summary["failed"].append((path, error))
+
+        claimed = {entry["path"] for entry in manifest.values()}
+        for path in replaced:
+            if path not in claimed:
+                _remove_file(path, directory)
+
+        if prune:
+            stale = [manifest.pop(key)["path"] for key in set(manifest) - seen]
+
+            # A deleted file's path may now hold another file, such as a new
+            # upload with the same name, which is kept.
+            claimed = {entry["path"] for entry in manifest.values()}
+            for path in stale:
+                if path in claimed:
+                    continue
+                _remove_file(path, directory)
+                summary["deleted"].append(path)
+    finally:
+        _save_manifest(manifest_path, manifest)
+
+    return summary
+
+
+def _download(directory, file, path):
+    """
+    Download `file` to `path` within `directory`, through a partial file that
+    is resumed if an earlier run was interrupted.
+
+    :returns: The manifest entry for the file and None, or None and the
+        exception raised while downloading it.
+    :rtype: tuple
+    """
+    local_path = os.path.join(directory, path)
+    partial_path = local_path + ".part"
+    try:
+        os.makedirs(os.path.dirname(local_path), exist_ok=True)
+        digest = file.download(partial_path, resume=True, checksum="sha256")
+        os.replace(partial_path, local_path)
+    except Exception as error:
+        return None, error
+
+    entry = {
+        "path": path,
+        "size": os.path.getsize(local_path),
+        "updated_at": getattr(file, "updated_at", None),
+        "sha256": digest,
+    }
+    return entry, None
+
+
+def _is_unchanged(file, entry, directory):
+    """
+    Whether the local copy recorded by a manifest entry is still up to date.
+
+    :rtype: bool
+    """
+    local_path = os.path.join(directory, entry["path"])
+    return (
+        entry.get("updated_at") == getattr(file, "updated_at", None)
+        and entry.get("size") == getattr(file, "size", entry.get("size"))
+        and os.path.isfile(local_path)
+        and os.path.getsize(local_path) == entry.get("size")
+    )
+
+
+def _load_manifest(path):
+    try:
+        with open(path) as manifest_file:
+            return json.load(manifest_file)["files"]
+    except FileNotFoundError:
+        return {}
+
+
+def _move_files(moves, directory):
+    """
+    Move the local copies of files that were moved or renamed in Canvas, and
+    update their manifest entries.
+
+    Every file is first moved aside to a temporary name, so that a file taking
+    the place of another one that is also moving, such as when two files swap
+    names, doesn't overwrite it.
+
+    :param moves: The manifest entry of each file and its new path.
+    :type moves: list of tuple
+    """
+    staged = []
+    for entry, path in moves:
+        old_path = os.path.join(directory, entry["path"])
+        os.replace(old_path, old_path + ".moving")
+        staged.append((entry, path, old_path + ".moving"))
+
+    for entry, path, temporary_path in staged:
+        local_path = os.path.join(directory, path)
+        os.makedirs(os.path.dirname(local_path), exist_ok=True)
+        os.replace(temporary_path, local_path)
+        _remove_empty_parents(entry["path"], directory)
+        entry["path"] = path
+
+
+def _remove_file(path, directory):
+    """
+    Remove the local copy of a file at `path` within `directory`, if there is
+    one, and the directories above it that are then empty.
+    """
+    local_path = os.path.join(directory, path)
+    if os.path.exists(local_path):
+        os.remove(local_path)
+        _remove_empty_parents(path, directory)
+
+
+def _remove_empty_parents(path, directory):
+    """
+    Remove the directories above `path` that are now empty, stopping at
+    `directory`.
+    """
+    parent = os.path.dirname(path)
+    while parent:
+        try:
+            os.rmdir(os.path.join(directory, parent))
+        except OSError:
+            return
+        parent = os.path.dirname(parent)
+
+
+def _save_manifest(path, manifest):
+    # Write to a temporary file first so an interrupted run can't leave a
+    # truncated manifest behind.
+    temporary_path = path + ".tmp"
+    with open(temporary_path, "w") as manifest_file:
+        json.dump({"files": manifest}, manifest_file, indent=2, sort_keys=True)
+    os.replace(temporary_path, path)
+
+
+def _walk_files(folder, max_workers):
+    """
+    List every file in `folder` and its subfolders.
+
+    :returns: An iterator of `(file, path)` tuples, where `path` is where the
+        file belongs relative to the mirrored directory.
+    :rtype: iterator
+    """
+    folders = []
+    level = [(folder, "")]
+    while level:
+        folders.extend(level)
+
+        # Folders that are known to be empty aren't listed.
+        listings = {
+            id(listing): (listing, path)
+            for listing, path in (
+                (parent.get_folders(), path)
+                for parent, path in level
+                if getattr(parent, "folders_count", None) != 0
+            )
+        }
+        level = [
+            (
+                subfolder,
+                os.path.join(listings[id(listing)][1], safe_filename(subfolder.name)),
+            )
+            for listing, subfolder in iterate_concurrently(
+                [listing for listing, _ in listings.values()],
+                max_workers=max_workers,
+                ordered=True,
+            )
+        ]
+
+    listings = {
+        id(listing): (listing, path)
+        for listing, path in (
+            (parent.get_files(), path)
+            for parent, path in folders
+            if getattr(parent, "files_count", None) != 0
+        )
+    }
+    for listing, file in iterate_concurrently(
+        [listing for listing, _ in listings.values()],
+        max_workers=max_workers,
+        ordered=True,
+    ):
+        name = safe_filename(getattr(file, "display_name", None) or str(file.id))
+        yield file, os.path.join(listings[id(listing)][1], name)
@@ -1,6 +1,11 @@
 from __future__ import annotations
 
+import functools
+import queue
 import re
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from typing import Iterable, Iterator, Type, TypeVar
 
 T = TypeVar("T")
@@ -90,8 +95,9 @@ class PaginatedList(Iterable[T]):
         # for pagination, but there are endpoints which return a `meta` property
         # for pagination instead.
         # See https://github.com/ucfopen/canvasapi/discussions/605
-        if response.links:
-            next_link = response.links.get("next")
+        links = response.links
+        if links:
+            next_link = links.get("next")
         elif isinstance(data, dict) and "meta" in data:
             # requests parses headers into dicts, this returns the same
             # structure so the regex will still work.
@@ -102,14 +108,11 @@ class PaginatedList(Iterable[T]):
         else:
             next_link = None
 
-        regex = r"(?:{}|{})(.*)".format(
-            re.escape(self._requester.base_url),
-            re.escape(self._requester.new_quizzes_url),
-        )
-
-        self._next_url = (
-            re.search(regex, next_link["url"]).group(1) if next_link else None
-        )
+        if next_link:
+            pattern = _next_url_pattern(
+                self._requester.base_url, self._requester.new_quizzes_url
+            )
+            self._next_url = pattern.search(next_link["url"]).group(1)
 
         self._next_params = {}
 
@@ -169,3 +172,147 @@ class PaginatedList(Iterable[T]):
 
         def _finished(self, index):
             return self._stop is not None and index >= self._stop
+
+
+def iterate_concurrently(
+    sources, max_workers=4, ordered=False, return_exceptions=False
+):
+    """
+    Iterate over many paginated lists at once.
+
+    Pages are requested from up to `max_workers` sources at the same time,
+    and each element is yielded alongside the source it came from as soon as
+    its page arrives.
+
+    :param sources: The paginated lists to iterate over. Any iterable is
+        accepted, including a generator. New sources are only drawn from it
+        as earlier ones finish.
+    :type sources: iterable of :class:`canvasapi.paginated_list.PaginatedList`
+    :param max_workers: The maximum number of sources to fetch at once.
+    :type max_workers: int
+    :param ordered: If True, every element of a source is yielded before
+        any element of the next one, in the order the sources were given.
+        Upcoming sources are still fetched in the background. If False,
+        elements are yielded in the order their pages arrive.
+    :type ordered: bool
+    :param return_exceptions: If True, an exception raised while fetching a
+        source is yielded in place of an element and the remaining sources
+        carry on. If False, the first exception is raised.
+    :type return_exceptions: bool
+
+    :returns: An iterator of `(source, element)` tuples.
+    :rtype: iterator
+    """
+    if max_workers < 1:
+        raise ValueError("max_workers must be at least 1.")
+
+    sources = iter(sources)
+    results = queue.Queue()
+    stop = threading.Event()
+
+    started = []
+    pages = {}
+    finished = {}
+
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+
+    def start_next():
+        try:
+            source = next(sources)
+        except StopIteration:
+            return
+
+        index = len(started)
+        started.append(source)
+        pages[index] = deque()
+        executor.submit(_fetch_pages, source, index, results, stop)
+
+    try:
+        for _ in range(max_workers):
+            start_next()
+
+        position = 0
+        while position < len(started):
+            if ordered:
+                # Drain everything already received for the current source
+                # before waiting on the others.
+                current = pages[position]
+                while current:
+                    for element in current.popleft():
+                        yield started[position], element
+
+                if position in finished:
+                    error = finished.pop(position)
+                    del pages[position]
+                    if error is not None:
+                        if not return_exceptions:
+                            raise error
+                        yield started[position], error
+
+                    position += 1
+                    start_next()
+                    continue
+
+            index, page, done, error = results.get()
+
+            if not done:
+                if ordered:
+                    pages[index].append(page)
+                else:
+                    for element in page:
+                        yield started[index], element
+            elif ordered:
+                finished[index] = error
+            else:
+                del pages[index]
+                if error is not None:
+                    if not return_exceptions:
+                        raise error
+                    yield started[index], error
+
+                # In unordered mode ``position`` counts finished sources.
+                position += 1
+                start_next()
+    finally:
+        stop.set()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+@functools.lru_cache(maxsize=None)
+def _next_url_pattern(base_url, new_quizzes_url):
+    """
+    Compile the pattern that strips the API base from a pagination URL.
+
+    Both the REST (`/api/v1/`) and New Quizzes (`/api/quiz/v1/`) bases are
+    matched. Compiled patterns are cached per pair of base URLs so the work
+    is only done once per requester rather than once per page.
+
+    :rtype: :class:`re.Pattern`
+    """
+    return re.compile(
+        r"(?:{}|{})(.*)".format(re.escape(base_url), re.escape(new_quizzes_url))
+    )
+
+
+def _fetch_pages(source, index, results, stop):
+    """
+    Fetch every page of `source`, posting each to the `results` queue.
+
+    Each message is a tuple of `(index, page, done, error)`. A final message
+    with `done` set is always posted, unless `stop` is set first.
+    """
+    try:
+        if isinstance(source, PaginatedList):
+            if source._elements:
+                results.put((index, list(source._elements), False, None))
+            while source._has_next() and not stop.is_set():
+                results.put((index, source._grow(), False, None))
+        else:
+            for element in source:
+                if stop.is_set():
+                    break
+                results.put((index, [element], False, None))
+    except Exception as e:
+        results.put((index, None, True, e))
+    else:
+        results.put((index, None, True, None))
@@ -1,5 +1,9 @@
 from canvasapi.canvas_object import CanvasObject
-from canvasapi.util import combine_kwargs
+from canvasapi.exceptions import ProgressFailed
+from canvasapi.util import combine_kwargs, wait_for_jobs
+
+# The states of a job that has stopped running.
+FINISHED_STATES = ("completed", "failed")
 
 
 class Progress(CanvasObject):
@@ -25,3 +29,90 @@ class Progress(CanvasObject):
         super(Progress, self).set_attributes(response_json)
 
         return Progress(self._requester, response_json)
+
+    def wait(self, timeout=None, interval=1.0, backoff=1.5, max_interval=30.0):
+        """
+        Wait for the job to finish, polling its status with an increasing
+        delay between polls.
+
+        :calls: `GET /api/v1/progress/:id \
+        <https://canvas.instructure.com/doc/api/progress.html#method.progress.show>`_
+
+        :param timeout: The most seconds to wait, or None to wait for as long
+            as the job runs.
+        :type timeout: float
+        :param interval: The seconds to wait before the first poll.
+        :type interval: float
+        :param backoff: What the delay is multiplied by after each poll.
+        :type backoff: float
+        :param max_interval: The longest delay between two polls.
+        :type max_interval: float
+
+        :raises TimeoutError: If the job is still running after `timeout`.
+        :raises ProgressFailed: If the job failed.
+        :rtype: :class:`canvasapi.progress.Progress`
+        """
+        for _ in wait_all(
+            [self],
+            timeout=timeout,
+            interval=interval,
+            backoff=backoff,
+            max_interval=max_interval,
+        ):
+            pass
+        return self
+
+
+def wait_all(
+    progresses,
+    timeout=None,
+    interval=1.0,
+    backoff=1.5,
+    max_interval=30.0,
+    max_workers=4,
+    return_exceptions=False,
+):
+    """
+    Wait for many jobs to finish, yielding each as soon as it does.
+
+    All the running jobs are polled in one loop, up to `max_workers` at a
+    time, and share a single delay between rounds, which grows by `backoff`
+    after every round.
+
+    :param progresses: The jobs to wait for.
+    :type progresses: iterable of :class:`canvasapi.progress.Progress`
+    :param timeout: The most seconds to wait, or None to wait for as long as
+        the jobs run.
+    :type timeout: float
+    :param interval: The seconds to wait before the first round of polls.
+    :type interval: float
+    :param backoff: What the delay is multiplied by after each round.
+    :type backoff: float
+    :param max_interval: The longest delay between two rounds.
+    :type max_interval: float
+    :param max_workers: The maximum number of jobs to poll at once.
+    :type max_workers: int
+    :param return_exceptions: If True, a
+        :class:`canvasapi.exceptions.ProgressFailed` is yielded in place of a
+        job that failed and the remaining jobs carry on. If False, it is
+        raised.
+    :type return_exceptions: bool
+
+    :raises TimeoutError: If any job is still running after `timeout`.
+    :returns: An iterator of the jobs, in the order they finish, each updated
+        with its final status.
+    :rtype: iterator of :class:`canvasapi.progress.Progress`
+    """
+    return wait_for_jobs(
+        progresses,
+        lambda progress: getattr(progress, "workflow_state", None) in FINISHED_STATES,
+        lambda progress: (
+            ProgressFailed(progress) if progress.workflow_state == "failed" else None
+        ),
+        timeout=timeout,
+        interval=interval,
+        backoff=backoff,
+        max_interval=max_interval,
+        max_workers=max_workers,
+        return_exceptions=return_exceptions,
+    )
@@ -1,4 +1,7 @@
+import json
 import logging
+import threading
+import weakref
 from datetime import datetime
 from pprint import pformat
 
@@ -11,26 +14,90 @@ from canvasapi.exceptions import (
     Forbidden,
     InvalidAccessToken,
     RateLimitExceeded,
+    RequestEntityTooLarge,
     ResourceDoesNotExist,
     Unauthorized,
     UnprocessableEntity,
 )
 from canvasapi.util import clean_headers
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Canvas may prefix JSON responses with this to prevent JSON hijacking.
+_JSON_PREFIX = b"while(1);"
+
+# Maps digits to "0" and every other byte to a space, so that a run of digits
+# long enough to be an integer too large for 64 bits, which `orjson` would
+# decode as a float rather than an int, can be found with a plain search.
+_DIGITS = bytes(0x30 if 0x30 <= byte <= 0x39 else 0x20 for byte in range(256))
+_LONG_NUMBER = b"0" * 20
+
+
+def decode_json(response, **kwargs):
+    """
+    Decode the JSON body of a response, skipping any `while(1);` prefix.
+
+    Bodies are decoded with `orjson` when it is installed, falling back to
+    :meth:`requests.Response.json` if it isn't, if the body may hold integers
+    too large for 64 bits, if `orjson` can't decode it or if `kwargs` are given.
+
+    :param response: The response to decode.
+    :type response: :class:`requests.Response`
+    :param kwargs: Passed to :func:`json.loads`.
+    :returns: The decoded JSON.
+    """
+    content = response.content
+    prefixed = content is not None and content.startswith(_JSON_PREFIX)
+    if prefixed:
+        content = content.partition(_JSON_PREFIX)[2]
+
+    if (
+        orjson is not None
+        and content
+        and not kwargs
+        and _LONG_NUMBER not in content.translate(_DIGITS)
+    ):
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            pass
+
+    if prefixed:
+        return json.loads(content.decode("utf-8"), **kwargs)
+    return requests.Response.json(response, **kwargs)
+
+
+class _Response(requests.Response):
+    # The class of every response returned by `Requester.request`, so that
+    # `response.json()` goes through `decode_json`.
+    json = decode_json
+
 
 class Requester(object):
     """
     Responsible for handling HTTP requests.
     """
 
-    def __init__(self, base_url, access_token):
+    def __init__(
+        self, base_url, access_token, compact_objects=False, identity_map=False
+    ):
         """
         :param base_url: The base URL of the Canvas instance's API.
         :type base_url: str
         :param access_token: The API key to authenticate requests with.
         :type access_token: str
+        :param compact_objects: Whether objects built with this requester keep
+            their field values in a tuple, with a layout of field names shared
+            between objects, instead of copying them into attributes.
+        :type compact_objects: bool
+        :param identity_map: Whether objects built with this requester are
+            shared by class and id while they are in use.
+        :type identity_map: bool
         """
         # Preserve the original base url and add "/api/v1" to it
         self.original_url = base_url
@@ -38,8 +105,11 @@ class Requester(object):
         self.new_quizzes_url = base_url + "/api/quiz/v1/"
         self.graphql = base_url + "/api/graphql"
         self.access_token = access_token
+        self.compact_objects = compact_objects
+        self.identity_map = weakref.WeakValueDictionary() if identity_map else None
         self._session = requests.Session()
         self._cache = []
+        self._cache_lock = threading.Lock()
 
     def _delete_request(self, url, headers, data=None, **kwargs):
         """
@@ -54,7 +124,7 @@ class Requester(object):
         """
         return self._session.delete(url, headers=headers, data=data)
 
-    def _get_request(self, url, headers, params=None, **kwargs):
+    def _get_request(self, url, headers, params=None, stream=False, **kwargs):
         """
         Issue a GET request to the specified endpoint with the data provided.
 
@@ -64,8 +134,10 @@ class Requester(object):
         :type headers: dict
         :param params: The parameters to send with this request.
         :type params: dict
+        :param stream: Whether to leave the body to be read as it is consumed.
+        :type stream: bool
         """
-        return self._session.get(url, headers=headers, params=params)
+        return self._session.get(url, headers=headers, params=params, stream=stream)
 
     def _patch_request(self, url, headers, data=None, **kwargs):
         """
@@ -80,7 +152,7 @@ class Requester(object):
         """
         return self._session.patch(url, headers=headers, data=data)
 
-    def _post_request(self, url, headers, data=None, json=None):
+    def _post_request(self, url, headers, data=None, json=None, body=None, **kwargs):
         """
         Issue a POST request to the specified endpoint with the data provided.
 
@@ -92,10 +164,15 @@ class Requester(object):
         :type data: dict
         :param json: JSON-encoded data to send in the body of the request.
         :type json: dict
+        :param body: A file-like object to send as the body of the request,
+            with `data` sent as parameters.
         """
         if json:
             return self._session.post(url, headers=headers, params=data, json=json)
 
+        if body is not None:
+            return self._session.post(url, headers=headers, params=data, data=body)
+
         # Grab file from data.
         files = None
         for field, value in data:
@@ -133,6 +210,8 @@ class Requester(object):
         _url=None,
         _kwargs=None,
         json=False,
+        _stream=False,
+        _body=None,
         **kwargs
     ):
         """
@@ -165,6 +244,11 @@ class Requester(object):
             currently only the POST request of GraphQL is using this parameter.
             For all other methods it's just passed and ignored.
         :type json: `bool`
+        :param _stream: Whether to leave the body of a GET request unread, to
+            be consumed with :meth:`requests.Response.iter_content`.
+        :type _stream: `bool`
+        :param _body: A file-like object to read the body of a POST request
+            from as it is sent, such as a streamed multipart upload.
         :rtype: :class:`requests.Response`
         """
         # Check for specific URL endpoints available from Canvas. If not
@@ -225,7 +309,9 @@ class Requester(object):
         if json:
             logger.debug("JSON: {json}".format(json=pformat(json)))
 
-        response = req_method(full_url, headers, _kwargs, json=json)
+        response = req_method(
+            full_url, headers, _kwargs, json=json, stream=_stream, body=_body
+        )
         logger.info(
             "Response: {method} {url} {status}".format(
                 method=method, url=full_url, status=response.status_code
@@ -237,21 +323,33 @@ class Requester(object):
             )
         )
 
-        try:
-            logger.debug(
-                "Data: {data}".format(data=pformat(response.content.decode("utf-8")))
-            )
-        except UnicodeDecodeError:
-            logger.debug("Data: {data}".format(data=pformat(response.content)))
-        except AttributeError:
-            # response.content is None
-            logger.debug("No data")
+        # Formatting the body is costly for large pages, so only do it when it
+        # will be logged.
+        if logger.isEnabledFor(logging.DEBUG) and _stream:
+            logger.debug("Data: (streamed)")
+        elif logger.isEnabledFor(logging.DEBUG):
+            try:
+                logger.debug(
+                    "Data: {data}".format(
+                        data=pformat(response.content.decode("utf-8"))
+                    )
+                )
+            except UnicodeDecodeError:
+                logger.debug("Data: {data}".format(data=pformat(response.content)))
+            except AttributeError:
+                # response.content is None
+                logger.debug("No data")
+
+        if type(response) is requests.Response:
+            response.__class__ = _Response
 
-        # Add response to internal cache
-        if len(self._cache) > 4:
-            self._cache.pop()
+        # Add response to internal cache. Requests may be issued from several
+        # threads at once, e.g. by `iterate_concurrently`.
+        with self._cache_lock:
+            if len(self._cache) > 4:
+                self._cache.pop()
 
-        self._cache.insert(0, response)
+            self._cache.insert(0, response)
 
         # Raise for status codes
         if response.status_code == 400:
@@ -275,12 +373,15 @@ class Requester(object):
             raise ResourceDoesNotExist("Not Found")
         elif response.status_code == 409:
             raise Conflict(response.text)
+        elif response.status_code == 413:
+            raise RequestEntityTooLarge(response.text)
         elif response.status_code == 422:
             raise UnprocessableEntity(response.text)
         elif response.status_code > 400:
             # generic catch-all for error codes
             raise CanvasException(
-                "Encountered an error: status code {}".format(response.status_code)
+                "Encountered an error: status code {}".format(response.status_code),
+                status_code=response.status_code,
             )
 
         return response
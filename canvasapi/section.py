@@ -8,6 +8,8 @@ from canvasapi.util import combine_kwargs, normalize_bool, obj_or_id
 
 
 class Section(CanvasObject):
+    IDENTITY_MAPPED = True
+
     def __str__(self):
         return "{} - {} ({})".format(self.name, self.course_id, self.id)
 
@@ -191,3 +193,48 @@ class Section(CanvasObject):
             _kwargs=combine_kwargs(**kwargs),
         )
         return Progress(self._requester, response.json())
+
+    def submissions_bulk_update_chunked(
+        self,
+        grade_data,
+        chunk_size=500,
+        max_workers=4,
+        retries=2,
+        timeout=None,
+        **kwargs
+    ):
+        """
+        Update the grading and comments on any number of submissions, split
+        into evenly sized asynchronous jobs that run at the same time.
+
+        A chunk that Canvas rejects as too large is split in half and sent
+        again. See :func:`canvasapi.batch.run_in_chunks` for how jobs are
+        retried.
+
+        :param grade_data: The grades to post, keyed by assignment ID and then
+            by student ID, as for :meth:`submissions_bulk_update`.
+        :type grade_data: dict
+        :param chunk_size: The most grades to send in one job.
+        :type chunk_size: int
+        :param max_workers: The maximum number of requests to make at once.
+        :type max_workers: int
+        :param retries: How many times to retry a chunk that failed.
+        :type retries: int
+        :param timeout: The most seconds to wait for each round of jobs, or
+            None to wait for as long as they run.
+        :type timeout: float
+
+        :returns: The jobs that `"completed"`, and a list of
+            `(grade_data, exception)` tuples for the chunks that `"failed"`.
+        :rtype: dict
+        """
+        from canvasapi.batch import halve_grade_data, run_in_chunks, split_grade_data
+
+        return run_in_chunks(
+            lambda chunk: self.submissions_bulk_update(grade_data=chunk, **kwargs),
+            split_grade_data(grade_data, chunk_size),
+            max_workers=max_workers,
+            retries=retries,
+            timeout=timeout,
+            split=halve_grade_data,
+        )
@@ -0,0 +1,225 @@
+import csv
+import hashlib
+import os
+import shutil
+import tempfile
+import zipfile
+
+# The columns that identify a row of each kind of SIS CSV file. Columns that a
+# file doesn't have are left out of its key.
+SIS_KEY_COLUMNS = {
+    "accounts": ("account_id",),
+    "admins": ("user_id", "account_id", "role", "role_id"),
+    "courses": ("course_id",),
+    "enrollments": ("course_id", "section_id", "user_id", "role", "role_id"),
+    "group_categories": ("group_category_id",),
+    "group_membership": ("group_id", "user_id"),
+    "groups": ("group_id",),
+    "logins": ("user_id", "login_id"),
+    "sections": ("section_id",),
+    "terms": ("term_id",),
+    "user_observers": ("observer_id", "student_id"),
+    "users": ("user_id",),
+    "xlists": ("xlist_course_id", "section_id"),
+}
+
+
+def create_delta_sis_import(
+    account,
+    files,
+    snapshot_directory,
+    timeout=None,
+    interval=1.0,
+    backoff=1.5,
+    max_interval=30.0,
+    **kwargs
+):
+    """
+    Import only the rows of SIS CSV files that changed since the last import.
+
+    Each file is compared, row by row, with the copy of it kept in
+    `snapshot_directory` from the last import that succeeded. New and changed
+    rows are sent as they are. Rows that are no longer in the file are sent
+    with their `status` set to `deleted`, for files that have a `status`
+    column. The changed rows are zipped and imported, the import is waited on,
+    and once it succeeds the files become the new snapshot. Nothing is sent if
+    no row changed.
+
+    A file is sent in full when it has no snapshot yet or its header changed.
+    Each file is copied before it is compared, and that copy becomes its
+    snapshot, so a file rewritten while the import runs is compared again
+    next time. If the import finished with processing errors, the files they
+    concern keep their old snapshot, so that their skipped rows are sent
+    again. All files keep it when an error can't be tied to a file.
+
+    :param account: The account to import into.
+    :type account: :class:`canvasapi.account.Account`
+    :param files: The paths of the full CSV files, each named after the kind of
+        data it holds, such as `users.csv` or `enrollments.csv`.
+    :type files: list of str or :class:`os.PathLike`
+    :param snapshot_directory: The directory holding the files of the last
+        successful import.
+    :type snapshot_directory: str or :class:`os.PathLike`
+    :param timeout: The most seconds to wait for the import, or None to wait
+        for as long as it runs.
+    :type timeout: float
+    :param interval: The seconds to wait before the first poll.
+    :type interval: float
+    :param backoff: What the delay is multiplied by after each poll.
+    :type backoff: float
+    :param max_interval: The longest delay between two polls.
+    :type max_interval: float
+    :param kwargs: Passed to :meth:`canvasapi.account.Account.create_sis_import`.
+
+    :raises SisImportFailed: If the import failed. The snapshot is then left as
+        it was, so the same changes are sent again next time.
+    :returns: The finished import, or None if nothing changed, and the number
+        of rows `"added"`, `"updated"` and `"deleted"` for each kind of data.
+    :rtype: tuple
+    """
+    os.makedirs(snapshot_directory, exist_ok=True)
+    changes = {}
+
+    with tempfile.TemporaryDirectory() as directory:
+        # The copies of the files that were compared, which become the new
+        # snapshot once they are imported.
+        copies = {}
+        os.mkdir(os.path.join(directory, "full"))
+
+        delta_path = os.path.join(directory, "delta.zip")
+        with zipfile.ZipFile(delta_path, "w", zipfile.ZIP_DEFLATED) as archive:
+            for path in files:
+                name = os.path.basename(path)
+                kind = os.path.splitext(name)[0]
+                copies[name] = os.path.join(directory, "full", name)
+                shutil.copyfile(path, copies[name])
+
+                delta = os.path.join(directory, name)
+                with open(delta, "w", encoding="utf-8", newline="") as out:
+                    changes[kind] = _write_delta(
+                        copies[name], os.path.join(snapshot_directory, name), out
+                    )
+
+                # Leave out the files where nothing changed.
+                if any(changes[kind].values()):
+                    archive.write(delta, name)
+
+            if not archive.namelist():
+                return None, changes
+
+        kwargs.setdefault("import_type", "instructure_csv")
+        kwargs.setdefault("extension", "zip")
+        sis_import = account.create_sis_import(delta_path, **kwargs)
+
+        sis_import.wait(
+            timeout=timeout,
+            interval=interval,
+            backoff=backoff,
+            max_interval=max_interval,
+        )
+
+        # Rows with errors were skipped, so the files they are in keep their
+        # old snapshot.
+        skipped = {
+            error[0] for error in getattr(sis_import, "processing_errors", None) or []
+        }
+        if not skipped <= set(copies):
+            return sis_import, changes
+
+        for name, copy in copies.items():
+            if name not in skipped:
+                snapshot = os.path.join(snapshot_directory, name)
+                shutil.copyfile(copy, snapshot + ".tmp")
+                os.replace(snapshot + ".tmp", snapshot)
+
+    return sis_import, changes
+
+
+def _key_indexes(kind, header):
+    # The positions of the columns that identify a row in a file of `kind`.
+    columns = SIS_KEY_COLUMNS.get(kind)
+    if columns is None:
+        raise ValueError(
+            "Can't tell how rows of {}.csv are identified. Expected one of: {}.".format(
+                kind, ", ".join(sorted(SIS_KEY_COLUMNS))
+            )
+        )
+    indexes = [header.index(column) for column in columns if column in header]
+    if not indexes:
+        raise ValueError(
+            "{}.csv has none of the columns {}.".format(kind, ", ".join(columns))
+        )
+    return indexes
+
+
+def _read_header(path):
+    with open(path, encoding="utf-8-sig", newline="") as csv_file:
+        return next(csv.reader(csv_file), [])
+
+
+def _read_rows(path):
+    # Stream the rows of a CSV file after its header, skipping blank lines and
+    # checking that every row has as many fields as the header.
+    with open(path, encoding="utf-8-sig", newline="") as csv_file:
+        reader = csv.reader(csv_file)
+        header = next(reader, [])
+        for row in reader:
+            if not row:
+                continue
+            if len(row) != len(header):
+                raise ValueError(
+                    "{}, line {}: expected {} fields, found {}.".format(
+                        os.path.basename(path), reader.line_num, len(header), len(row)
+                    )
+                )
+            yield row
+
+
+def _row_digest(row):
+    return hashlib.blake2b("\x1f".join(row).encode("utf-8"), digest_size=16).digest()
+
+
+def _write_delta(path, snapshot, out):
+    """
+    Write the rows of the CSV file at `path` that differ from `snapshot` to
+    `out`, reading each file as a stream.
+
+    Only the keys and digests of the snapshot's rows are held in memory. Rows
+    that were removed are found by reading the snapshot a second time.
+
+    :returns: The number of rows added, updated and deleted.
+    :rtype: dict
+    """
+    kind = os.path.splitext(os.path.basename(path))[0]
+    counts = {"added": 0, "updated": 0, "deleted": 0}
+    writer = csv.writer(out)
+
+    header = _read_header(path)
+    keys = _key_indexes(kind, header)
+    writer.writerow(header)
+
+    previous = {}
+    if os.path.exists(snapshot) and _read_header(snapshot) == header:
+        previous = {
+            tuple(row[i] for i in keys): _row_digest(row)
+            for row in _read_rows(snapshot)
+        }
+
+    for row in _read_rows(path):
+        digest = previous.pop(tuple(row[i] for i in keys), None)
+        if digest is None:
+            counts["added"] += 1
+            writer.writerow(row)
+        elif digest != _row_digest(row):
+            counts["updated"] += 1
+            writer.writerow(row)
+
+    if previous and "status" in header:
+        status = header.index("status")
+        for row in _read_rows(snapshot):
+            if tuple(row[i] for i in keys) in previous:
+                row[status] = "deleted"
+                counts["deleted"] += 1
+                writer.writerow(row)
+
+    return counts
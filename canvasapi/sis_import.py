@@ -1,9 +1,28 @@
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+
 from canvasapi.canvas_object import CanvasObject
+from canvasapi.exceptions import SisImportFailed
 from canvasapi.progress import Progress
-from canvasapi.util import combine_kwargs
+from canvasapi.util import combine_kwargs, wait_for_jobs
 
 
 class SisImport(CanvasObject):
+    # The states of an import that has stopped running, and those of them
+    # that mean it failed.
+    FINISHED_STATES = (
+        "imported",
+        "imported_with_messages",
+        "aborted",
+        "failed",
+        "failed_with_messages",
+        "partially_restored",
+        "restored",
+    )
+    FAILED_STATES = ("aborted", "failed", "failed_with_messages")
+
     def __str__(self):  # pragma: no cover
         return "{} ({})".format(self.workflow_state, self.id)
 
@@ -23,6 +42,27 @@ class SisImport(CanvasObject):
         )
         return SisImport(self._requester, response.json())
 
+    def query(self, **kwargs):
+        """
+        Update this SIS import with its current status.
+
+        :calls: `GET /api/v1/accounts/:account_id/sis_imports/:id \
+        <https://canvas.instructure.com/doc/api/sis_imports.html#method.sis_imports_api.show>`_
+
+        :rtype: :class:`canvasapi.sis_import.SisImport`
+        """
+        response = self._requester.request(
+            "GET",
+            "accounts/{}/sis_imports/{}".format(self.account_id, self.id),
+            _kwargs=combine_kwargs(**kwargs),
+        )
+
+        response_json = response.json()
+        response_json.update({"account_id": self.account_id})
+        super(SisImport, self).set_attributes(response_json)
+
+        return SisImport(self._requester, response_json)
+
     def restore_states(self, **kwargs):
         """
         Restore workflow_states of SIS imported items.
@@ -40,3 +80,211 @@ class SisImport(CanvasObject):
             _kwargs=combine_kwargs(**kwargs),
         )
         return Progress(self._requester, response.json())
+
+    def wait(self, timeout=None, interval=1.0, backoff=1.5, max_interval=30.0):
+        """
+        Wait for the import to finish, polling its status with an increasing
+        delay between polls.
+
+        :calls: `GET /api/v1/accounts/:account_id/sis_imports/:id \
+        <https://canvas.instructure.com/doc/api/sis_imports.html#method.sis_imports_api.show>`_
+
+        :param timeout: The most seconds to wait, or None to wait for as long
+            as the import runs.
+        :type timeout: float
+        :param interval: The seconds to wait before the first poll.
+        :type interval: float
+        :param backoff: What the delay is multiplied by after each poll.
+        :type backoff: float
+        :param max_interval: The longest delay between two polls.
+        :type max_interval: float
+
+        :raises TimeoutError: If the import is still running after `timeout`.
+        :raises SisImportFailed: If the import failed or was aborted.
+        :rtype: :class:`canvasapi.sis_import.SisImport`
+        """
+        for _ in wait_for_jobs(
+            [self],
+            _sis_import_finished,
+            _sis_import_failure,
+            timeout=timeout,
+            interval=interval,
+            backoff=backoff,
+            max_interval=max_interval,
+            max_workers=1,
+            return_exceptions=False,
+        ):
+            pass
+        return self
+
+
+def run_sis_imports(
+    imports,
+    interval=1.0,
+    backoff=1.5,
+    max_interval=10.0,
+    max_workers=4,
+):
+    """
+    Run a queue of SIS imports across accounts, one at a time per account,
+    reporting their progress as it happens.
+
+    An account's next import is only submitted once none is running in it,
+    including imports started elsewhere. Running imports across all accounts
+    are polled in one loop, up to `max_workers` at a time, with a shared
+    delay that grows by `backoff` after each round and starts over whenever
+    an import is submitted. Errors and warnings are reported as soon as a poll
+    returns them, rather than once an import finishes.
+
+    Each event is a `(kind, sis_import, detail)` tuple, where `kind` is one of:
+
+    * `"submitted"`: The import was created. `detail` is None.
+    * `"error"` or `"warning"`: A new entry of the import's
+      `processing_errors` or `processing_warnings`, given as `detail`,
+      usually a `[file, message]` pair.
+    * `"finished"`: The import succeeded. `detail` is None.
+    * `"failed"`: The import failed or was aborted. `detail` is a
+      :class:`canvasapi.exceptions.SisImportFailed`. The account's remaining
+      imports still run.
+
+      An import is also reported as failed, with the exception raised as
+      `detail`, when a request made for it fails. That includes checking its
+      account for running imports, creating it, in which case `sis_import`
+      is None, and polling it, which stops it from being followed. Other
+      imports and accounts carry on.
+
+    :param imports: The imports to run, in order. Each is an
+        `(account, attachment)` tuple, or an `(account, attachment, kwargs)`
+        tuple where `kwargs` is a dict passed to
+        :meth:`canvasapi.account.Account.create_sis_import`.
+    :type imports: iterable of tuple
+    :param interval: The seconds to wait before the first round of polls.
+    :type interval: float
+    :param backoff: What the delay is multiplied by after each round.
+    :type backoff: float
+    :param max_interval: The longest delay between two rounds.
+    :type max_interval: float
+    :param max_workers: The maximum number of requests to make at once.
+    :type max_workers: int
+
+    :returns: An iterator of `(kind, sis_import, detail)` events.
+    :rtype: iterator of tuple
+    """
+    if max_workers < 1:
+        raise ValueError("max_workers must be at least 1.")
+
+    queues = {}
+    for entry in imports:
+        account, attachment = entry[:2]
+        kwargs = entry[2] if len(entry) > 2 else {}
+        queues.setdefault(account.id, (account, deque()))[1].append(
+            (attachment, kwargs)
+        )
+
+    running = {}
+    reported = {}
+    delay = interval
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        while queues or running:
+            # Accounts with queued imports and none of ours running, which
+            # are checked for imports started elsewhere.
+            idle = [
+                account
+                for account_id, (account, _) in queues.items()
+                if account_id not in running
+            ]
+            busy = executor.map(
+                lambda account: _call(
+                    lambda: any(True for _ in account.get_sis_imports_running())
+                ),
+                idle,
+            )
+            for account, (is_busy, error) in zip(idle, list(busy)):
+                if error is None and is_busy:
+                    continue
+
+                queue = queues[account.id][1]
+                attachment, kwargs = queue.popleft()
+                if not queue:
+                    del queues[account.id]
+
+                if error is None:
+                    sis_import, error = _call(
+                        lambda: account.create_sis_import(attachment, **kwargs)
+                    )
+                if error is not None:
+                    yield "failed", None, error
+                    continue
+
+                running[account.id] = sis_import
+                reported[sis_import.id] = {
+                    field: 0 for _, field in _SIS_IMPORT_MESSAGES
+                }
+                delay = interval
+                yield "submitted", sis_import, None
+
+            if not queues and not running:
+                break
+
+            time.sleep(delay)
+            delay = min(delay * backoff, max_interval)
+            polls = list(
+                executor.map(
+                    lambda sis_import: _call(sis_import.query), running.values()
+                )
+            )
+
+            for (account_id, sis_import), (_, error) in zip(
+                list(running.items()), polls
+            ):
+                if error is not None:
+                    del running[account_id]
+                    del reported[sis_import.id]
+                    yield "failed", sis_import, error
+                    continue
+
+                counts = reported[sis_import.id]
+                for kind, field in _SIS_IMPORT_MESSAGES:
+                    messages = getattr(sis_import, field, None) or []
+                    for message in islice(messages, counts[field], None):
+                        yield kind, sis_import, message
+                    counts[field] = max(counts[field], len(messages))
+
+                if not _sis_import_finished(sis_import):
+                    continue
+
+                del running[account_id]
+                del reported[sis_import.id]
+                error = _sis_import_failure(sis_import)
+                if error is None:
+                    yield "finished", sis_import, None
+                else:
+                    yield "failed", sis_import, error
+
+
+# The kinds of event reported for new entries of an import's message lists.
+_SIS_IMPORT_MESSAGES = (
+    ("error", "processing_errors"),
+    ("warning", "processing_warnings"),
+)
+
+
+def _call(function):
+    # Call `function`, returning its result and None, or None and the
+    # exception it raised.
+    try:
+        return function(), None
+    except Exception as error:
+        return None, error
+
+
+def _sis_import_failure(sis_import):
+    # The exception for a finished import, or None if it succeeded.
+    if sis_import.workflow_state in SisImport.FAILED_STATES:
+        return SisImportFailed(sis_import)
+    return None
+
+
+def _sis_import_finished(sis_import):
+    return getattr(sis_import, "workflow_state", None) in SisImport.FINISHED_STATES
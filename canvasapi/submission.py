@@ -1,4 +1,4 @@
-from canvasapi.canvas_object import CanvasObject
+from canvasapi.canvas_object import CanvasObject, NestedList
 from canvasapi.file import File
 from canvasapi.paginated_list import PaginatedList
 from canvasapi.peer_review import PeerReview
@@ -7,13 +7,11 @@ from canvasapi.util import combine_kwargs, obj_or_id
 
 
 class Submission(CanvasObject):
-    def __init__(self, requester, attributes):
-        super(Submission, self).__init__(requester, attributes)
+    IDENTITY_MAPPED = True
+    ID_FIELDS = ("id", "assignment_id", "user_id", "grader_id", "grading_period_id")
+    TIMESTAMP_FIELDS = ("submitted_at", "graded_at", "posted_at", "cached_due_date")
 
-        self.attachments = [
-            File(requester, attachment)
-            for attachment in attributes.get("attachments", [])
-        ]
+    attachments = NestedList(File, default=list)
 
     def __str__(self):
         return "{}-{}".format(self.assignment_id, self.user_id)
@@ -182,16 +180,7 @@ class Submission(CanvasObject):
 
 
 class GroupedSubmission(CanvasObject):
-    def __init__(self, requester, attributes):
-        super(GroupedSubmission, self).__init__(requester, attributes)
-
-        try:
-            self.submissions = [
-                Submission(requester, submission)
-                for submission in attributes["submissions"]
-            ]
-        except KeyError:
-            self.submissions = list()
+    submissions = NestedList(Submission, default=list)
 
     def __str__(self):
         return "{} submission(s) for User #{}".format(
@@ -1,9 +1,20 @@
+import hashlib
 import io
 import json
 import os
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from typing import Union
 
-from canvasapi.util import combine_kwargs
+from urllib3.fields import RequestField
+from urllib3.filepost import choose_boundary
+
+from canvasapi.exceptions import (
+    RateLimitExceeded,
+    ResourceDoesNotExist,
+)
+from canvasapi.util import combine_kwargs, is_transient_error
 
 FileOrPathLike = Union[os.PathLike, str, io.IOBase, io.FileIO]
 """
@@ -16,7 +27,7 @@ class Uploader(object):
     Upload a file to Canvas.
     """
 
-    def __init__(self, requester, url, file: FileOrPathLike, **kwargs):
+    def __init__(self, requester, url, file: FileOrPathLike, progress=None, **kwargs):
         """
         :param requester: The :class:`canvasapi.requester.Requester` to pass requests through.
         :type requester: :class:`canvasapi.requester.Requester`
@@ -24,6 +35,9 @@ class Uploader(object):
         :type url: str
         :param file: A file handler or path of the file to upload.
         :type file: :class:`os.PathLike` or str
+        :param progress: Called as the file is sent with the number of bytes of
+            the upload sent so far and its total size.
+        :type progress: callable
         """
         if isinstance(file, (os.PathLike, str)):
             if not os.path.exists(file):
@@ -35,6 +49,7 @@ class Uploader(object):
         self._requester = requester
         self.url = url
         self.file = file
+        self.progress = progress
         self.kwargs = kwargs
 
     def request_upload_token(self, file):
@@ -46,7 +61,7 @@ class Uploader(object):
             and the JSON response from the API.
         :rtype: tuple
         """
-        self.kwargs["name"] = os.path.basename(file.name)
+        self.kwargs["name"] = _file_name(file)
         self.kwargs["size"] = os.fstat(file.fileno()).st_size
 
         response = self._requester.request(
@@ -91,15 +106,551 @@ class Uploader(object):
 
         kwargs = response.get("upload_params")
 
-        response = self._requester.request(
-            "POST",
-            use_auth=False,
-            _url=response.get("upload_url"),
-            file=file,
-            _kwargs=combine_kwargs(**kwargs),
-        )
+        # Stream the file rather than having `requests` build the whole
+        # multipart body in memory, unless its size can't be known up front.
+        body = _MultipartStream.for_file(combine_kwargs(**kwargs), file, self.progress)
+        if body is None:
+            response = self._requester.request(
+                "POST",
+                use_auth=False,
+                _url=response.get("upload_url"),
+                file=file,
+                _kwargs=combine_kwargs(**kwargs),
+            )
+        else:
+            response = self._requester.request(
+                "POST",
+                use_auth=False,
+                _url=response.get("upload_url"),
+                headers={"Content-Type": body.content_type},
+                _body=body,
+            )
 
-        # remove `while(1);` that may appear at the top of a response
-        response_json = json.loads(response.text.lstrip("while(1);"))
+        # `while(1);` may appear at the top of the response, which `json()` skips
+        response_json = response.json()
 
         return ("url" in response_json, response_json)
+
+
+class DeduplicatingUploader(Uploader):
+    """
+    Upload a file to a folder, unless a file with the same name and contents
+    is already there.
+
+    The SHA-256 hash of the file is compared against an
+    :class:`UploadManifest`. When an identical file is recorded in the target
+    folder, nothing is sent. When one is recorded in another folder, it is
+    copied into the target folder on the server instead of being uploaded.
+    """
+
+    def __init__(self, requester, folder, file, manifest, progress=None, **kwargs):
+        """
+        :param requester: The :class:`canvasapi.requester.Requester` to pass requests through.
+        :type requester: :class:`canvasapi.requester.Requester`
+        :param folder: The folder to upload the file to.
+        :type folder: :class:`canvasapi.folder.Folder`
+        :param file: A file handler or path of the file to upload.
+        :type file: :class:`os.PathLike` or str
+        :param manifest: The record of files already in Canvas, which is
+            updated with the file once it is uploaded or copied.
+        :type manifest: :class:`UploadManifest`
+        :param progress: Called as the file is sent with the number of bytes of
+            the upload sent so far and its total size.
+        :type progress: callable
+        """
+        super(DeduplicatingUploader, self).__init__(
+            requester,
+            "folders/{}/files".format(folder.id),
+            file,
+            progress=progress,
+            **kwargs
+        )
+        self.folder = folder
+        self.manifest = manifest
+
+    def request_upload_token(self, file):
+        """
+        Reuse an identical file recorded in the manifest, or request an upload
+        token and upload the file.
+
+        :param file: A file handler pointing to the file to upload.
+        :returns: True if the file was uploaded or reused, False otherwise, \
+            and the attributes of the file in Canvas.
+        :rtype: tuple
+        """
+        name = _file_name(file)
+        size = os.fstat(file.fileno()).st_size
+        sha256 = _hash_contents(file)
+
+        for entry in self.manifest.find(sha256, name, size, self.folder.id):
+            if entry["folder_id"] == self.folder.id:
+                return True, entry
+
+            try:
+                copied = self.folder.copy_file(entry["id"]).to_dict()
+            except ResourceDoesNotExist:
+                # Deleted since it was recorded, so look for another.
+                self.manifest.discard(entry["id"])
+                continue
+
+            copied.setdefault("folder_id", self.folder.id)
+            self.manifest.add(copied, sha256)
+            return True, copied
+
+        uploaded, attributes = super(DeduplicatingUploader, self).request_upload_token(
+            file
+        )
+        if uploaded and "id" in attributes:
+            self.manifest.add(attributes, sha256)
+        return uploaded, attributes
+
+
+class UploadManifest(object):
+    """
+    A record of files in Canvas and the SHA-256 hashes of their contents, used
+    by :class:`DeduplicatingUploader` to avoid uploading a file twice.
+
+    Canvas doesn't report file hashes, so the hash of a file found with
+    :meth:`prime` is only worked out, by downloading it, once a local file of
+    the same name and size is about to be uploaded. Hashes are kept for as
+    long as the size and `updated_at` of the file in Canvas stay the same.
+    """
+
+    def __init__(self, path=None):
+        """
+        :param path: The JSON file to load the manifest from, if it exists,
+            and to write it to with :meth:`save`.
+        :type path: str or :class:`os.PathLike`
+        """
+        self.path = path
+        self._files = {}
+        self._remote = {}
+        self._lock = threading.Lock()
+
+        if path is not None and os.path.exists(path):
+            with open(path) as manifest_file:
+                self._files = {
+                    int(file_id): entry
+                    for file_id, entry in json.load(manifest_file)["files"].items()
+                }
+
+    def __len__(self):
+        return len(self._files)
+
+    def add(self, attributes, sha256=None):
+        """
+        Record a file in Canvas.
+
+        :param attributes: The attributes of the file, as returned by the API.
+        :type attributes: dict
+        :param sha256: The hex SHA-256 hash of the file's contents, if known.
+        :type sha256: str
+        """
+        entry = {
+            "id": attributes["id"],
+            "folder_id": attributes.get("folder_id"),
+            "display_name": attributes.get("display_name"),
+            "size": attributes.get("size"),
+            "updated_at": attributes.get("updated_at"),
+            "sha256": sha256,
+        }
+        with self._lock:
+            previous = self._files.get(entry["id"])
+            if (
+                sha256 is None
+                and previous is not None
+                and previous["size"] == entry["size"]
+                and previous["updated_at"] == entry["updated_at"]
+            ):
+                entry["sha256"] = previous["sha256"]
+            self._files[entry["id"]] = entry
+
+    def discard(self, file_id):
+        """
+        Forget a file, such as one that was deleted from Canvas.
+
+        :param file_id: The ID of the file.
+        :type file_id: int
+        """
+        with self._lock:
+            self._files.pop(file_id, None)
+            self._remote.pop(file_id, None)
+
+    def find(self, sha256, name, size, folder_id=None):
+        """
+        Find the recorded files with the given name and contents, hashing the
+        candidates found with :meth:`prime` as needed.
+
+        :param sha256: The hex SHA-256 hash of the contents.
+        :type sha256: str
+        :param name: The display name of the file.
+        :type name: str
+        :param size: The size of the file in bytes.
+        :type size: int
+        :param folder_id: The folder to list matches in first.
+        :type folder_id: int
+
+        :returns: An iterator of manifest entries.
+        :rtype: iterator
+        """
+        with self._lock:
+            candidates = [
+                entry
+                for entry in self._files.values()
+                if entry["display_name"] == name and entry["size"] == size
+            ]
+        candidates.sort(key=lambda entry: entry["folder_id"] != folder_id)
+
+        for entry in candidates:
+            if entry["sha256"] is None:
+                remote = self._remote.get(entry["id"])
+                if remote is None:
+                    continue
+                with open(os.devnull, "wb") as sink:
+                    entry["sha256"] = remote.download(sink, checksum="sha256")
+
+            if entry["sha256"] == sha256:
+                yield entry
+
+    def prime(self, folder, **kwargs):
+        """
+        Record the files in a folder, forgetting any recorded there before
+        that are no longer listed.
+
+        :calls: `GET /api/v1/folders/:id/files \
+        <https://canvas.instructure.com/doc/api/files.html#method.files.api_index>`_
+
+        :param folder: The folder to list.
+        :type folder: :class:`canvasapi.folder.Folder`
+        """
+        listed = set()
+        for file in folder.get_files(**kwargs):
+            attributes = file.to_dict()
+            attributes.setdefault("folder_id", folder.id)
+            self.add(attributes)
+            with self._lock:
+                self._remote[file.id] = file
+            listed.add(file.id)
+
+        with self._lock:
+            for file_id, entry in list(self._files.items()):
+                if entry["folder_id"] == folder.id and file_id not in listed:
+                    del self._files[file_id]
+
+    def save(self, path=None):
+        """
+        Write the manifest to a JSON file.
+
+        :param path: Where to write the manifest. Defaults to the path it was
+            loaded from.
+        :type path: str or :class:`os.PathLike`
+        """
+        path = os.fspath(path if path is not None else self.path)
+        with self._lock:
+            contents = {"files": {str(k): v for k, v in self._files.items()}}
+
+        # Write to a temporary file first so an interrupted save can't leave
+        # a truncated manifest behind.
+        with open(path + ".tmp", "w") as manifest_file:
+            json.dump(contents, manifest_file, indent=2, sort_keys=True)
+        os.replace(path + ".tmp", path)
+
+
+def upload_concurrently(
+    target,
+    files,
+    max_workers=4,
+    retries=3,
+    backoff=1.0,
+    return_exceptions=False,
+    **kwargs
+):
+    """
+    Upload many files to a course, group, user or folder at once.
+
+    Up to `max_workers` files are uploaded at the same time, each through
+    `target.upload`. An upload that hits the rate limit, a server error or a
+    connection error is retried up to `retries` times. After a rate limit
+    error every worker waits before starting its next request, the wait
+    doubling from `backoff` seconds on each retry of the same file.
+
+    :param target: The object to upload the files to.
+    :type target: :class:`canvasapi.course.Course`,
+        :class:`canvasapi.group.Group`, :class:`canvasapi.user.User` or
+        :class:`canvasapi.folder.Folder`
+    :param files: The files or paths of the files to upload. Any iterable is
+        accepted, including a generator. New files are only drawn from it as
+        earlier uploads finish.
+    :type files: iterable of file or str
+    :param max_workers: The maximum number of files to upload at once.
+    :type max_workers: int
+    :param retries: How many times to retry a file after a transient error.
+    :type retries: int
+    :param backoff: The number of seconds to wait before the first retry.
+    :type backoff: float
+    :param return_exceptions: If True, the exception that stopped a file from
+        uploading is yielded in place of its result and the remaining files
+        carry on. If False, the first exception is raised.
+    :type return_exceptions: bool
+    :param kwargs: Passed to `target.upload` for every file.
+
+    :returns: An iterator of `(file, result)` tuples, in the order uploads
+        finish, where `result` is the tuple returned by `target.upload`.
+    :rtype: iterator
+    """
+    if max_workers < 1:
+        raise ValueError("max_workers must be at least 1.")
+
+    files = iter(files)
+    throttle = _Throttle()
+    running = {}
+
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+
+    def start_next():
+        try:
+            file = next(files)
+        except StopIteration:
+            return
+
+        future = executor.submit(
+            _upload_with_retries, target, file, retries, backoff, throttle, kwargs
+        )
+        running[future] = file
+
+    try:
+        for _ in range(max_workers):
+            start_next()
+
+        while running:
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                file = running.pop(future)
+                error = future.exception()
+                if error is not None:
+                    if not return_exceptions:
+                        raise error
+                    yield file, error
+                else:
+                    yield file, future.result()
+
+                start_next()
+    finally:
+        throttle.stop()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _file_name(file):
+    # The name to upload `file` with. Files opened from a descriptor, such as
+    # temporary files, are named by that descriptor instead of a path.
+    name = getattr(file, "name", None)
+    if isinstance(name, (str, os.PathLike)):
+        return os.path.basename(os.fspath(name))
+    return "file"
+
+
+def _hash_contents(file):
+    """
+    Hash the rest of `file` with SHA-256, leaving it where it was.
+
+    :rtype: str
+    """
+    if isinstance(file, io.TextIOBase):
+        file = getattr(file, "buffer", file)
+
+    position = file.tell()
+    hasher = hashlib.sha256()
+    for chunk in iter(lambda: file.read(1024 * 1024), b""):
+        hasher.update(chunk)
+    file.seek(position)
+    return hasher.hexdigest()
+
+
+def _upload_with_retries(target, file, retries, backoff, throttle, kwargs):
+    """
+    Upload a single file with `target.upload`, retrying transient errors.
+
+    :returns: The result of `target.upload`.
+    :rtype: tuple
+    """
+    # File objects are rewound to where they started before each retry.
+    position = None
+    seekable = getattr(file, "seekable", None)
+    if not isinstance(file, (os.PathLike, str)) and seekable and seekable():
+        position = file.tell()
+
+    attempt = 0
+    while True:
+        throttle.wait()
+        try:
+            return target.upload(file, **kwargs)
+        except Exception as error:
+            if attempt >= retries or not is_transient_error(error):
+                raise
+
+            delay = backoff * 2**attempt
+            if isinstance(error, RateLimitExceeded):
+                throttle.pause(delay)
+            else:
+                throttle.sleep(delay)
+
+            attempt += 1
+            if position is not None:
+                file.seek(position)
+
+
+class _Throttle(object):
+    """
+    Holds back the workers of :func:`upload_concurrently` while the rate limit
+    recovers.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._resume_at = 0.0
+        self._stopped = threading.Event()
+
+    def pause(self, delay):
+        """
+        Hold back every worker for `delay` seconds.
+
+        :param delay: The number of seconds to wait.
+        :type delay: float
+        """
+        with self._lock:
+            self._resume_at = max(self._resume_at, time.monotonic() + delay)
+
+    def sleep(self, delay):
+        """
+        Wait for `delay` seconds, or until the uploads are stopped.
+
+        :param delay: The number of seconds to wait.
+        :type delay: float
+        """
+        self._stopped.wait(delay)
+
+    def stop(self):
+        """
+        Wake any waiting workers, as the uploads have been abandoned.
+        """
+        self._stopped.set()
+
+    def wait(self):
+        """
+        Wait until no pause is in effect.
+        """
+        while not self._stopped.is_set():
+            with self._lock:
+                delay = self._resume_at - time.monotonic()
+            if delay <= 0:
+                return
+            self.sleep(delay)
+
+
+class _MultipartStream(object):
+    """
+    A `multipart/form-data` body that reads the file to upload as it is sent,
+    so that only a chunk of it is held in memory at a time.
+
+    The body is laid out as `requests` would lay it out: each field, then the
+    file as a part named "file".
+    """
+
+    def __init__(self, fields, file, filename, size, progress=None):
+        """
+        :param fields: The fields to send before the file.
+        :type fields: `list` of `tuple`
+        :param file: A binary file handler positioned at the start of the data
+            to send.
+        :param filename: The filename to send the file with.
+        :type filename: str
+        :param size: The number of bytes of `file` to send.
+        :type size: int
+        :param progress: Called after each read with the number of bytes read
+            so far and the total length of the body.
+        :type progress: callable
+        """
+        boundary = choose_boundary()
+        self.content_type = "multipart/form-data; boundary={}".format(boundary)
+
+        head = io.BytesIO()
+        for name, value in fields:
+            # Skip empty fields and send the rest as text, as `requests` does.
+            if value is None:
+                continue
+            if not isinstance(value, bytes):
+                value = str(value).encode("utf-8")
+
+            field = RequestField(name=name, data=value)
+            field.make_multipart()
+            head.write("--{}\r\n".format(boundary).encode("latin-1"))
+            head.write(field.render_headers().encode("utf-8"))
+            head.write(value)
+            head.write(b"\r\n")
+
+        field = RequestField(name="file", data=b"", filename=filename)
+        field.make_multipart()
+        head.write("--{}\r\n".format(boundary).encode("latin-1"))
+        head.write(field.render_headers().encode("utf-8"))
+
+        self._head = io.BytesIO(head.getvalue())
+        self._file = file
+        self._file_remaining = size
+        self._tail = io.BytesIO("\r\n--{}--\r\n".format(boundary).encode("latin-1"))
+        self._length = len(head.getvalue()) + size + len(self._tail.getvalue())
+        self._read = 0
+        self._progress = progress
+
+    def __len__(self):
+        return self._length
+
+    @classmethod
+    def for_file(cls, fields, file, progress=None):
+        """
+        Build the body for uploading `file`, or return None if the number of
+        bytes left to read from it can't be found without reading them.
+
+        :param fields: The fields to send before the file.
+        :type fields: `list` of `tuple`
+        :param file: A file handler pointing to the file to upload.
+        :param progress: Called as the body is read.
+        :type progress: callable
+        :rtype: :class:`_MultipartStream` or None
+        """
+        if isinstance(file, io.TextIOBase):
+            # Send the bytes of text files, as they are on disk.
+            file = getattr(file, "buffer", None)
+
+        try:
+            size = os.fstat(file.fileno()).st_size - file.tell()
+        except (AttributeError, OSError, ValueError):
+            return None
+
+        return cls(fields, file, _file_name(file), size, progress)
+
+    def read(self, size=-1):
+        """
+        Read up to `size` bytes of the body, or the rest of it if `size` is
+        negative.
+
+        :param size: The maximum number of bytes to read.
+        :type size: int
+        :rtype: bytes
+        """
+        if size is None or size < 0:
+            size = self._length - self._read
+
+        data = self._head.read(size)
+        if len(data) < size and self._file_remaining:
+            chunk = self._file.read(min(size - len(data), self._file_remaining))
+            self._file_remaining -= len(chunk)
+            if len(chunk) == 0:
+                raise IOError("File ended before the expected size was read.")
+            data += chunk
+        if len(data) < size and not self._file_remaining:
+            data += self._tail.read(size - len(data))
+
+        self._read += len(data)
+        if data and self._progress:
+            self._progress(self._read, self._length)
+        return data
@@ -18,6 +18,10 @@ from canvasapi.util import combine_kwargs, obj_or_id, obj_or_str
 
 
 class User(CanvasObject):
+    IDENTITY_MAPPED = True
+    ID_FIELDS = ("id",)
+    TIMESTAMP_FIELDS = ("created_at", "last_login")
+
     def __str__(self):
         return "{} ({})".format(self.name, self.id)
 
@@ -1,4 +1,11 @@
+import itertools
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from canvasapi.exceptions import RateLimitExceeded
 
 
 def is_multivalued(value):
@@ -46,56 +53,78 @@ def combine_kwargs(**kwargs):
 
     # Loop through all kwargs provided
     for kw, arg in kwargs.items():
-        if isinstance(arg, dict):
-            for k, v in arg.items():
-                for tup in flatten_kwarg(k, v):
-                    combined_kwargs.append(("{}{}".format(kw, tup[0]), tup[1]))
-        elif is_multivalued(arg):
-            for i in arg:
-                for tup in flatten_kwarg("", i):
-                    combined_kwargs.append(("{}{}".format(kw, tup[0]), tup[1]))
-        else:
-            combined_kwargs.append((str(kw), arg))
+        _flatten_into(combined_kwargs, str(kw), arg)
 
     return combined_kwargs
 
 
 def flatten_kwarg(key, obj):
     """
-    Recursive call to flatten sections of a kwarg to be combined
+    Flatten a section of a kwarg to be combined
 
     :param key: The partial keyword to add to the full keyword
     :type key: str
     :param obj: The object to translate into a kwarg. If the type is
         `dict`, the key parameter will be added to the keyword between
-        square brackets and recursively call this function. If the type
+        square brackets, followed by each of its keys in turn. If the type
         is `list`, or `tuple`, a set of empty brackets will be appended
-        to the keyword and recursively call this function. Otherwise,
-        the function returns with the final keyword and value.
+        to the keyword for each of its items. Otherwise, the function
+        returns with the final keyword and value.
 
     :returns: A list of tuples that represent flattened kwargs. The
         first element is a string representing the key. The second
         element is the value.
     :rtype: `list` of `tuple`
     """
-    if isinstance(obj, dict):
-        # Add the word (e.g. "[key]")
-        new_list = []
-        for k, v in obj.items():
-            for tup in flatten_kwarg(k, v):
-                new_list.append(("[{}]{}".format(key, tup[0]), tup[1]))
-        return new_list
-
-    elif is_multivalued(obj):
-        # Add empty brackets (i.e. "[]")
-        new_list = []
-        for i in obj:
-            for tup in flatten_kwarg(key + "][", i):
-                new_list.append((tup[0], tup[1]))
-        return new_list
-    else:
-        # Base case. Return list with tuple containing the value
-        return [("[{}]".format(str(key)), obj)]
+    flattened = []
+    _flatten_into(flattened, "[{}]".format(key), obj)
+    return flattened
+
+
+# Types that are always treated as a single value, checked before the more
+# general (and slower) `is_multivalued`.
+_SINGLE_VALUED_TYPES = frozenset((str, int, float, bool, type(None), bytes))
+
+
+def _dict_params(key, obj):
+    # The parameters for the items of a dict under `key`.
+    for k, v in obj.items():
+        yield f"{key}[{k}]", v
+
+
+def _flatten_into(flattened, key, obj):
+    """
+    Append the parameters for `obj` under `key` to `flattened`.
+
+    Nested dicts and lists are walked depth-first with one iterator per level,
+    rather than recursively building a list for each level and copying it into
+    the level above.
+
+    :param flattened: The list to append (key, value) tuples to.
+    :type flattened: list
+    :param key: The keyword for `obj`.
+    :type key: str
+    :param obj: The value to flatten.
+    """
+    append = flattened.append
+    stack = [iter(((key, obj),))]
+    while stack:
+        for key, value in stack[-1]:
+            value_type = type(value)
+            if value_type in _SINGLE_VALUED_TYPES:
+                append((key, value))
+            elif value_type is dict or isinstance(value, dict):
+                # Add the word (e.g. "[key]")
+                stack.append(_dict_params(key, value))
+                break
+            elif value_type is list or is_multivalued(value):
+                # Add empty brackets (i.e. "[]")
+                stack.append(zip(itertools.repeat(key + "[]"), value))
+                break
+            else:
+                append((key, value))
+        else:
+            stack.pop()
 
 
 def obj_or_id(parameter, param_name, object_types):
@@ -199,6 +228,39 @@ def file_or_path(file):
     return file, is_path
 
 
+def is_transient_error(error):
+    """
+    Whether a failed request may succeed if it is made again: the connection
+    failed or timed out, the rate limit was hit, or Canvas answered with a
+    server error.
+
+    :param error: The exception the request raised.
+    :type error: Exception
+    :rtype: bool
+    """
+    if isinstance(error, (requests.ConnectionError, requests.Timeout)):
+        return True
+    if isinstance(error, RateLimitExceeded):
+        return True
+    status_code = getattr(error, "status_code", None)
+    return status_code is not None and status_code >= 500
+
+
+def safe_filename(name):
+    """
+    Make a Canvas file or folder name safe to use as a single local path
+    component, so that it can't escape the directory it is saved in.
+
+    :param name: The name from Canvas.
+    :type name: str
+    :rtype: str
+    """
+    name = name.replace("/", "_").replace(os.sep, "_")
+    if name in ("", ".", ".."):
+        return "_"
+    return name
+
+
 def normalize_bool(val, param_name):
     """
     Normalize boolean-like strings to their corresponding boolean values.
@@ -242,3 +304,74 @@ def clean_headers(headers):
         cleaned_headers["Authorization"] = sanitized
 
     return cleaned_headers
+
+
+def wait_for_jobs(
+    jobs,
+    is_finished,
+    failure,
+    timeout,
+    interval,
+    backoff,
+    max_interval,
+    max_workers,
+    return_exceptions,
+):
+    """
+    Poll `jobs` with their `query` method until each is finished, yielding
+    each as soon as it is.
+
+    All the running jobs are polled in one loop, up to `max_workers` at a
+    time, and share a single delay between rounds. See
+    :func:`canvasapi.progress.wait_all` for the other options.
+
+    :param is_finished: Whether a job has stopped running.
+    :type is_finished: callable
+    :param failure: The exception to raise for a finished job, or None if it
+        succeeded.
+    :type failure: callable
+    :rtype: iterator
+    """
+    if max_workers < 1:
+        raise ValueError("max_workers must be at least 1.")
+
+    deadline = None if timeout is None else time.monotonic() + timeout
+    delay = interval
+    running = list(jobs)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        while True:
+            still_running = []
+            for job in running:
+                if not is_finished(job):
+                    still_running.append(job)
+                    continue
+
+                error = failure(job)
+                if error is None:
+                    yield job
+                elif return_exceptions:
+                    yield error
+                else:
+                    raise error
+
+            running = still_running
+            if not running:
+                return
+
+            pause = delay
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutError(
+                        "{} job(s) still running after {} seconds.".format(
+                            len(running), timeout
+                        )
+                    )
+                pause = min(pause, remaining)
+
+            time.sleep(pause)
+            delay = min(delay * backoff, max_interval)
+
+            # `query` updates each job in place.
+            list(executor.map(lambda job: job.query(), running))
@@ -1,23 +1,49 @@
-import inspect
+import ast
 import os
 import sys
 
 sys.path.insert(0, (os.path.join(sys.path[0], "..")))
 
-import canvasapi  # noqa
-
 exempt_files = ("__init__",)
 
 
+def find_imported_modules(path, module_name="__init__"):
+    # walk the imports reachable from `canvasapi.__init__`, including those made
+    # inside functions, as most resource modules are only imported on first use
+    found = set()
+    pending = [module_name]
+
+    while pending:
+        name = pending.pop()
+        if name in found:
+            continue
+        found.add(name)
+
+        with open(os.path.join(path, name + ".py")) as source:
+            tree = ast.parse(source.read())
+
+        for node in ast.walk(tree):
+            if isinstance(node, ast.ImportFrom):
+                modules = [node.module or ""]
+            elif isinstance(node, ast.Import):
+                modules = [alias.name for alias in node.names]
+            else:
+                continue
+
+            for module in modules:
+                package, _, submodule = module.partition(".")
+                if package == "canvasapi" and submodule:
+                    pending.append(submodule.split(".")[0])
+
+    return found
+
+
 def find_missing_modules():
-    # get all modules visile to inspect from `canvasapi.__init__`
-    module_names = [
-        module_name
-        for module_name, module in inspect.getmembers(canvasapi, inspect.ismodule)
-    ]
+    # get all modules imported (even indirectly) from `canvasapi.__init__`
+    path = "canvasapi"
+    module_names = find_imported_modules(path)
 
     # get all .py files in canvasapi dir (without .py extension)
-    path = "canvasapi"
     filenames = [fname[:-3] for fname in os.listdir(path) if fname.endswith(".py")]
 
     missing_modules = list()
@@ -40,7 +66,7 @@ if __name__ == "__main__":
     missing_module_str = ", ".join(missing_modules)
 
     if missing_modules:
-        print(f"Missing {num_missing} modules from inspect. 💥")
+        print(f"Missing {num_missing} modules from imports. 💥")
         for module in missing_modules:
             print(f"  - {module}")
         print("Ensure the above modules are imported (even indirectly) to __init__")
@@ -3,9 +3,9 @@
 coverage run -m unittest discover
 coverage report
 coverage html
-black --check canvasapi tests
-isort --check canvasapi tests
-flake8 canvasapi tests
+black --check canvasapi tests benchmarks
+isort --check canvasapi tests benchmarks
+flake8 canvasapi tests benchmarks
 mdl . .github
 python scripts/find_missing_modules.py
 python scripts/alphabetic.py
@@ -1,5 +1,11 @@
 import datetime
+import io
+import os
+import shutil
+import tempfile
 import unittest
+import zipfile
+from unittest.mock import patch
 
 import pytz
 import requests_mock
@@ -21,7 +27,12 @@ from canvasapi.course import Course
 from canvasapi.course_event import CourseEvent
 from canvasapi.enrollment import Enrollment
 from canvasapi.enrollment_term import EnrollmentTerm
-from canvasapi.exceptions import CanvasException, RequiredFieldMissing
+from canvasapi.exceptions import (
+    CanvasException,
+    ReportFailed,
+    RequiredFieldMissing,
+    ResourceDoesNotExist,
+)
 from canvasapi.external_tool import ExternalTool
 from canvasapi.feature import Feature, FeatureFlag
 from canvasapi.grading_period import GradingPeriod
@@ -579,6 +590,24 @@ class TestAccount(unittest.TestCase):
         self.assertTrue(hasattr(response, "id"))
         self.assertEqual(response.id, 10)
 
+    # create_delta_sis_import()
+    def test_create_delta_sis_import(self, m):
+        with tempfile.TemporaryDirectory() as directory:
+            users = os.path.join(directory, "users.csv")
+            with open(users, "w") as csv_file:
+                csv_file.write("user_id,name\nu1,Ada\n")
+            snapshots = os.path.join(directory, "snapshots")
+            os.makedirs(snapshots)
+            shutil.copyfile(users, os.path.join(snapshots, "users.csv"))
+
+            sis_import, changes = self.account.create_delta_sis_import(
+                [users], snapshots
+            )
+
+        self.assertIsNone(sis_import)
+        self.assertEqual(changes, {"users": {"added": 0, "updated": 0, "deleted": 0}})
+        self.assertFalse(m.called)
+
     # create_enrollment_term()
     def test_create_enrollment_term(self, m):
         register_uris({"enrollment_term": ["create_enrollment_term"]}, m)
@@ -773,6 +802,72 @@ class TestAccount(unittest.TestCase):
         )
         self.assertIsInstance(authentication_provider_by_obj, AuthenticationProvider)
 
+    # run_reports()
+    @patch("canvasapi.util.time.sleep")
+    def test_run_reports(self, m, sleep):
+        for report_type, report_id in (("grade_export_csv", 7), ("sis_export_csv", 8)):
+            m.register_uri(
+                "POST",
+                settings.BASE_URL_WITH_VERSION
+                + "accounts/1/reports/{}".format(report_type),
+                json={"id": report_id, "report": report_type, "status": "created"},
+            )
+        m.register_uri(
+            "GET",
+            settings.BASE_URL_WITH_VERSION + "accounts/1/reports/grade_export_csv/7",
+            [
+                {"json": {"id": 7, "report": "grade_export_csv", "status": "running"}},
+                {"json": {"id": 7, "report": "grade_export_csv", "status": "complete"}},
+            ],
+        )
+        m.register_uri(
+            "GET",
+            settings.BASE_URL_WITH_VERSION + "accounts/1/reports/sis_export_csv/8",
+            json={"id": 8, "report": "sis_export_csv", "status": "error"},
+        )
+
+        reports = list(
+            self.account.run_reports(
+                ["grade_export_csv", ("sis_export_csv", {"users": True})],
+                return_exceptions=True,
+            )
+        )
+
+        self.assertIsInstance(reports[0], ReportFailed)
+        self.assertEqual(reports[0].report.id, 8)
+        self.assertIsInstance(reports[1], AccountReport)
+        self.assertEqual(reports[1].status, "complete")
+        self.assertEqual(reports[1].account_id, 1)
+        self.assertEqual(sleep.call_count, 2)
+        create = [r for r in m.request_history if r.path.endswith("sis_export_csv")]
+        self.assertEqual(create[0].body, "parameters%5Busers%5D=true")
+
+    @patch("canvasapi.util.time.sleep")
+    def test_run_reports_create_failed(self, m, sleep):
+        m.register_uri(
+            "POST",
+            settings.BASE_URL_WITH_VERSION + "accounts/1/reports/grade_export_csv",
+            json={"id": 7, "report": "grade_export_csv", "status": "complete"},
+        )
+        m.register_uri(
+            "POST",
+            settings.BASE_URL_WITH_VERSION + "accounts/1/reports/missing_csv",
+            status_code=404,
+            json={"errors": [{"message": "The specified resource does not exist."}]},
+        )
+
+        reports = list(
+            self.account.run_reports(
+                ["missing_csv", "grade_export_csv"], return_exceptions=True
+            )
+        )
+
+        self.assertIsInstance(reports[0], ResourceDoesNotExist)
+        self.assertEqual(reports[1].id, 7)
+
+        with self.assertRaises(ResourceDoesNotExist):
+            self.account.run_reports(["missing_csv", "grade_export_csv"])
+
     # show_account_auth_settings()
     def test_show_account_auth_settings(self, m):
         register_uris({"account": ["show_account_auth_settings"]}, m)
@@ -1429,3 +1524,103 @@ class TestAccountReport(unittest.TestCase):
 
         self.assertIsInstance(feature_flag, FeatureFlag)
         self.assertEqual(feature_flag.feature, "epub_export")
+
+    def complete_report(self, m, content, display_name="report.csv"):
+        m.register_uri("GET", "https://example.com/files/5/download", content=content)
+        return AccountReport(
+            self.canvas._Canvas__requester,
+            {
+                "id": 1,
+                "account_id": 1,
+                "report": "provisioning_csv",
+                "status": "complete",
+                "attachment": {
+                    "id": 5,
+                    "display_name": display_name,
+                    "size": len(content),
+                    "url": "https://example.com/files/5/download",
+                },
+            },
+        )
+
+    # download()
+    def test_download(self, m):
+        report = self.complete_report(m, b"id,name\n1,Ada\n")
+        file_out = io.BytesIO()
+
+        report.download(file_out)
+
+        self.assertEqual(file_out.getvalue(), b"id,name\n1,Ada\n")
+
+    def test_download_no_file(self, m):
+        with self.assertRaises(CanvasException):
+            self.AccountReport.download(io.BytesIO())
+
+    # iter_rows()
+    def test_iter_rows(self, m):
+        content = '\ufeffid,name\r\n1,Ada\r\n2,"Grace\r\nHopper"\r\n'.encode("utf-8")
+        report = self.complete_report(m, content)
+
+        rows = report.iter_rows(chunk_size=4)
+
+        self.assertEqual(next(rows), {"id": "1", "name": "Ada"})
+        self.assertEqual(next(rows), {"id": "2", "name": "Grace\r\nHopper"})
+        self.assertEqual(list(rows), [])
+        self.assertTrue(m.last_request.stream)
+
+    def test_iter_rows_closed_early(self, m):
+        report = self.complete_report(m, b"id,name\n1,Ada\n2,Grace\n")
+
+        with patch("requests.Response.close") as close:
+            rows = report.iter_rows()
+            self.assertEqual(next(rows), {"id": "1", "name": "Ada"})
+            close.assert_not_called()
+
+            rows.close()
+            close.assert_called_once()
+
+    def test_iter_rows_zip(self, m):
+        archive = io.BytesIO()
+        with zipfile.ZipFile(archive, "w") as zip_file:
+            zip_file.writestr("users.csv", "user_id,name\nu1,Ada\n")
+            zip_file.writestr("courses.csv", "course_id\nc1\n")
+        report = self.complete_report(m, archive.getvalue(), "provisioning.zip")
+
+        rows = list(report.iter_rows(member="courses.csv"))
+        self.assertEqual(rows, [{"course_id": "c1"}])
+
+        with self.assertRaises(ValueError):
+            list(report.iter_rows())
+
+    # query()
+    def test_query(self, m):
+        m.register_uri(
+            "GET",
+            settings.BASE_URL_WITH_VERSION + "accounts/1/reports/zero_activity_csv/1",
+            json={"id": 1, "report": "zero_activity_csv", "status": "running"},
+        )
+        self.AccountReport.account_id = 1
+
+        response = self.AccountReport.query()
+
+        self.assertIsInstance(response, AccountReport)
+        self.assertEqual(self.AccountReport.status, "running")
+
+    # wait()
+    @patch("canvasapi.util.time.sleep")
+    def test_wait(self, m, sleep):
+        m.register_uri(
+            "GET",
+            settings.BASE_URL_WITH_VERSION + "accounts/1/reports/zero_activity_csv/1",
+            [
+                {"json": {"id": 1, "report": "zero_activity_csv", "status": "running"}},
+                {"json": {"id": 1, "report": "zero_activity_csv", "status": "aborted"}},
+            ],
+        )
+        self.AccountReport.account_id = 1
+
+        with self.assertRaises(ReportFailed) as context:
+            self.AccountReport.wait(interval=2)
+
+        self.assertIs(context.exception.report, self.AccountReport)
+        self.assertEqual([call.args[0] for call in sleep.call_args_list], [2, 3])
@@ -1,6 +1,8 @@
+import io
 import unittest
 import uuid
 from pathlib import Path
+from unittest.mock import patch
 
 import requests_mock
 
@@ -43,6 +45,9 @@ class TestAssignment(unittest.TestCase):
         self.assertEqual(len(assignment.overrides), 1)
         self.assertIsInstance(assignment.overrides[0], AssignmentOverride)
 
+    def test__init__no_overrides(self, m):
+        self.assertFalse(hasattr(self.assignment, "overrides"))
+
     # create_override()
     def test_create_override(self, m):
         register_uris({"assignment": ["create_override"]}, m)
@@ -65,6 +70,54 @@ class TestAssignment(unittest.TestCase):
 
         self.assertIsInstance(deleted_assignment, Assignment)
 
+    # download_attachments()
+    def test_download_attachments(self, m):
+        m.register_uri(
+            "GET",
+            settings.BASE_URL_WITH_VERSION + "courses/1/assignments/1/submissions",
+            json=[
+                {
+                    "id": 1,
+                    "assignment_id": 1,
+                    "user_id": 2,
+                    "submission_history": [
+                        {
+                            "attempt": 1,
+                            "attachments": [
+                                {
+                                    "id": 3,
+                                    "display_name": "essay.pdf",
+                                    "url": "https://example.com/files/3/download",
+                                }
+                            ],
+                        }
+                    ],
+                }
+            ],
+        )
+        m.register_uri("GET", "https://example.com/files/3/download", content=b"essay")
+        archive = io.BytesIO()
+
+        summary = self.assignment.download_attachments(archive, include_history=True)
+
+        self.assertEqual(summary["downloaded"], ["1/2/1/3-essay.pdf"])
+        listing = m.request_history[0]
+        self.assertEqual(listing.qs["include[]"], ["submission_history"])
+
+    def test_download_attachments_kwargs(self, m):
+        m.register_uri(
+            "GET",
+            settings.BASE_URL_WITH_VERSION + "courses/1/assignments/1/submissions",
+            json=[],
+        )
+
+        summary = self.assignment.download_attachments(
+            io.BytesIO(), include_history=True, include="user"
+        )
+
+        self.assertEqual(summary["downloaded"], [])
+        self.assertEqual(m.last_request.qs["include[]"], ["user", "submission_history"])
+
     # edit()
     def test_edit_assignment(self, m):
         register_uris({"assignment": ["edit_assignment"]}, m)
@@ -299,6 +352,34 @@ class TestAssignment(unittest.TestCase):
         progress = progress.query()
         self.assertTrue(progress.context_type == "Course")
 
+    # submissions_bulk_update_chunked()
+    @patch("canvasapi.util.time.sleep")
+    def test_submissions_bulk_update_chunked(self, m, sleep):
+        register_uris({"assignment": ["update_submissions"]}, m)
+        register_uris({"progress": ["course_progress"]}, m)
+
+        result = self.assignment.submissions_bulk_update_chunked(
+            {
+                "1": {"posted_grade": 97},
+                "2": {"posted_grade": 98},
+                "3": {"posted_grade": 99},
+            },
+            chunk_size=2,
+        )
+
+        self.assertEqual(len(result["completed"]), 2)
+        self.assertEqual(result["failed"], [])
+        # Grades are keyed by student only, as the assignment is in the URL.
+        bodies = sorted(r.text for r in m.request_history if r.method == "POST")
+        self.assertEqual(
+            bodies,
+            [
+                "grade_data%5B1%5D%5Bposted_grade%5D=97"
+                "&grade_data%5B2%5D%5Bposted_grade%5D=98",
+                "grade_data%5B3%5D%5Bposted_grade%5D=99",
+            ],
+        )
+
     # upload_to_submission()
     def test_upload_to_submission_self(self, m):
         register_uris({"assignment": ["upload", "upload_final"]}, m)
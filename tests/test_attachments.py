@@ -0,0 +1,167 @@
+import io
+import os
+import tempfile
+import unittest
+import zipfile
+
+import requests_mock
+
+from canvasapi import Canvas
+from canvasapi.attachments import download_attachments
+from canvasapi.submission import Submission
+from tests import settings
+
+
+def attachment(file_id, name, content):
+    return {
+        "id": file_id,
+        "display_name": name,
+        "size": len(content),
+        "url": "https://example.com/files/{}/download".format(file_id),
+    }
+
+
+@requests_mock.Mocker()
+class TestDownloadAttachments(unittest.TestCase):
+    def setUp(self):
+        self.canvas = Canvas(settings.BASE_URL, settings.API_KEY)
+        self.requester = self.canvas._Canvas__requester
+
+        self.contents = {10: b"essay", 11: b"figure", 12: b"first draft"}
+        self.submissions = [
+            Submission(
+                self.requester,
+                {
+                    "id": 1,
+                    "assignment_id": 5,
+                    "user_id": 100,
+                    "attempt": 2,
+                    "attachments": [
+                        attachment(10, "essay.pdf", b"essay"),
+                        attachment(11, "figure.png", b"figure"),
+                    ],
+                    "submission_history": [
+                        {
+                            "attempt": 1,
+                            "attachments": [
+                                attachment(12, "essay.pdf", b"first draft")
+                            ],
+                        },
+                        {
+                            "attempt": 2,
+                            "attachments": [
+                                attachment(10, "essay.pdf", b"essay"),
+                                attachment(11, "figure.png", b"figure"),
+                            ],
+                        },
+                    ],
+                },
+            ),
+            Submission(self.requester, {"id": 2, "assignment_id": 5, "user_id": 101}),
+        ]
+
+    def register(self, m):
+        for file_id, content in self.contents.items():
+            m.register_uri(
+                "GET",
+                "https://example.com/files/{}/download".format(file_id),
+                content=content,
+            )
+
+    def test_download_attachments(self, m):
+        self.register(m)
+
+        with tempfile.TemporaryDirectory() as directory:
+            summary = download_attachments(iter(self.submissions), directory)
+
+            self.assertEqual(
+                summary["downloaded"], ["5/100/10-essay.pdf", "5/100/11-figure.png"]
+            )
+            with open(os.path.join(directory, "5", "100", "10-essay.pdf"), "rb") as f:
+                self.assertEqual(f.read(), b"essay")
+            self.assertFalse(
+                os.path.exists(os.path.join(directory, "5", "100", "10-essay.pdf.part"))
+            )
+
+            # Complete files are skipped on the next run.
+            m.reset_mock()
+            summary = download_attachments(self.submissions, directory)
+            self.assertEqual(len(summary["skipped"]), 2)
+            self.assertFalse(m.called)
+
+    def test_download_attachments_resume(self, m):
+        self.register(m)
+
+        def partial(request, context):
+            self.assertEqual(request.headers["Range"], "bytes=2-")
+            context.status_code = 206
+            context.headers["Content-Range"] = "bytes 2-4/5"
+            return b"say"
+
+        m.register_uri("GET", "https://example.com/files/10/download", content=partial)
+
+        with tempfile.TemporaryDirectory() as directory:
+            os.makedirs(os.path.join(directory, "5", "100"))
+            with open(
+                os.path.join(directory, "5", "100", "10-essay.pdf.part"), "wb"
+            ) as f:
+                f.write(b"es")
+
+            summary = download_attachments(self.submissions, directory)
+
+            self.assertEqual(len(summary["downloaded"]), 2)
+            with open(os.path.join(directory, "5", "100", "10-essay.pdf"), "rb") as f:
+                self.assertEqual(f.read(), b"essay")
+
+    def test_download_attachments_history(self, m):
+        self.register(m)
+
+        with tempfile.TemporaryDirectory() as directory:
+            summary = download_attachments(
+                self.submissions, directory, include_history=True
+            )
+
+            self.assertEqual(
+                summary["downloaded"],
+                [
+                    "5/100/1/12-essay.pdf",
+                    "5/100/2/10-essay.pdf",
+                    "5/100/2/11-figure.png",
+                ],
+            )
+
+    def test_download_attachments_zip(self, m):
+        self.register(m)
+        archive = io.BytesIO()
+
+        summary = download_attachments(
+            self.submissions, archive, max_workers=1, include_history=True
+        )
+
+        self.assertEqual(len(summary["downloaded"]), 3)
+        with zipfile.ZipFile(archive) as zip_file:
+            self.assertEqual(
+                zip_file.namelist(),
+                [
+                    "5/100/1/12-essay.pdf",
+                    "5/100/2/10-essay.pdf",
+                    "5/100/2/11-figure.png",
+                ],
+            )
+            self.assertEqual(zip_file.read("5/100/1/12-essay.pdf"), b"first draft")
+
+    def test_download_attachments_failed(self, m):
+        self.register(m)
+        m.register_uri("GET", "https://example.com/files/11/download", status_code=500)
+        archive = io.BytesIO()
+
+        summary = download_attachments(self.submissions, archive)
+
+        self.assertEqual(summary["downloaded"], ["5/100/10-essay.pdf"])
+        self.assertEqual(summary["failed"][0][0], "5/100/11-figure.png")
+        with zipfile.ZipFile(archive) as zip_file:
+            self.assertEqual(zip_file.namelist(), ["5/100/10-essay.pdf"])
+
+    def test_download_attachments_max_workers(self, m):
+        with self.assertRaises(ValueError):
+            download_attachments(self.submissions, io.BytesIO(), max_workers=0)
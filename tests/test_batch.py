@@ -0,0 +1,166 @@
+import unittest
+from unittest.mock import patch
+
+from canvasapi import Canvas
+from canvasapi.batch import (
+    halve_grade_data,
+    run_in_chunks,
+    split_evenly,
+    split_grade_data,
+)
+from canvasapi.exceptions import (
+    BadRequest,
+    CanvasException,
+    ProgressFailed,
+    RequestEntityTooLarge,
+)
+from canvasapi.progress import Progress
+from tests import settings
+
+
+@patch("canvasapi.batch.time.sleep")
+class TestRunInChunks(unittest.TestCase):
+    def setUp(self):
+        self.canvas = Canvas(settings.BASE_URL, settings.API_KEY)
+        self.requester = self.canvas._Canvas__requester
+        self.attempts = {}
+
+    def submit(self, outcomes):
+        """
+        Build a submit function where `outcomes` maps each chunk to what its
+        attempts return in turn: a job state, or an exception to raise.
+        """
+
+        def submit(chunk):
+            attempt = self.attempts.get(chunk, 0)
+            self.attempts[chunk] = attempt + 1
+            outcome = outcomes[chunk][min(attempt, len(outcomes[chunk]) - 1)]
+            if isinstance(outcome, Exception):
+                raise outcome
+            return Progress(self.requester, {"id": chunk, "workflow_state": outcome})
+
+        return submit
+
+    def test_run_in_chunks(self, sleep):
+        result = run_in_chunks(
+            self.submit({1: ["completed"], 2: ["completed"]}), [1, 2]
+        )
+
+        self.assertEqual(sorted(p.id for p in result["completed"]), [1, 2])
+        self.assertEqual(result["failed"], [])
+        self.assertFalse(sleep.called)
+
+    def test_run_in_chunks_retries(self, sleep):
+        submit = self.submit(
+            {
+                1: ["failed", "completed"],
+                2: [
+                    CanvasException("Server error", status_code=500),
+                    "failed",
+                    "completed",
+                ],
+                3: ["completed"],
+            }
+        )
+
+        result = run_in_chunks(submit, [1, 2, 3], interval=2, backoff=3)
+
+        self.assertEqual(sorted(p.id for p in result["completed"]), [1, 2, 3])
+        self.assertEqual(self.attempts, {1: 2, 2: 3, 3: 1})
+        self.assertEqual([call.args[0] for call in sleep.call_args_list], [2, 6])
+
+    def test_run_in_chunks_failed(self, sleep):
+        submit = self.submit(
+            {
+                1: ["failed"],
+                2: [BadRequest("Bad grade")],
+                3: ["completed"],
+                4: [CanvasException("Gone", status_code=410)],
+            }
+        )
+
+        result = run_in_chunks(submit, [1, 2, 3, 4], retries=1)
+
+        self.assertEqual([p.id for p in result["completed"]], [3])
+        failed = dict(result["failed"])
+        self.assertIsInstance(failed[1], ProgressFailed)
+        self.assertIsInstance(failed[2], BadRequest)
+        self.assertEqual(failed[4].status_code, 410)
+        # Client errors aren't retried.
+        self.assertEqual(self.attempts, {1: 2, 2: 1, 3: 1, 4: 1})
+
+    def test_run_in_chunks_too_large(self, sleep):
+        too_large = RequestEntityTooLarge("Too large")
+        submit = self.submit(
+            {
+                (1, 2, 3): [too_large],
+                (1, 2): [too_large],
+                (3,): ["completed"],
+                (1,): ["completed"],
+                (2,): ["completed"],
+            }
+        )
+
+        result = run_in_chunks(
+            submit,
+            [(1, 2, 3)],
+            split=lambda chunk: [
+                tuple(part) for part in split_evenly(chunk, (len(chunk) + 1) // 2)
+            ],
+        )
+
+        self.assertEqual(sorted(p.id for p in result["completed"]), [(1,), (2,), (3,)])
+        self.assertFalse(sleep.called)
+
+    def test_run_in_chunks_too_large_unsplittable(self, sleep):
+        submit = self.submit({1: [RequestEntityTooLarge("Too large")]})
+
+        result = run_in_chunks(submit, [1])
+
+        self.assertEqual(result["completed"], [])
+        self.assertIsInstance(result["failed"][0][1], RequestEntityTooLarge)
+        self.assertEqual(self.attempts, {1: 1})
+
+    def test_run_in_chunks_max_workers(self, sleep):
+        with self.assertRaises(ValueError):
+            run_in_chunks(self.submit({}), [], max_workers=0)
+
+
+class TestSplit(unittest.TestCase):
+    def test_halve_grade_data(self):
+        grade_data = {"1": {"10": 1, "11": 2}, "2": {"10": 3}}
+
+        self.assertEqual(
+            halve_grade_data(grade_data),
+            [{"1": {"10": 1, "11": 2}}, {"2": {"10": 3}}],
+        )
+        self.assertEqual(halve_grade_data({"10": 1}, by_assignment=False), [{"10": 1}])
+
+    def test_split_evenly(self):
+        chunks = split_evenly(list(range(1001)), 500)
+
+        self.assertEqual([len(chunk) for chunk in chunks], [334, 334, 333])
+        self.assertEqual(sum(chunks, []), list(range(1001)))
+        self.assertEqual(split_evenly([], 500), [])
+
+    def test_split_evenly_chunk_size(self):
+        with self.assertRaises(ValueError):
+            split_evenly([1], 0)
+
+    def test_split_grade_data(self):
+        grade_data = {
+            "1": {"10": {"posted_grade": 90}, "11": {"posted_grade": 91}},
+            "2": {"10": {"posted_grade": 80}},
+        }
+
+        self.assertEqual(
+            split_grade_data(grade_data, 2),
+            [
+                {"1": {"10": {"posted_grade": 90}, "11": {"posted_grade": 91}}},
+                {"2": {"10": {"posted_grade": 80}}},
+            ],
+        )
+        self.assertEqual(
+            split_grade_data({"10": 1, "11": 2, "12": 3}, 2, by_assignment=False),
+            [{"10": 1, "11": 2}, {"12": 3}],
+        )
@@ -1,3 +1,5 @@
+import subprocess
+import sys
 import unittest
 import warnings
 from datetime import datetime
@@ -5,6 +7,7 @@ from datetime import datetime
 import pytz
 import requests_mock
 
+import canvasapi
 from canvasapi import Canvas
 from canvasapi.account import Account
 from canvasapi.account_calendar import AccountCalendar
@@ -16,7 +19,11 @@ from canvasapi.course import Course, CourseNickname
 from canvasapi.course_epub_export import CourseEpubExport
 from canvasapi.discussion_topic import DiscussionTopic
 from canvasapi.eportfolio import EPortfolio
-from canvasapi.exceptions import RequiredFieldMissing, ResourceDoesNotExist
+from canvasapi.exceptions import (
+    RequestEntityTooLarge,
+    RequiredFieldMissing,
+    ResourceDoesNotExist,
+)
 from canvasapi.file import File
 from canvasapi.group import Group, GroupCategory
 from canvasapi.jwt import JWT
@@ -84,6 +91,64 @@ class TestCanvas(unittest.TestCase):
             client._Canvas__requester.base_url, settings.BASE_URL_WITH_VERSION
         )
 
+    def test_init_compact_objects(self, m):
+        canvas = Canvas(settings.BASE_URL, settings.API_KEY, compact_objects=True)
+
+        self.assertTrue(canvas._Canvas__requester.compact_objects)
+        self.assertFalse(self.canvas._Canvas__requester.compact_objects)
+
+    def test_init_imports_lazily(self, m):
+        # Resource modules are imported on first use, keeping cold starts short.
+        code = "import canvasapi; canvasapi.Canvas('{}', '{}')".format(
+            settings.BASE_URL, settings.API_KEY
+        )
+        output = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", code],
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stderr
+
+        imported = {
+            line.split("|")[-1].strip()
+            for line in output.splitlines()
+            if line.startswith("import time:")
+        }
+        self.assertEqual(
+            {name for name in imported if name.startswith("canvasapi")},
+            {
+                "canvasapi",
+                "canvasapi.canvas",
+                "canvasapi.exceptions",
+                "canvasapi.paginated_list",
+                "canvasapi.requester",
+                "canvasapi.util",
+            },
+        )
+        self.assertFalse(imported & {"arrow", "pytz"})
+
+    def test_init_submodule_attributes(self, m):
+        # Submodules are still reachable from the package once imported lazily.
+        code = (
+            "import canvasapi, sys; "
+            "assert 'canvasapi.course' not in sys.modules; "
+            "print(canvasapi.course.Course.__name__)"
+        )
+        output = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, check=True, text=True
+        ).stdout
+        self.assertEqual(output.strip(), "Course")
+
+        with self.assertRaises(AttributeError):
+            canvasapi.nonexistent
+
+    def test_init_identity_map(self, m):
+        register_uris({"course": ["get_by_id"]}, m)
+        canvas = Canvas(settings.BASE_URL, settings.API_KEY, identity_map=True)
+
+        self.assertIs(canvas.get_course(1), canvas.get_course(1))
+        self.assertIsNot(self.canvas.get_course(1), self.canvas.get_course(1))
+
     # create_account()
     def test_create_account(self, m):
         register_uris({"account": ["create"]}, m)
@@ -268,6 +333,80 @@ class TestCanvas(unittest.TestCase):
         with self.assertRaises(ResourceDoesNotExist):
             self.canvas.get_course(settings.INVALID_ID)
 
+    # course()
+    def test_course(self, m):
+        register_uris(
+            {"course": ["get_all_assignments", "get_all_assignments2", "get_by_id"]},
+            m,
+        )
+
+        course = self.canvas.course(1)
+        self.assertIsInstance(course, Course)
+        self.assertEqual(course.id, 1)
+        self.assertFalse(m.called)
+
+        assignments = list(course.get_assignments())
+        self.assertEqual(len(assignments), 4)
+        self.assertNotIn(
+            "/api/v1/courses/1", [request.path for request in m.request_history]
+        )
+
+        self.assertEqual(course.name, "Test Course 1234")
+        self.assertEqual(course.name, "Test Course 1234")
+        self.assertEqual(m.call_count, 3)
+        self.assertFalse(hasattr(course, "nonexistent"))
+        self.assertEqual(m.call_count, 3)
+
+    def test_course_identity_map(self, m):
+        register_uris({"course": ["get_by_id"]}, m)
+        canvas = Canvas(settings.BASE_URL, settings.API_KEY, identity_map=True)
+
+        # A stub that is fetched in full is no longer loaded again.
+        stub = canvas.course(1)
+        self.assertIs(canvas.get_course(1), stub)
+        self.assertFalse(hasattr(stub, "nonexistent"))
+        self.assertEqual(m.call_count, 1)
+
+        # A live object isn't turned back into a stub.
+        self.assertIs(canvas.course(1), stub)
+        self.assertFalse(hasattr(stub, "nonexistent"))
+        self.assertEqual(stub.name, "Test Course 1234")
+        self.assertEqual(m.call_count, 1)
+
+    def test_course_kwargs(self, m):
+        register_uris({"course": ["get_by_id"]}, m)
+
+        course = self.canvas.course(1, include=["term"])
+        self.assertFalse(m.called)
+
+        self.assertEqual(course.name, "Test Course 1234")
+        self.assertEqual(m.last_request.qs, {"include[]": ["term"]})
+
+    def test_course_by_obj(self, m):
+        course = self.canvas.course(self.canvas.course(1))
+
+        self.assertIsInstance(course, Course)
+        self.assertEqual(course.id, 1)
+        self.assertFalse(m.called)
+
+    def test_course_sis_id(self, m):
+        register_uris({"course": ["get_by_sis_id"]}, m)
+
+        course = self.canvas.course("test-sis-id", use_sis_id=True)
+        self.assertEqual(course.id, "sis_course_id:test-sis-id")
+        self.assertFalse(m.called)
+
+        self.assertEqual(course.name, "SIS Course")
+        self.assertEqual(course.id, 1)
+
+    def test_course_invalid(self, m):
+        register_uris({"generic": ["not_found"]}, m)
+
+        course = self.canvas.course(settings.INVALID_ID)
+
+        with self.assertRaises(ResourceDoesNotExist):
+            course.name
+
     # get_user()
     def test_get_user(self, m):
         register_uris({"user": ["get_by_id"]}, m)
@@ -302,6 +441,67 @@ class TestCanvas(unittest.TestCase):
         with self.assertRaises(ResourceDoesNotExist):
             self.canvas.get_user(settings.INVALID_ID)
 
+    # user()
+    def test_user(self, m):
+        register_uris({"user": ["courses", "courses_p2", "get_by_id"]}, m)
+
+        user = self.canvas.user(1)
+        self.assertIsInstance(user, User)
+        self.assertFalse(m.called)
+
+        courses = list(user.get_courses())
+        self.assertEqual(len(courses), 4)
+        self.assertEqual(m.call_count, 2)
+
+        self.assertTrue(hasattr(user, "name"))
+        self.assertEqual(m.call_count, 3)
+
+    def test_user_by_id_type(self, m):
+        user = self.canvas.user("jdoe", "sis_login_id")
+
+        self.assertEqual(user.id, "sis_login_id:jdoe")
+        self.assertFalse(m.called)
+
+    def test_user_self(self, m):
+        user = self.canvas.user("self")
+
+        self.assertEqual(user.id, "self")
+        self.assertFalse(m.called)
+
+    # account(), group() and section()
+    def test_account_group_section(self, m):
+        register_uris(
+            {
+                "account": ["get_by_id"],
+                "group": ["get_by_id"],
+                "section": ["get_by_id"],
+            },
+            m,
+        )
+
+        account = self.canvas.account(1)
+        group = self.canvas.group(1)
+        section = self.canvas.section(1)
+        self.assertIsInstance(account, Account)
+        self.assertIsInstance(group, Group)
+        self.assertIsInstance(section, Section)
+        self.assertFalse(m.called)
+
+        self.assertTrue(hasattr(account, "name"))
+        self.assertTrue(hasattr(group, "name"))
+        self.assertTrue(hasattr(section, "name"))
+        self.assertEqual(m.call_count, 3)
+
+    def test_account_group_section_sis_id(self, m):
+        self.assertEqual(
+            self.canvas.account("a", use_sis_id=True).id, "sis_account_id:a"
+        )
+        self.assertEqual(self.canvas.group("g", use_sis_id=True).id, "sis_group_id:g")
+        self.assertEqual(
+            self.canvas.section("s", use_sis_id=True).id, "sis_section_id:s"
+        )
+        self.assertFalse(m.called)
+
     # get_courses()
     def test_get_courses(self, m):
         register_uris({"course": ["multiple", "multiple_page_2"]}, m)
@@ -568,6 +768,53 @@ class TestCanvas(unittest.TestCase):
                 event=this_event, conversation_ids=conversation_ids
             )
 
+    # conversations_batch_update_chunked()
+    def test_conversations_batch_update_chunked(self, m):
+        register_uris({"conversation": ["batch_update"]}, m)
+        conversations = [
+            Conversation(self.canvas._Canvas__requester, {"id": 1}),
+            "2",
+        ] + list(range(3, 1002))
+
+        result = self.canvas.conversations_batch_update_chunked(
+            conversations, "archive"
+        )
+
+        self.assertEqual(len(result["completed"]), 3)
+        self.assertIsInstance(result["completed"][0], Progress)
+        self.assertEqual(result["failed"], [])
+        bodies = [
+            request.body for request in m.request_history if request.method == "PUT"
+        ]
+        self.assertEqual(
+            sorted(body.count("conversation_ids") for body in bodies), [333, 334, 334]
+        )
+        self.assertTrue(any("conversation_ids%5B%5D=1&" in body for body in bodies))
+        self.assertTrue(any("conversation_ids%5B%5D=2&" in body for body in bodies))
+
+    def test_conversations_batch_update_chunked_too_large(self, m):
+        register_uris({"conversation": ["batch_update_too_large"]}, m)
+
+        result = self.canvas.conversations_batch_update_chunked([1, 2, 3], "archive")
+
+        # A chunk that's too large is split in half, down to single IDs.
+        self.assertEqual(result["completed"], [])
+        self.assertEqual(
+            sorted(chunk for chunk, _ in result["failed"]), [[1], [2], [3]]
+        )
+        self.assertIsInstance(result["failed"][0][1], RequestEntityTooLarge)
+        self.assertEqual(m.call_count, 5)
+
+    def test_conversations_batch_update_chunked_fail_on_event(self, m):
+        with self.assertRaises(ValueError):
+            self.canvas.conversations_batch_update_chunked([1, 2], "nope")
+
+    def test_conversations_batch_update_chunked_fail_on_chunk_size(self, m):
+        with self.assertRaises(ValueError):
+            self.canvas.conversations_batch_update_chunked(
+                [1, 2], "archive", chunk_size=501
+            )
+
     # create_calendar_event()
     def test_create_calendar_event(self, m):
         register_uris({"calendar_event": ["create_calendar_event"]}, m)
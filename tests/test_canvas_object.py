@@ -1,11 +1,19 @@
+import copy
+import gc
+import pickle
 import unittest
 from datetime import datetime
+from unittest.mock import patch
 
 import pytz
 import requests_mock
 
-from canvasapi.canvas_object import CanvasObject
+from canvasapi.canvas_object import CanvasObject, DateField
+from canvasapi.course import Course
+from canvasapi.file import File
+from canvasapi.quiz import QuizSubmissionQuestion
 from canvasapi.requester import Requester
+from canvasapi.submission import Submission
 from tests import settings
 
 
@@ -62,3 +70,362 @@ class TestCanvasObject(unittest.TestCase):
         self.assertFalse(hasattr(self.canvas_object, "end_at_date"))
         self.assertTrue(hasattr(self.canvas_object, "start_at"))
         self.assertTrue(hasattr(self.canvas_object, "end_at"))
+
+    def test_set_attributes_date_is_lazy(self, m):
+        self.canvas_object.set_attributes({"start_at": "2012-05-05T00:00:00Z"})
+
+        self.assertNotIn("start_at_date", self.canvas_object.__dict__)
+
+        start_date = self.canvas_object.start_at_date
+
+        self.assertEqual(
+            start_date, datetime(2012, 5, 5, 0, 0, 0).replace(tzinfo=pytz.utc)
+        )
+        self.assertIs(self.canvas_object.__dict__["start_at_date"], start_date)
+        self.assertIs(self.canvas_object.start_at_date, start_date)
+
+    def test_set_attributes_date_reset(self, m):
+        self.canvas_object.set_attributes({"start_at": "2012-05-05T00:00:00Z"})
+        self.assertEqual(self.canvas_object.start_at_date.year, 2012)
+
+        self.canvas_object.set_attributes({"start_at": "2019-01-01T00:00:00Z"})
+        self.assertEqual(self.canvas_object.start_at_date.year, 2019)
+
+        self.canvas_object.set_attributes({"start_at": None})
+        self.assertFalse(hasattr(self.canvas_object, "start_at_date"))
+
+    def test_set_attributes_date_field_not_overwritten(self, m):
+        attributes = {"todo": "2018-05-09T10:12:00Z", "todo_date": "2018-05-09"}
+
+        self.canvas_object.set_attributes(attributes)
+
+        self.assertEqual(self.canvas_object.todo_date, "2018-05-09")
+
+    def test_set_attributes_non_date_shapes(self, m):
+        attributes = {
+            "id": 2017,
+            "year": "2017",
+            "month": "2012-05",
+            "compact": "20120505",
+            "flag": True,
+        }
+
+        self.canvas_object.set_attributes(attributes)
+
+        self.assertFalse(hasattr(self.canvas_object, "id_date"))
+        self.assertFalse(hasattr(self.canvas_object, "year_date"))
+        self.assertFalse(hasattr(self.canvas_object, "month_date"))
+        self.assertFalse(hasattr(self.canvas_object, "compact_date"))
+        self.assertFalse(hasattr(self.canvas_object, "flag_date"))
+        self.assertFalse(hasattr(self.canvas_object, "missing_date"))
+
+    def test_set_attributes_uncommon_date_formats(self, m):
+        attributes = {
+            "hour_only": "2012-05-05T10",
+            "long_fraction": "2012-05-05T00:00:00.1234567Z",
+            "end_of_day": "2012-05-05T24:00:00Z",
+            "bad_month": "2012-13-01T00:00:00Z",
+        }
+
+        self.canvas_object.set_attributes(attributes)
+
+        self.assertEqual(
+            self.canvas_object.hour_only_date,
+            datetime(2012, 5, 5, 10).replace(tzinfo=pytz.utc),
+        )
+        self.assertEqual(
+            self.canvas_object.long_fraction_date,
+            datetime(2012, 5, 5, 0, 0, 0, 123457).replace(tzinfo=pytz.utc),
+        )
+        self.assertEqual(
+            self.canvas_object.end_of_day_date,
+            datetime(2012, 5, 6).replace(tzinfo=pytz.utc),
+        )
+        self.assertFalse(hasattr(self.canvas_object, "bad_month_date"))
+
+    # compact_objects
+    def test_compact_object(self, m):
+        requester = Requester(settings.BASE_URL, settings.API_KEY, compact_objects=True)
+        attributes = {"id": 1, "name": "Object", "start_at": "2012-05-05T00:00:00Z"}
+
+        canvas_object = CanvasObject(requester, attributes)
+
+        self.assertNotIn("name", canvas_object.__dict__)
+        self.assertEqual(canvas_object._values, (1, "Object", "2012-05-05T00:00:00Z"))
+        self.assertIs(
+            canvas_object._layout,
+            CanvasObject(requester, {"id": 2, "name": "", "start_at": None})._layout,
+        )
+        self.assertEqual(canvas_object.id, 1)
+        self.assertEqual(canvas_object.name, "Object")
+        self.assertEqual(
+            canvas_object.start_at_date,
+            datetime(2012, 5, 5, 0, 0, 0).replace(tzinfo=pytz.utc),
+        )
+        self.assertFalse(hasattr(canvas_object, "missing"))
+
+    def test_compact_object_set_attributes(self, m):
+        requester = Requester(settings.BASE_URL, settings.API_KEY, compact_objects=True)
+        attributes = {"id": 1, "name": "Object", "start_at": "2012-05-05T00:00:00Z"}
+        canvas_object = CanvasObject(requester, attributes)
+        canvas_object.start_at_date
+        canvas_object.name = "Renamed locally"
+
+        canvas_object.set_attributes(
+            {"name": "Renamed", "start_at": "2019-01-01T00:00:00Z"}
+        )
+
+        self.assertEqual(canvas_object.name, "Renamed")
+        self.assertEqual(canvas_object.start_at_date.year, 2019)
+        self.assertEqual(canvas_object.id, 1)
+        self.assertEqual(attributes["name"], "Object")
+
+    def test_compact_object_delete_attribute(self, m):
+        requester = Requester(settings.BASE_URL, settings.API_KEY, compact_objects=True)
+        attributes = {"id": 1, "name": "Object"}
+        canvas_object = CanvasObject(requester, attributes)
+
+        del canvas_object.name
+
+        self.assertFalse(hasattr(canvas_object, "name"))
+        self.assertEqual(canvas_object.id, 1)
+        with self.assertRaises(AttributeError):
+            del canvas_object.name
+
+    @patch("canvasapi.canvas_object._MAX_LAYOUTS", 1)
+    def test_compact_object_layouts_bounded(self, m):
+        requester = Requester(settings.BASE_URL, settings.API_KEY, compact_objects=True)
+
+        with patch("canvasapi.canvas_object._LAYOUTS", {}) as layouts:
+            first = CanvasObject(requester, {"id": 1, "first": True})
+            second = CanvasObject(requester, {"id": 2, "second": True})
+            third = CanvasObject(requester, {"id": 3, "second": False})
+
+        self.assertEqual(layouts, {("id", "first"): first._layout})
+        self.assertTrue(second.second)
+        self.assertFalse(third.second)
+        self.assertIsNot(second._layout, third._layout)
+
+    # TIMESTAMP_FIELDS and ID_FIELDS
+    def test_described_fields(self, m):
+        class Example(CanvasObject):
+            ID_FIELDS = ("id",)
+            TIMESTAMP_FIELDS = ("start_at", "end_at")
+
+        self.assertIsInstance(Example.start_at_date, DateField)
+        self.assertEqual(
+            Example._date_plan, {"id": False, "start_at": True, "end_at": True}
+        )
+
+        example = Example(
+            self.canvas_object._requester,
+            {
+                "id": "2012-05-05",
+                "start_at": "2012-05-05T00:00:00Z",
+                "end_at": None,
+                "other_at": "2012-05-05T00:00:00Z",
+            },
+        )
+
+        start_date = datetime(2012, 5, 5).replace(tzinfo=pytz.utc)
+        self.assertEqual(example.start_at_date, start_date)
+        self.assertIs(example.__dict__["start_at_date"], example.start_at_date)
+        self.assertEqual(example.other_at_date, start_date)
+        self.assertFalse(hasattr(example, "end_at_date"))
+        self.assertFalse(hasattr(example, "id_date"))
+
+        example.set_attributes({"start_at": "2019-01-01T00:00:00Z"})
+        self.assertEqual(example.start_at_date.year, 2019)
+
+    def test_described_fields_inherited(self, m):
+        class Example(CanvasObject):
+            TIMESTAMP_FIELDS = ("start_at",)
+
+        class SubExample(Example):
+            ID_FIELDS = ("id",)
+
+        self.assertEqual(SubExample._date_plan, {"start_at": True, "id": False})
+        self.assertEqual(CanvasObject._date_plan, {})
+
+    def test_set_attributes_date_field_after_parsed_date(self, m):
+        self.canvas_object.set_attributes({"todo": "2018-05-09T10:12:00Z"})
+        self.canvas_object.todo_date
+
+        self.canvas_object.set_attributes({"todo": "x", "todo_date": "2018-05-09"})
+
+        self.assertEqual(self.canvas_object.todo_date, "2018-05-09")
+
+    # identity_map
+    def test_identity_map(self, m):
+        requester = Requester(settings.BASE_URL, settings.API_KEY, identity_map=True)
+
+        class Example(CanvasObject):
+            IDENTITY_MAPPED = True
+
+        first = Example(requester, {"id": 1, "name": "First", "extra": True})
+        second = Example(requester, {"id": 1, "name": "Renamed"})
+
+        self.assertIs(first, second)
+        self.assertEqual(first.name, "Renamed")
+        self.assertTrue(first.extra)
+        self.assertIsNot(CanvasObject(requester, {"id": 1}), first)
+        self.assertIsNot(Example(requester, {"id": 2}), first)
+        self.assertIs(Example(requester, {"id": "1"}), first)
+        self.assertIsNot(
+            Example(requester, {"id": "home"}), Example(requester, {"id": "home"})
+        )
+        self.assertIsNot(Example(requester, {}), Example(requester, {}))
+
+    def test_identity_map_weak(self, m):
+        requester = Requester(settings.BASE_URL, settings.API_KEY, identity_map=True)
+
+        first = File(requester, {"id": 1, "name": "First"})
+        self.assertEqual(len(requester.identity_map), 1)
+
+        del first
+        gc.collect()
+
+        self.assertEqual(len(requester.identity_map), 0)
+        self.assertFalse(hasattr(File(requester, {"id": 1}), "name"))
+
+    def test_identity_map_class_not_mapped(self, m):
+        requester = Requester(settings.BASE_URL, settings.API_KEY, identity_map=True)
+
+        # Question ids are only unique within a quiz submission.
+        first = QuizSubmissionQuestion(requester, {"id": 7, "quiz_submission_id": 100})
+        second = QuizSubmissionQuestion(requester, {"id": 7, "quiz_submission_id": 200})
+
+        self.assertIsNot(first, second)
+        self.assertEqual(first.quiz_submission_id, 100)
+        self.assertEqual(len(requester.identity_map), 0)
+
+    def test_identity_map_disabled(self, m):
+        self.assertIsNone(self.canvas_object._requester.identity_map)
+        self.assertIsNot(
+            CanvasObject(self.canvas_object._requester, {"id": 1}),
+            CanvasObject(self.canvas_object._requester, {"id": 1}),
+        )
+
+    # _stub()
+    def test_stub(self, m):
+        m.register_uri(
+            "GET",
+            settings.BASE_URL_WITH_VERSION + "examples/1",
+            json={"id": 1, "name": "Example", "created_at": "2012-05-05T00:00:00Z"},
+        )
+        requester = self.canvas_object._requester
+
+        stub = CanvasObject._stub(requester, 1, "examples/1")
+        self.assertEqual(stub.id, 1)
+        copy.copy(stub)
+        self.assertFalse(m.called)
+
+        self.assertEqual(stub.created_at_date, datetime(2012, 5, 5, tzinfo=pytz.utc))
+        self.assertEqual(stub.name, "Example")
+        self.assertEqual(m.call_count, 1)
+
+    # to_dict()
+    def test_to_dict(self, m):
+        requester = self.canvas_object._requester
+        attributes = {
+            "id": 1,
+            "name": "Example",
+            "created_at": "2012-05-05T00:00:00Z",
+            "tags": ["a", "b"],
+        }
+
+        obj = CanvasObject(requester, attributes)
+        obj.created_at_date
+
+        self.assertEqual(obj.to_dict(), attributes)
+        self.assertIsNot(obj.to_dict(), obj.to_dict())
+
+    def test_to_dict_compact(self, m):
+        requester = Requester(settings.BASE_URL, settings.API_KEY, compact_objects=True)
+        attributes = {"id": 1, "name": "Example"}
+
+        self.assertEqual(CanvasObject(requester, attributes).to_dict(), attributes)
+
+    def test_to_dict_nested(self, m):
+        requester = self.canvas_object._requester
+        attributes = {"id": 1, "attachments": [{"id": 2, "display_name": "a.txt"}]}
+
+        submission = Submission(requester, attributes)
+        self.assertIsInstance(submission.attachments[0], File)
+
+        self.assertEqual(submission.to_dict(), attributes)
+
+    # from_dict()
+    def test_from_dict(self, m):
+        requester = self.canvas_object._requester
+        submission = Submission(
+            requester, {"id": 1, "attachments": [{"id": 2}], "graded_at": None}
+        )
+
+        rebuilt = Submission.from_dict(requester, submission.to_dict())
+
+        self.assertIsInstance(rebuilt, Submission)
+        self.assertIs(rebuilt._requester, requester)
+        self.assertEqual(rebuilt.to_dict(), submission.to_dict())
+        self.assertIsInstance(rebuilt.attachments[0], File)
+
+    # __getstate__() and __setstate__()
+    def test_pickle(self, m):
+        requester = self.canvas_object._requester
+        submission = Submission(
+            requester,
+            {
+                "id": 1,
+                "submitted_at": "2012-05-05T00:00:00Z",
+                "attachments": [{"id": 2}],
+            },
+        )
+        submission.attachments
+
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            data = pickle.dumps(submission, protocol=protocol)
+            self.assertNotIn(settings.API_KEY.encode(), data)
+
+            rebuilt = pickle.loads(data)
+            self.assertIsInstance(rebuilt, Submission)
+            self.assertIsNone(rebuilt._requester)
+            self.assertEqual(rebuilt.to_dict(), submission.to_dict())
+            self.assertEqual(
+                rebuilt.submitted_at_date, datetime(2012, 5, 5, tzinfo=pytz.utc)
+            )
+            self.assertIsInstance(rebuilt.attachments[0], File)
+
+    # __copy__() and __deepcopy__()
+    def test_copy(self, m):
+        requester = self.canvas_object._requester
+        course = Course(
+            requester, {"id": 1, "start_at": "2012-05-05T00:00:00Z", "tags": ["a"]}
+        )
+        course.start_at_date
+
+        for copied in (copy.copy(course), copy.deepcopy(course)):
+            self.assertIsInstance(copied, Course)
+            self.assertIsNot(copied, course)
+            self.assertIs(copied._requester, requester)
+            self.assertEqual(copied.to_dict(), course.to_dict())
+
+            copied.set_attributes({"start_at": "2019-01-01T00:00:00Z"})
+            self.assertEqual(copied.start_at_date.year, 2019)
+            self.assertEqual(course.start_at_date.year, 2012)
+
+        self.assertIs(copy.copy(course).tags, course.tags)
+        self.assertIsNot(copy.deepcopy(course).tags, course.tags)
+
+    def test_copy_stub(self, m):
+        m.register_uri(
+            "GET",
+            settings.BASE_URL_WITH_VERSION + "courses/1",
+            json={"id": 1, "name": "Example"},
+        )
+        requester = self.canvas_object._requester
+        stub = Course._stub(requester, 1, "courses/1")
+
+        for copied in (copy.copy(stub), copy.deepcopy(stub)):
+            self.assertEqual(copied.name, "Example")
+        self.assertEqual(m.call_count, 2)
+        self.assertIn("_loader", stub.__dict__)
@@ -1,7 +1,9 @@
+import io
 import os
 import unittest
 import uuid
 import warnings
+from unittest.mock import patch
 from urllib.parse import quote
 
 import requests
@@ -614,6 +616,56 @@ class TestCourse(unittest.TestCase):
         self.assertTrue(hasattr(front_page, "url"))
         self.assertTrue(hasattr(front_page, "title"))
 
+    # download_attachments()
+    def test_download_attachments(self, m):
+        m.register_uri(
+            "GET",
+            settings.BASE_URL_WITH_VERSION + "courses/1/students/submissions",
+            json=[
+                {
+                    "id": 1,
+                    "assignment_id": 1,
+                    "user_id": 2,
+                    "submission_history": [
+                        {
+                            "attempt": 1,
+                            "attachments": [
+                                {
+                                    "id": 3,
+                                    "display_name": "essay.pdf",
+                                    "url": "https://example.com/files/3/download",
+                                }
+                            ],
+                        }
+                    ],
+                }
+            ],
+        )
+        m.register_uri("GET", "https://example.com/files/3/download", content=b"essay")
+        archive = io.BytesIO()
+
+        summary = self.course.download_attachments(archive, include_history=True)
+
+        self.assertEqual(summary["downloaded"], ["1/2/1/3-essay.pdf"])
+        listing = m.request_history[0]
+        self.assertEqual(listing.qs["include[]"], ["submission_history"])
+        self.assertEqual(listing.qs["student_ids"], ["all"])
+
+    def test_download_attachments_kwargs(self, m):
+        m.register_uri(
+            "GET",
+            settings.BASE_URL_WITH_VERSION + "courses/1/students/submissions",
+            json=[],
+        )
+
+        summary = self.course.download_attachments(
+            io.BytesIO(), include_history=True, student_ids=[2], include="user"
+        )
+
+        self.assertEqual(summary["downloaded"], [])
+        self.assertEqual(m.last_request.qs["student_ids[]"], ["2"])
+        self.assertEqual(m.last_request.qs["include[]"], ["user", "submission_history"])
+
     # edit_front_page()
     def test_edit_front_page(self, m):
         register_uris({"course": ["edit_front_page"]}, m)
@@ -1618,6 +1670,30 @@ class TestCourse(unittest.TestCase):
         progress = progress.query()
         self.assertTrue(progress.context_type == "Course")
 
+    # submissions_bulk_update_chunked()
+    @patch("canvasapi.util.time.sleep")
+    @patch("canvasapi.batch.time")
+    def test_submissions_bulk_update_chunked(self, m, batch_time, sleep):
+        register_uris({"course": ["update_submissions"]}, m)
+        register_uris({"progress": ["course_progress_failed"]}, m)
+
+        # The job fails, then succeeds once the chunk is sent again.
+        batch_time.sleep.side_effect = lambda delay: register_uris(
+            {"progress": ["course_progress"]}, m
+        )
+
+        result = self.course.submissions_bulk_update_chunked(
+            {"1": {"10": {"posted_grade": 90}, "11": {"posted_grade": 91}}}
+        )
+
+        self.assertEqual(len(result["completed"]), 1)
+        self.assertEqual(result["completed"][0].workflow_state, "completed")
+        self.assertEqual(result["failed"], [])
+        posts = [r for r in m.request_history if r.method == "POST"]
+        self.assertEqual(len(posts), 2)
+        self.assertEqual(posts[0].body, posts[1].body)
+        batch_time.sleep.assert_called_once_with(1.0)
+
     # get_blueprint()
     def test_get_blueprint(self, m):
         register_uris({"course": ["get_blueprint"]}, m)
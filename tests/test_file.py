@@ -1,9 +1,12 @@
+import hashlib
+import io
 import unittest
 from os.path import isfile
 
 import requests_mock
 
 from canvasapi import Canvas
+from canvasapi.exceptions import CanvasException
 from canvasapi.file import File
 from tests import settings
 from tests.util import cleanup_file, register_uris
@@ -48,6 +51,121 @@ class TestFile(unittest.TestCase):
         finally:
             cleanup_file("canvasapi_file_download_test.txt")
 
+    def test_download_file_like(self, m):
+        content = bytes(range(256)) * 40
+        m.register_uri(
+            "GET",
+            requests_mock.ANY,
+            content=content,
+            headers={"Content-Length": str(len(content))},
+        )
+        file_out = io.BytesIO()
+        calls = []
+
+        digest = self.file.download(
+            file_out,
+            chunk_size=1000,
+            checksum="sha256",
+            progress=lambda written, total: calls.append((written, total)),
+        )
+
+        self.assertEqual(file_out.getvalue(), content)
+        self.assertEqual(digest, hashlib.sha256(content).hexdigest())
+        self.assertEqual(len(calls), 11)
+        self.assertEqual(calls[0], (1000, len(content)))
+        self.assertEqual(calls[-1], (len(content), len(content)))
+        self.assertTrue(m.last_request.stream)
+
+    def test_download_resume(self, m):
+        content = b"0123456789" * 10
+        filename = "canvasapi_file_download_resume_test.txt"
+
+        def partial(request, context):
+            self.assertEqual(request.headers["Range"], "bytes=30-")
+            context.status_code = 206
+            context.headers["Content-Range"] = "bytes 30-99/100"
+            return content[30:]
+
+        m.register_uri("GET", requests_mock.ANY, content=partial)
+        calls = []
+        try:
+            with open(filename, "wb") as partial_file:
+                partial_file.write(content[:30])
+
+            digest = self.file.download(
+                filename,
+                chunk_size=25,
+                resume=True,
+                checksum="md5",
+                progress=lambda written, total: calls.append((written, total)),
+            )
+
+            with open(filename, "rb") as downloaded_file:
+                self.assertEqual(downloaded_file.read(), content)
+            self.assertEqual(digest, hashlib.md5(content).hexdigest())
+            self.assertEqual(calls, [(55, 100), (80, 100), (100, 100)])
+        finally:
+            cleanup_file(filename)
+
+    def test_download_resume_ignored(self, m):
+        content = b"0123456789" * 10
+        filename = "canvasapi_file_download_resume_ignored_test.txt"
+        m.register_uri("GET", requests_mock.ANY, content=content)
+        try:
+            with open(filename, "wb") as partial_file:
+                partial_file.write(b"stale")
+
+            digest = self.file.download(filename, resume=True, checksum="sha1")
+
+            self.assertEqual(m.last_request.headers["Range"], "bytes=5-")
+            with open(filename, "rb") as downloaded_file:
+                self.assertEqual(downloaded_file.read(), content)
+            self.assertEqual(digest, hashlib.sha1(content).hexdigest())
+        finally:
+            cleanup_file(filename)
+
+    def test_download_resume_complete(self, m):
+        filename = "canvasapi_file_download_resume_complete_test.txt"
+        self.file.size = 5
+        calls = []
+        try:
+            with open(filename, "wb") as complete_file:
+                complete_file.write(b"12345")
+
+            digest = self.file.download(
+                filename,
+                resume=True,
+                checksum="sha256",
+                progress=lambda written, total: calls.append((written, total)),
+            )
+
+            self.assertFalse(m.called)
+            self.assertEqual(digest, hashlib.sha256(b"12345").hexdigest())
+            self.assertEqual(calls, [(5, 5)])
+        finally:
+            cleanup_file(filename)
+
+    def test_download_resume_wrong_range(self, m):
+        filename = "canvasapi_file_download_wrong_range_test.txt"
+        m.register_uri(
+            "GET",
+            requests_mock.ANY,
+            content=b"56789",
+            status_code=206,
+            headers={"Content-Range": "bytes 0-4/10"},
+        )
+        try:
+            with open(filename, "wb") as partial_file:
+                partial_file.write(b"01234")
+
+            with self.assertRaises(CanvasException):
+                self.file.download(filename, resume=True)
+
+            with open(filename, "rb") as partial_file:
+                self.assertEqual(partial_file.read(), b"01234")
+        finally:
+            cleanup_file(filename)
+
     # contents()
     def test_contents_file(self, m):
         register_uris({"file": ["file_contents"]}, m)
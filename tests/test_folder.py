@@ -1,3 +1,7 @@
+import hashlib
+import json
+import os
+import tempfile
 import unittest
 import uuid
 
@@ -6,6 +10,7 @@ import requests_mock
 from canvasapi import Canvas
 from canvasapi.file import File
 from canvasapi.folder import Folder
+from canvasapi.upload import UploadManifest
 from tests import settings
 from tests.util import cleanup_file, register_uris
 
@@ -53,6 +58,213 @@ class TestFolder(unittest.TestCase):
         self.assertEqual(len(folder_list), 2)
         self.assertIsInstance(folder_list[0], Folder)
 
+    # mirror()
+    def register_tree(self, m, files):
+        """
+        Register a folder tree where folder 1 holds folder 2, and `files` maps
+        each file ID to its folder ID, display name, `updated_at` and content.
+        """
+        m.register_uri(
+            "GET",
+            settings.BASE_URL_WITH_VERSION + "folders/1/folders",
+            json=[{"id": 2, "name": "Week 1", "folders_count": 0}],
+        )
+        for folder_id in (1, 2):
+            m.register_uri(
+                "GET",
+                settings.BASE_URL_WITH_VERSION + "folders/{}/files".format(folder_id),
+                json=[
+                    {
+                        "id": file_id,
+                        "display_name": name,
+                        "updated_at": updated_at,
+                        "size": len(content),
+                        "url": "https://example.com/files/{}/download".format(file_id),
+                    }
+                    for file_id, (parent, name, updated_at, content) in files.items()
+                    if parent == folder_id
+                ],
+            )
+        for file_id, (_, _, _, content) in files.items():
+            m.register_uri(
+                "GET",
+                "https://example.com/files/{}/download".format(file_id),
+                content=content,
+            )
+
+    def downloads(self, m):
+        return [
+            request.path for request in m.request_history if "/download" in request.path
+        ]
+
+    def test_mirror(self, m):
+        files = {
+            10: (1, "syllabus.pdf", "2024-01-01T00:00:00Z", b"syllabus"),
+            11: (2, "notes.txt", "2024-01-02T00:00:00Z", b"notes"),
+        }
+        self.register_tree(m, files)
+
+        with tempfile.TemporaryDirectory() as directory:
+            summary = self.folder.mirror(directory)
+
+            notes = os.path.join("Week 1", "notes.txt")
+            self.assertEqual(summary["downloaded"], ["syllabus.pdf", notes])
+            with open(os.path.join(directory, notes), "rb") as notes_file:
+                self.assertEqual(notes_file.read(), b"notes")
+            with open(os.path.join(directory, ".canvasapi-manifest.json")) as f:
+                manifest = json.load(f)["files"]
+            self.assertEqual(manifest["11"]["path"], notes)
+            self.assertEqual(manifest["11"]["size"], 5)
+            self.assertEqual(len(manifest["10"]["sha256"]), 64)
+
+            # Nothing changed, so nothing is downloaded again.
+            m.reset_mock()
+            summary = self.folder.mirror(directory)
+            self.assertEqual(summary["unchanged"], ["syllabus.pdf", notes])
+            self.assertEqual(self.downloads(m), [])
+
+    def test_mirror_changes(self, m):
+        files = {
+            10: (1, "syllabus.pdf", "2024-01-01T00:00:00Z", b"syllabus"),
+            11: (2, "notes.txt", "2024-01-02T00:00:00Z", b"notes"),
+            12: (2, "old.txt", "2024-01-03T00:00:00Z", b"old"),
+        }
+        self.register_tree(m, files)
+
+        with tempfile.TemporaryDirectory() as directory:
+            self.folder.mirror(directory)
+
+            # Update one file, move another and delete the third.
+            files[10] = (1, "syllabus.pdf", "2024-02-01T00:00:00Z", b"new syllabus")
+            files[11] = (1, "notes.txt", "2024-01-02T00:00:00Z", b"notes")
+            del files[12]
+            m.reset_mock()
+            self.register_tree(m, files)
+
+            summary = self.folder.mirror(directory)
+
+            self.assertEqual(summary["downloaded"], ["syllabus.pdf"])
+            self.assertEqual(summary["moved"], ["notes.txt"])
+            self.assertEqual(summary["deleted"], [os.path.join("Week 1", "old.txt")])
+            self.assertEqual(self.downloads(m), ["/files/10/download"])
+            with open(os.path.join(directory, "syllabus.pdf"), "rb") as syllabus:
+                self.assertEqual(syllabus.read(), b"new syllabus")
+            self.assertTrue(os.path.isfile(os.path.join(directory, "notes.txt")))
+            self.assertFalse(os.path.exists(os.path.join(directory, "Week 1")))
+
+    def test_mirror_replaced_file(self, m):
+        files = {10: (1, "syllabus.pdf", "2024-01-01T00:00:00Z", b"syllabus")}
+        self.register_tree(m, files)
+
+        with tempfile.TemporaryDirectory() as directory:
+            self.folder.mirror(directory)
+
+            # A new file with the same name replaces the old one.
+            self.register_tree(
+                m, {20: (1, "syllabus.pdf", "2024-02-01T00:00:00Z", b"new syllabus")}
+            )
+            summary = self.folder.mirror(directory)
+
+            self.assertEqual(summary["downloaded"], ["syllabus.pdf"])
+            self.assertEqual(summary["deleted"], [])
+            with open(os.path.join(directory, "syllabus.pdf"), "rb") as syllabus:
+                self.assertEqual(syllabus.read(), b"new syllabus")
+
+    def test_mirror_swapped_files(self, m):
+        files = {
+            10: (1, "a.txt", "2024-01-01T00:00:00Z", b"first"),
+            11: (1, "b.txt", "2024-01-02T00:00:00Z", b"second"),
+        }
+        self.register_tree(m, files)
+
+        with tempfile.TemporaryDirectory() as directory:
+            self.folder.mirror(directory)
+
+            files[10] = (1, "b.txt", "2024-01-01T00:00:00Z", b"first")
+            files[11] = (1, "a.txt", "2024-01-02T00:00:00Z", b"second")
+            m.reset_mock()
+            self.register_tree(m, files)
+            summary = self.folder.mirror(directory)
+
+            self.assertEqual(sorted(summary["moved"]), ["a.txt", "b.txt"])
+            self.assertEqual(self.downloads(m), [])
+            with open(os.path.join(directory, "a.txt"), "rb") as moved:
+                self.assertEqual(moved.read(), b"second")
+            with open(os.path.join(directory, "b.txt"), "rb") as moved:
+                self.assertEqual(moved.read(), b"first")
+            self.assertEqual(
+                sorted(os.listdir(directory)),
+                [".canvasapi-manifest.json", "a.txt", "b.txt"],
+            )
+
+    def test_mirror_renamed_and_changed(self, m):
+        files = {10: (1, "a.txt", "2024-01-01T00:00:00Z", b"first")}
+        self.register_tree(m, files)
+
+        with tempfile.TemporaryDirectory() as directory:
+            self.folder.mirror(directory)
+
+            # The download fails, so the earlier copy is kept and still tracked.
+            files[10] = (1, "b.txt", "2024-02-01T00:00:00Z", b"changed")
+            self.register_tree(m, files)
+            m.register_uri(
+                "GET", "https://example.com/files/10/download", status_code=500
+            )
+            summary = self.folder.mirror(directory)
+
+            self.assertEqual(summary["failed"][0][0], "b.txt")
+            with open(os.path.join(directory, ".canvasapi-manifest.json")) as f:
+                manifest = json.load(f)["files"]
+            self.assertEqual(manifest["10"]["path"], "a.txt")
+            self.assertTrue(os.path.isfile(os.path.join(directory, "a.txt")))
+
+            self.register_tree(m, files)
+            summary = self.folder.mirror(directory)
+
+            self.assertEqual(summary["downloaded"], ["b.txt"])
+            self.assertEqual(summary["deleted"], [])
+            self.assertEqual(
+                sorted(os.listdir(directory)), [".canvasapi-manifest.json", "b.txt"]
+            )
+            with open(os.path.join(directory, "b.txt"), "rb") as changed:
+                self.assertEqual(changed.read(), b"changed")
+
+    def test_mirror_no_prune(self, m):
+        files = {10: (1, "syllabus.pdf", "2024-01-01T00:00:00Z", b"syllabus")}
+        self.register_tree(m, files)
+
+        with tempfile.TemporaryDirectory() as directory:
+            self.folder.mirror(directory)
+            self.register_tree(m, {})
+
+            summary = self.folder.mirror(directory, prune=False)
+
+            self.assertEqual(summary["deleted"], [])
+            self.assertTrue(os.path.isfile(os.path.join(directory, "syllabus.pdf")))
+
+    def test_mirror_failed(self, m):
+        files = {
+            10: (1, "syllabus.pdf", "2024-01-01T00:00:00Z", b"syllabus"),
+            11: (2, "notes.txt", "2024-01-02T00:00:00Z", b"notes"),
+        }
+        self.register_tree(m, files)
+        m.register_uri("GET", "https://example.com/files/10/download", status_code=500)
+
+        with tempfile.TemporaryDirectory() as directory:
+            summary = self.folder.mirror(directory)
+
+            self.assertEqual(
+                summary["downloaded"], [os.path.join("Week 1", "notes.txt")]
+            )
+            self.assertEqual(len(summary["failed"]), 1)
+            self.assertEqual(summary["failed"][0][0], "syllabus.pdf")
+            self.assertFalse(os.path.exists(os.path.join(directory, "syllabus.pdf")))
+
+            # The failed file is retried on the next run.
+            self.register_tree(m, files)
+            summary = self.folder.mirror(directory)
+            self.assertEqual(summary["downloaded"], ["syllabus.pdf"])
+
     # create_folder()
     def test_create_folder(self, m):
         register_uris({"folder": ["create_folder"]}, m)
@@ -76,6 +288,130 @@ class TestFolder(unittest.TestCase):
         finally:
             cleanup_file(filename)
 
+    def register_upload(self, m, file_id):
+        register_uris({"folder": ["upload"]}, m)
+        m.register_uri(
+            "POST",
+            settings.BASE_URL_WITH_VERSION + "files/upload_response_upload_url",
+            json={
+                "id": file_id,
+                "folder_id": 1,
+                "display_name": "handout.pdf",
+                "size": 7,
+                "updated_at": "2024-01-01T00:00:00Z",
+                "url": "great_url_success",
+            },
+        )
+
+    def test_upload_manifest(self, m):
+        self.register_upload(m, 20)
+        manifest = UploadManifest()
+
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, "handout.pdf")
+            with open(filename, "wb") as file:
+                file.write(b"handout")
+
+            uploaded, response = self.folder.upload(filename, manifest=manifest)
+            self.assertTrue(uploaded)
+            self.assertEqual(response["id"], 20)
+            self.assertEqual(len(manifest), 1)
+
+            # The same bytes are not sent again.
+            m.reset_mock()
+            uploaded, response = self.folder.upload(filename, manifest=manifest)
+            self.assertTrue(uploaded)
+            self.assertEqual(response["id"], 20)
+            self.assertFalse(m.called)
+
+            # Changed bytes are.
+            with open(filename, "wb") as file:
+                file.write(b"HANDOUT")
+            self.register_upload(m, 21)
+            uploaded, response = self.folder.upload(filename, manifest=manifest)
+            self.assertEqual(response["id"], 21)
+            self.assertEqual(m.call_count, 2)
+
+    def test_upload_manifest_file_without_path(self, m):
+        self.register_upload(m, 20)
+        manifest = UploadManifest()
+
+        with tempfile.TemporaryFile() as file:
+            file.write(b"handout")
+            file.seek(0)
+            uploaded, response = self.folder.upload(file, manifest=manifest)
+            self.assertTrue(uploaded)
+            self.assertEqual(response["id"], 20)
+            self.assertIn("name=file", m.request_history[0].text)
+
+            # Files without a path are recorded under the name "file".
+            manifest.add(
+                {"id": 21, "folder_id": 1, "display_name": "file", "size": 7},
+                hashlib.sha256(b"handout").hexdigest(),
+            )
+            m.reset_mock()
+            file.seek(0)
+            uploaded, response = self.folder.upload(file, manifest=manifest)
+
+        self.assertTrue(uploaded)
+        self.assertEqual(response["id"], 21)
+        self.assertFalse(m.called)
+
+    def test_upload_manifest_primed(self, m):
+        m.register_uri(
+            "GET",
+            settings.BASE_URL_WITH_VERSION + "folders/1/files",
+            json=[
+                {
+                    "id": 30,
+                    "display_name": "handout.pdf",
+                    "size": 7,
+                    "url": "https://example.com/files/30/download",
+                },
+                {"id": 31, "display_name": "other.pdf", "size": 7},
+            ],
+        )
+        m.register_uri(
+            "GET", "https://example.com/files/30/download", content=b"handout"
+        )
+        manifest = UploadManifest()
+        manifest.prime(self.folder)
+        self.assertEqual(len(manifest), 2)
+
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, "handout.pdf")
+            with open(filename, "wb") as file:
+                file.write(b"handout")
+
+            m.reset_mock()
+            uploaded, response = self.folder.upload(filename, manifest=manifest)
+
+            self.assertTrue(uploaded)
+            self.assertEqual(response["id"], 30)
+            # Only the candidate with the same name is downloaded to hash it.
+            self.assertEqual(m.call_count, 1)
+            self.assertEqual(m.last_request.path, "/files/30/download")
+
+    def test_upload_manifest_copies(self, m):
+        register_uris({"folder": ["copy_file"]}, m)
+        manifest = UploadManifest()
+        manifest.add(
+            {"id": 1, "folder_id": 5, "display_name": "Dummy File-1", "size": 7},
+            hashlib.sha256(b"handout").hexdigest(),
+        )
+
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, "Dummy File-1")
+            with open(filename, "wb") as file:
+                file.write(b"handout")
+
+            uploaded, response = self.folder.upload(filename, manifest=manifest)
+
+        self.assertTrue(uploaded)
+        self.assertEqual(response["id"], 1)
+        self.assertEqual(m.call_count, 1)
+        self.assertIn("source_file_id=1", m.last_request.body)
+
     # update()
     def test_update(self, m):
         register_uris({"folder": ["update"]}, m)
@@ -4,7 +4,12 @@ import requests_mock
 
 from canvasapi import Canvas
 from canvasapi.enrollment_term import EnrollmentTerm
-from canvasapi.paginated_list import PaginatedList
+from canvasapi.exceptions import ResourceDoesNotExist
+from canvasapi.paginated_list import (
+    PaginatedList,
+    _next_url_pattern,
+    iterate_concurrently,
+)
 from canvasapi.user import User
 from tests import settings
 from tests.util import register_uris
@@ -233,3 +238,119 @@ class TestPaginatedList(unittest.TestCase):
         self.assertIsInstance(pag_list, PaginatedList)
         self.assertEqual(len(list(pag_list)), 2)
         self.assertIsInstance(pag_list[0], User)
+
+    def test_paginated_list_new_quizzes(self, m):
+        url = settings.BASE_URL_NEW_QUIZZES + "courses/1/quizzes"
+        m.register_uri(
+            "GET",
+            url,
+            json=[{"id": "1"}, {"id": "2"}],
+            headers={"Link": '<{}?page=2&per_page=2>; rel="next"'.format(url)},
+        )
+        m.register_uri("GET", url + "?page=2&per_page=2", json=[{"id": "3"}])
+
+        pag_list = PaginatedList(
+            User,
+            self.requester,
+            "GET",
+            "courses/1/quizzes",
+            _url_override="new_quizzes",
+        )
+
+        self.assertEqual([user.id for user in pag_list], ["1", "2", "3"])
+        self.assertEqual(m.last_request.url, url + "?page=2&per_page=2")
+        self.assertIs(
+            _next_url_pattern(self.requester.base_url, self.requester.new_quizzes_url),
+            _next_url_pattern(self.requester.base_url, self.requester.new_quizzes_url),
+        )
+
+
+@requests_mock.Mocker()
+class TestIterateConcurrently(unittest.TestCase):
+    def setUp(self):
+        self.canvas = Canvas(settings.BASE_URL, settings.API_KEY)
+        self.requester = self.canvas._Canvas__requester
+
+        self.four = PaginatedList(User, self.requester, "GET", "four_objects_two_pages")
+        self.six = PaginatedList(User, self.requester, "GET", "six_objects_three_pages")
+
+    def register_lists(self, m):
+        requires = {
+            "paginated_list": [
+                "4_2_pages_p1",
+                "4_2_pages_p2",
+                "6_3_pages_p1",
+                "6_3_pages_p2",
+                "6_3_pages_p3",
+            ]
+        }
+        register_uris(requires, m)
+
+    def test_iterate_concurrently(self, m):
+        self.register_lists(m)
+
+        results = list(iterate_concurrently([self.four, self.six], max_workers=2))
+
+        self.assertEqual(len(results), 10)
+        four_ids = [element.id for source, element in results if source is self.four]
+        six_ids = [element.id for source, element in results if source is self.six]
+        self.assertEqual(four_ids, ["1", "2", "3", "4"])
+        self.assertEqual(six_ids, ["1", "2", "3", "4", "5", "6"])
+
+    def test_iterate_concurrently_ordered(self, m):
+        self.register_lists(m)
+
+        results = list(
+            iterate_concurrently((pl for pl in [self.six, self.four]), ordered=True)
+        )
+
+        self.assertEqual(
+            [source for source, _ in results], [self.six] * 6 + [self.four] * 4
+        )
+        self.assertEqual(
+            [element.id for _, element in results],
+            ["1", "2", "3", "4", "5", "6", "1", "2", "3", "4"],
+        )
+
+    def test_iterate_concurrently_already_loaded(self, m):
+        self.register_lists(m)
+        self.four[0]
+
+        results = list(iterate_concurrently([self.four]))
+
+        self.assertEqual([element.id for _, element in results], ["1", "2", "3", "4"])
+
+    def test_iterate_concurrently_raises(self, m):
+        self.register_lists(m)
+        m.register_uri(
+            "GET", settings.BASE_URL_WITH_VERSION + "missing", status_code=404
+        )
+        missing = PaginatedList(User, self.requester, "GET", "missing")
+
+        with self.assertRaises(ResourceDoesNotExist):
+            list(iterate_concurrently([self.four, missing, self.six], max_workers=1))
+
+    def test_iterate_concurrently_return_exceptions(self, m):
+        self.register_lists(m)
+        m.register_uri(
+            "GET", settings.BASE_URL_WITH_VERSION + "missing", status_code=404
+        )
+        missing = PaginatedList(User, self.requester, "GET", "missing")
+
+        for ordered in (False, True):
+            results = list(
+                iterate_concurrently(
+                    [missing, self.four], ordered=ordered, return_exceptions=True
+                )
+            )
+
+            errors = [element for source, element in results if source is missing]
+            self.assertEqual(len(errors), 1)
+            self.assertIsInstance(errors[0], ResourceDoesNotExist)
+            self.assertEqual(
+                len([source for source, _ in results if source is self.four]), 4
+            )
+
+    def test_iterate_concurrently_invalid_max_workers(self, m):
+        with self.assertRaises(ValueError):
+            list(iterate_concurrently([self.four], max_workers=0))
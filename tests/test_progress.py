@@ -1,9 +1,11 @@
 import unittest
+from unittest.mock import patch
 
 import requests_mock
 
 from canvasapi.canvas import Canvas
-from canvasapi.progress import Progress
+from canvasapi.exceptions import ProgressFailed
+from canvasapi.progress import Progress, wait_all
 from tests import settings
 from tests.util import register_uris
 
@@ -36,3 +38,86 @@ class TestProgress(unittest.TestCase):
 
         response = self.progress.query()
         self.assertIsInstance(response, Progress)
+
+    # wait()
+    def register_states(self, m, progress_id, *states):
+        m.register_uri(
+            "GET",
+            settings.BASE_URL_WITH_VERSION + "progress/{}".format(progress_id),
+            [
+                {"json": {"id": progress_id, "workflow_state": state}}
+                for state in states
+            ],
+        )
+
+    @patch("canvasapi.util.time.sleep")
+    def test_wait(self, m, sleep):
+        self.register_states(m, 2, "running", "running", "completed")
+
+        response = self.progress.wait(interval=2, backoff=2, max_interval=5)
+
+        self.assertIs(response, self.progress)
+        self.assertEqual(self.progress.workflow_state, "completed")
+        self.assertEqual([call.args[0] for call in sleep.call_args_list], [2, 4, 5])
+
+    @patch("canvasapi.util.time.sleep")
+    def test_wait_finished(self, m, sleep):
+        progress = Progress(self.canvas._Canvas__requester, {"id": 3})
+        progress.workflow_state = "completed"
+
+        progress.wait()
+
+        self.assertFalse(m.called)
+        self.assertFalse(sleep.called)
+
+    @patch("canvasapi.util.time.sleep")
+    def test_wait_failed(self, m, sleep):
+        m.register_uri(
+            "GET",
+            settings.BASE_URL_WITH_VERSION + "progress/2",
+            json={"id": 2, "workflow_state": "failed", "message": "Import failed"},
+        )
+
+        with self.assertRaises(ProgressFailed) as context:
+            self.progress.wait()
+
+        self.assertIs(context.exception.progress, self.progress)
+        self.assertEqual(str(context.exception), "Import failed")
+
+    @patch("canvasapi.util.time.sleep")
+    def test_wait_timeout(self, m, sleep):
+        self.register_states(m, 2, "running")
+
+        with self.assertRaises(TimeoutError):
+            self.progress.wait(timeout=0)
+
+    # wait_all()
+    @patch("canvasapi.util.time.sleep")
+    def test_wait_all(self, m, sleep):
+        requester = self.canvas._Canvas__requester
+        progresses = [Progress(requester, {"id": i}) for i in (4, 5, 6)]
+        self.register_states(m, 4, "running", "completed")
+        self.register_states(m, 5, "completed")
+        self.register_states(m, 6, "failed")
+
+        results = list(wait_all(progresses, interval=1, return_exceptions=True))
+
+        self.assertEqual(results[0], progresses[1])
+        self.assertIsInstance(results[1], ProgressFailed)
+        self.assertIs(results[1].progress, progresses[2])
+        self.assertIs(results[2], progresses[0])
+        # One shared delay per round rather than one per job.
+        self.assertEqual([call.args[0] for call in sleep.call_args_list], [1, 1.5])
+        self.assertEqual(m.call_count, 4)
+
+    @patch("canvasapi.util.time.sleep")
+    def test_wait_all_failed(self, m, sleep):
+        requester = self.canvas._Canvas__requester
+        self.register_states(m, 6, "failed")
+
+        with self.assertRaises(ProgressFailed):
+            list(wait_all([Progress(requester, {"id": 6})]))
+
+    def test_wait_all_max_workers(self, m):
+        with self.assertRaises(ValueError):
+            list(wait_all([self.progress], max_workers=0))
@@ -1,5 +1,6 @@
 import unittest
 from datetime import datetime
+from unittest.mock import patch
 from urllib.parse import quote
 
 import requests
@@ -13,10 +14,12 @@ from canvasapi.exceptions import (
     Forbidden,
     InvalidAccessToken,
     RateLimitExceeded,
+    RequestEntityTooLarge,
     ResourceDoesNotExist,
     Unauthorized,
     UnprocessableEntity,
 )
+from canvasapi.requester import decode_json
 from tests import settings
 from tests.util import register_uris
 
@@ -187,6 +190,12 @@ class TestRequester(unittest.TestCase):
         with self.assertRaises(Conflict):
             self.requester.request("GET", "409")
 
+    def test_request_413(self, m):
+        register_uris({"requests": ["413"]}, m)
+
+        with self.assertRaises(RequestEntityTooLarge):
+            self.requester.request("GET", "413")
+
     def test_request_422(self, m):
         register_uris({"requests": ["422"]}, m)
 
@@ -196,9 +205,11 @@ class TestRequester(unittest.TestCase):
     def test_request_500(self, m):
         register_uris({"requests": ["500"]}, m)
 
-        with self.assertRaises(CanvasException):
+        with self.assertRaises(CanvasException) as cm:
             self.requester.request("GET", "500")
 
+        self.assertEqual(cm.exception.status_code, 500)
+
     def test_request_generic(self, m):
         register_uris({"requests": ["502", "503", "absurd"]}, m)
 
@@ -210,3 +221,55 @@ class TestRequester(unittest.TestCase):
 
         with self.assertRaises(CanvasException):
             self.requester.request("GET", "absurd")
+
+    # decode_json()
+    def test_request_json(self, m):
+        register_uris({"requests": ["get"]}, m)
+
+        response = self.requester.request("GET", "fake_get_request")
+
+        self.assertIsInstance(response, requests.Response)
+        self.assertEqual(response.json(), requests.Response.json(response))
+
+    def test_decode_json_prefix(self, m):
+        m.register_uri(
+            "GET",
+            settings.BASE_URL_WITH_VERSION + "prefixed",
+            content=b'while(1);{"id": 1, "name": "while(1);"}',
+        )
+
+        response = self.requester.request("GET", "prefixed")
+
+        self.assertEqual(response.json(), {"id": 1, "name": "while(1);"})
+        self.assertEqual(
+            decode_json(response, parse_int=str), {"id": "1", "name": "while(1);"}
+        )
+        with patch("canvasapi.requester.orjson", None):
+            self.assertEqual(response.json(), {"id": 1, "name": "while(1);"})
+
+    def test_decode_json_fallback(self, m):
+        m.register_uri(
+            "GET",
+            settings.BASE_URL_WITH_VERSION + "large",
+            content=b'{"id": 123456789012345678901234567890}',
+        )
+
+        response = self.requester.request("GET", "large")
+
+        self.assertEqual(response.json(), {"id": 123456789012345678901234567890})
+        with patch("canvasapi.requester.orjson", None):
+            self.assertEqual(response.json(), {"id": 123456789012345678901234567890})
+
+    def test_decode_json_invalid(self, m):
+        m.register_uri(
+            "GET", settings.BASE_URL_WITH_VERSION + "invalid", content=b"{invalid"
+        )
+        m.register_uri(
+            "GET", settings.BASE_URL_WITH_VERSION + "empty", content=b"while(1);"
+        )
+
+        with self.assertRaises(ValueError):
+            self.requester.request("GET", "invalid").json()
+
+        with self.assertRaises(ValueError):
+            self.requester.request("GET", "empty").json()
@@ -5,6 +5,7 @@ import requests_mock
 from canvasapi import Canvas
 from canvasapi.assignment import AssignmentOverride
 from canvasapi.enrollment import Enrollment
+from canvasapi.exceptions import RequestEntityTooLarge
 from canvasapi.progress import Progress
 from canvasapi.section import Section
 from canvasapi.submission import GroupedSubmission, Submission
@@ -127,6 +128,23 @@ class TestSection(unittest.TestCase):
         progress = progress.query()
         self.assertTrue(progress.context_type == "Course")
 
+    # submissions_bulk_update_chunked()
+    def test_submissions_bulk_update_chunked(self, m):
+        register_uris({"section": ["update_submissions_too_large"]}, m)
+
+        result = self.section.submissions_bulk_update_chunked(
+            {"1": {"10": {"posted_grade": 90}, "11": {"posted_grade": 91}}}
+        )
+
+        # A chunk that's too large is split in half, down to single grades.
+        self.assertEqual(result["completed"], [])
+        self.assertEqual(
+            [chunk for chunk, _ in result["failed"]],
+            [{"1": {"10": {"posted_grade": 90}}}, {"1": {"11": {"posted_grade": 91}}}],
+        )
+        self.assertIsInstance(result["failed"][0][1], RequestEntityTooLarge)
+        self.assertEqual(m.call_count, 3)
+
     def test_enroll_user(self, m):
         requires = {"section": ["enroll_user"], "user": ["get_by_id"]}
         register_uris(requires, m)
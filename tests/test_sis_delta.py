@@ -0,0 +1,216 @@
+import io
+import os
+import tempfile
+import unittest
+import zipfile
+from email.parser import BytesParser
+from unittest.mock import patch
+
+import requests_mock
+
+from canvasapi import Canvas
+from canvasapi.account import Account
+from canvasapi.exceptions import SisImportFailed
+from canvasapi.sis_delta import create_delta_sis_import
+from canvasapi.sis_import import SisImport
+from tests import settings
+
+
+@requests_mock.Mocker()
+@patch("canvasapi.util.time.sleep")
+class TestCreateDeltaSisImport(unittest.TestCase):
+    def setUp(self):
+        self.canvas = Canvas(settings.BASE_URL, settings.API_KEY)
+        self.account = Account(self.canvas._Canvas__requester, {"id": 1})
+
+        self.directory = tempfile.TemporaryDirectory()
+        self.snapshots = os.path.join(self.directory.name, "snapshots")
+        self.users = os.path.join(self.directory.name, "users.csv")
+        self.courses = os.path.join(self.directory.name, "courses.csv")
+        self.sent = []
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def write(self, path, text):
+        with open(path, "w", newline="") as csv_file:
+            csv_file.write(text)
+
+    def register(self, m, state="imported", processing_errors=None, polled=None):
+        def create(request, context):
+            message = BytesParser().parsebytes(
+                b"Content-Type: "
+                + request.headers["Content-Type"].encode()
+                + b"\r\n\r\n"
+                + request.body
+            )
+            for part in message.get_payload():
+                if part.get_filename():
+                    archive = zipfile.ZipFile(io.BytesIO(part.get_payload(decode=True)))
+                    self.sent.append(
+                        {
+                            name: archive.read(name).decode().splitlines()
+                            for name in archive.namelist()
+                        }
+                    )
+            return {"id": 3, "workflow_state": "created"}
+
+        m.register_uri(
+            "POST",
+            settings.BASE_URL_WITH_VERSION + "accounts/1/sis_imports",
+            json=create,
+        )
+
+        def query(request, context):
+            if polled is not None:
+                polled()
+            sis_import = {"id": 3, "workflow_state": state}
+            if processing_errors is not None:
+                sis_import["processing_errors"] = processing_errors
+            return sis_import
+
+        m.register_uri(
+            "GET",
+            settings.BASE_URL_WITH_VERSION + "accounts/1/sis_imports/3",
+            json=query,
+        )
+
+    def test_create_delta_sis_import(self, m, sleep):
+        self.register(m)
+        self.write(
+            self.users,
+            "user_id,name,status\n"
+            "u1,Ada,active\n"
+            "u2,Grace,active\n"
+            "u3,Alan,active\n",
+        )
+        self.write(self.courses, "course_id,short_name,status\nc1,C1,active\n")
+
+        # Everything is sent the first time.
+        sis_import, changes = create_delta_sis_import(
+            self.account, [self.users, self.courses], self.snapshots
+        )
+        self.assertIsInstance(sis_import, SisImport)
+        self.assertEqual(sis_import.workflow_state, "imported")
+        self.assertEqual(changes["users"], {"added": 3, "updated": 0, "deleted": 0})
+        self.assertEqual(len(self.sent[0]["users.csv"]), 4)
+
+        # Then only what changed, leaving out unchanged files.
+        self.write(
+            self.users,
+            "user_id,name,status\n"
+            "u1,Ada,active\n"
+            "u2,Grace H,active\n"
+            "u4,Barbara,active\n",
+        )
+        sis_import, changes = create_delta_sis_import(
+            self.account, [self.users, self.courses], self.snapshots
+        )
+        self.assertEqual(changes["users"], {"added": 1, "updated": 1, "deleted": 1})
+        self.assertEqual(changes["courses"], {"added": 0, "updated": 0, "deleted": 0})
+        self.assertEqual(
+            self.sent[1],
+            {
+                "users.csv": [
+                    "user_id,name,status",
+                    "u2,Grace H,active",
+                    "u4,Barbara,active",
+                    "u3,Alan,deleted",
+                ]
+            },
+        )
+
+        # Nothing is sent when nothing changed.
+        sis_import, changes = create_delta_sis_import(
+            self.account, [self.users, self.courses], self.snapshots
+        )
+        self.assertIsNone(sis_import)
+        self.assertEqual(len(self.sent), 2)
+
+    def test_create_delta_sis_import_header_changed(self, m, sleep):
+        self.register(m)
+        self.write(self.users, "user_id,name\nu1,Ada\n")
+        create_delta_sis_import(self.account, [self.users], self.snapshots)
+
+        self.write(self.users, "user_id,name,email\nu1,Ada,ada@example.com\n")
+        _, changes = create_delta_sis_import(self.account, [self.users], self.snapshots)
+
+        self.assertEqual(changes["users"]["added"], 1)
+
+    def test_create_delta_sis_import_failed(self, m, sleep):
+        self.register(m, state="failed_with_messages")
+        self.write(self.users, "user_id,name\nu1,Ada\n")
+
+        with self.assertRaises(SisImportFailed):
+            create_delta_sis_import(self.account, [self.users], self.snapshots)
+
+        # The failed rows are sent again next time.
+        self.register(m)
+        _, changes = create_delta_sis_import(self.account, [self.users], self.snapshots)
+        self.assertEqual(changes["users"]["added"], 1)
+
+    def test_create_delta_sis_import_with_messages(self, m, sleep):
+        self.register(
+            m,
+            state="imported_with_messages",
+            processing_errors=[["users.csv", "Invalid user"]],
+        )
+        self.write(self.users, "user_id,name\nu1,Ada\n")
+        self.write(self.courses, "course_id,short_name\nc1,C1\n")
+        create_delta_sis_import(
+            self.account, [self.users, self.courses], self.snapshots
+        )
+
+        # Only the file without errors is taken as imported.
+        self.register(m)
+        _, changes = create_delta_sis_import(
+            self.account, [self.users, self.courses], self.snapshots
+        )
+        self.assertEqual(changes["users"]["added"], 1)
+        self.assertEqual(changes["courses"]["added"], 0)
+
+    def test_create_delta_sis_import_unattributed_messages(self, m, sleep):
+        self.register(
+            m,
+            state="imported_with_messages",
+            processing_errors=[["", "Something went wrong"]],
+        )
+        self.write(self.users, "user_id,name\nu1,Ada\n")
+        create_delta_sis_import(self.account, [self.users], self.snapshots)
+
+        self.assertFalse(os.path.exists(os.path.join(self.snapshots, "users.csv")))
+
+    def test_create_delta_sis_import_file_rewritten(self, m, sleep):
+        # The file changes while the import runs.
+        self.register(
+            m, polled=lambda: self.write(self.users, "user_id,name\nu1,Ada L\n")
+        )
+        self.write(self.users, "user_id,name\nu1,Ada\n")
+        create_delta_sis_import(self.account, [self.users], self.snapshots)
+
+        self.register(m)
+        _, changes = create_delta_sis_import(self.account, [self.users], self.snapshots)
+        self.assertEqual(changes["users"]["updated"], 1)
+
+    def test_create_delta_sis_import_ragged_row(self, m, sleep):
+        self.write(self.users, "user_id,name\nu1,Ada\n\nu2\n")
+
+        with self.assertRaises(ValueError) as cm:
+            create_delta_sis_import(self.account, [self.users], self.snapshots)
+
+        self.assertEqual(
+            str(cm.exception), "users.csv, line 4: expected 2 fields, found 1."
+        )
+
+    def test_create_delta_sis_import_unknown_file(self, m, sleep):
+        other = os.path.join(self.directory.name, "other.csv")
+        self.write(other, "id\n1\n")
+
+        with self.assertRaises(ValueError):
+            create_delta_sis_import(self.account, [other], self.snapshots)
+
+    def test_create_delta_sis_import_no_key(self, m, sleep):
+        self.write(self.users, "name\nAda\n")
+
+        with self.assertRaises(ValueError):
+            create_delta_sis_import(self.account, [self.users], self.snapshots)
@@ -1,10 +1,14 @@
+import io
 import unittest
+from unittest.mock import patch
 
 import requests_mock
 
 from canvasapi import Canvas
+from canvasapi.account import Account
+from canvasapi.exceptions import BadRequest, CanvasException, SisImportFailed
 from canvasapi.progress import Progress
-from canvasapi.sis_import import SisImport
+from canvasapi.sis_import import SisImport, run_sis_imports
 from tests import settings
 from tests.util import register_uris
 
@@ -38,6 +42,16 @@ class TestSisImportGroup(unittest.TestCase):
             else True
         )
 
+    # query()
+    def test_query(self, m):
+        register_uris({"sis_import": ["get_by_id"]}, m)
+
+        response = self.sis_import.query()
+
+        self.assertIsInstance(response, SisImport)
+        self.assertEqual(self.sis_import.workflow_state, "importing")
+        self.assertEqual(self.sis_import.account_id, 1)
+
     # restore_states()
     def test_restore_states(self, m):
         register_uris({"sis_import": ["restore_sis_import_states"]}, m)
@@ -48,3 +62,178 @@ class TestSisImportGroup(unittest.TestCase):
         self.assertEqual(restore_state_progress.context_id, self.sis_import.id)
         self.assertEqual(restore_state_progress.context_type, "SisBatch")
         self.assertEqual(restore_state_progress.tag, "sis_batch_state_restore")
+
+    # wait()
+    def register_states(self, m, *states):
+        m.register_uri(
+            "GET",
+            settings.BASE_URL_WITH_VERSION + "accounts/1/sis_imports/2",
+            [{"json": {"id": 2, "workflow_state": state}} for state in states],
+        )
+
+    @patch("canvasapi.util.time.sleep")
+    def test_wait(self, m, sleep):
+        self.register_states(m, "importing", "imported_with_messages")
+
+        response = self.sis_import.wait(interval=2, backoff=2)
+
+        self.assertIs(response, self.sis_import)
+        self.assertEqual(self.sis_import.workflow_state, "imported_with_messages")
+        self.assertEqual([call.args[0] for call in sleep.call_args_list], [2, 4])
+
+    @patch("canvasapi.util.time.sleep")
+    def test_wait_failed(self, m, sleep):
+        self.register_states(m, "aborted")
+
+        with self.assertRaises(SisImportFailed) as context:
+            self.sis_import.wait()
+
+        self.assertIs(context.exception.sis_import, self.sis_import)
+
+
+@requests_mock.Mocker()
+@patch("canvasapi.sis_import.time.sleep")
+class TestRunSisImports(unittest.TestCase):
+    def setUp(self):
+        self.canvas = Canvas(settings.BASE_URL, settings.API_KEY)
+        requester = self.canvas._Canvas__requester
+        self.accounts = [Account(requester, {"id": i}) for i in (1, 2)]
+
+    def register(self, m, account_id, path, responses, method="GET"):
+        m.register_uri(
+            method,
+            settings.BASE_URL_WITH_VERSION
+            + "accounts/{}/sis_imports{}".format(account_id, path),
+            [{"json": response} for response in responses],
+        )
+
+    def test_run_sis_imports(self, m, sleep):
+        self.register(m, 1, "/importing", [{"sis_imports": []}])
+        self.register(
+            m,
+            2,
+            "/importing",
+            [{"sis_imports": [{"id": 99, "workflow_state": "importing"}]}]
+            + [{"sis_imports": []}],
+        )
+        self.register(
+            m,
+            1,
+            "",
+            [
+                {"id": 11, "workflow_state": "created"},
+                {"id": 12, "workflow_state": "created"},
+            ],
+            method="POST",
+        )
+        self.register(m, 2, "", [{"id": 21, "workflow_state": "created"}], "POST")
+        self.register(
+            m,
+            1,
+            "/11",
+            [
+                {
+                    "id": 11,
+                    "workflow_state": "importing",
+                    "processing_warnings": [["users.csv", "w1"]],
+                },
+                {
+                    "id": 11,
+                    "workflow_state": "imported_with_messages",
+                    "processing_warnings": [["users.csv", "w1"], ["users.csv", "w2"]],
+                },
+            ],
+        )
+        self.register(m, 1, "/12", [{"id": 12, "workflow_state": "imported"}])
+        self.register(
+            m,
+            2,
+            "/21",
+            [
+                {
+                    "id": 21,
+                    "workflow_state": "failed_with_messages",
+                    "processing_errors": [["courses.csv", "e1"]],
+                }
+            ],
+        )
+
+        events = [
+            (kind, sis_import.id, detail)
+            for kind, sis_import, detail in run_sis_imports(
+                [
+                    (self.accounts[0], io.BytesIO(b"a"), {"batch_mode": True}),
+                    (self.accounts[1], io.BytesIO(b"b")),
+                    (self.accounts[0], io.BytesIO(b"c")),
+                ],
+                interval=1,
+            )
+        ]
+
+        failed = events.pop(6)
+        self.assertEqual(failed[:2], ("failed", 21))
+        self.assertIsInstance(failed[2], SisImportFailed)
+        self.assertEqual(
+            events,
+            [
+                ("submitted", 11, None),
+                ("warning", 11, ["users.csv", "w1"]),
+                ("submitted", 21, None),
+                ("warning", 11, ["users.csv", "w2"]),
+                ("finished", 11, None),
+                ("error", 21, ["courses.csv", "e1"]),
+                ("submitted", 12, None),
+                ("finished", 12, None),
+            ],
+        )
+        # The shared delay starts over whenever an import is submitted.
+        self.assertEqual([call.args[0] for call in sleep.call_args_list], [1, 1, 1])
+        first = [r for r in m.request_history if r.method == "POST"][0]
+        self.assertIn(b"batch_mode", first.body)
+
+    def test_run_sis_imports_request_failed(self, m, sleep):
+        for account_id in (1, 2):
+            self.register(m, account_id, "/importing", [{"sis_imports": []}])
+        m.register_uri(
+            "POST",
+            settings.BASE_URL_WITH_VERSION + "accounts/1/sis_imports",
+            [
+                {"status_code": 400, "json": {"errors": "Invalid attachment"}},
+                {"json": {"id": 12, "workflow_state": "created"}},
+            ],
+        )
+        self.register(m, 2, "", [{"id": 21, "workflow_state": "created"}], "POST")
+        self.register(m, 1, "/12", [{"id": 12, "workflow_state": "imported"}])
+        m.register_uri(
+            "GET",
+            settings.BASE_URL_WITH_VERSION + "accounts/2/sis_imports/21",
+            status_code=500,
+        )
+
+        events = list(
+            run_sis_imports(
+                [
+                    (self.accounts[0], io.BytesIO(b"a")),
+                    (self.accounts[1], io.BytesIO(b"b")),
+                    (self.accounts[0], io.BytesIO(b"c")),
+                ]
+            )
+        )
+
+        # A failed request fails only its own import.
+        self.assertEqual(
+            [(kind, getattr(sis_import, "id", None)) for kind, sis_import, _ in events],
+            [
+                ("failed", None),
+                ("submitted", 21),
+                ("failed", 21),
+                ("submitted", 12),
+                ("finished", 12),
+            ],
+        )
+        self.assertIsInstance(events[0][2], BadRequest)
+        self.assertIsInstance(events[2][2], CanvasException)
+
+    def test_run_sis_imports_max_workers(self, m, sleep):
+        with self.assertRaises(ValueError):
+            list(run_sis_imports([], max_workers=0))
@@ -43,6 +43,35 @@ class TestSubmission(unittest.TestCase):
         self.assertTrue(hasattr(submission.attachments[0], "id"))
         self.assertEqual(submission.attachments[0].id, 123)
 
+    def test__init__attachments_lazy(self, m):
+        register_uris({"submission": ["get_by_id_with_attachments"]}, m)
+
+        submission = self.assignment.get_submission(1)
+
+        self.assertIsInstance(submission.__dict__["attachments"][0], dict)
+        attachments = submission.attachments
+        self.assertIsInstance(attachments[0], File)
+        self.assertIs(submission.attachments, attachments)
+
+        submission.set_attributes({"attachments": [{"id": 456}]})
+        self.assertEqual(submission.attachments[0].id, 456)
+        self.assertIsInstance(submission.attachments[0], File)
+
+    def test__init__attachments_missing(self, m):
+        submission = Submission(self.canvas._Canvas__requester, {"id": 1})
+
+        self.assertEqual(submission.attachments, [])
+        self.assertIs(submission.attachments, submission.attachments)
+
+    def test__init__attachments_compact(self, m):
+        canvas = Canvas(settings.BASE_URL, settings.API_KEY, compact_objects=True)
+        submission = Submission(
+            canvas._Canvas__requester, {"id": 1, "attachments": [{"id": 123}]}
+        )
+
+        self.assertIsInstance(submission.attachments[0], File)
+        self.assertEqual(submission.attachments[0].id, 123)
+
     # __str__()
     def test__str__(self, m):
         string = str(self.submission)
@@ -1,11 +1,34 @@
+import hashlib
+import io
+import json
+import os
+import tempfile
+import threading
+import time
+import tracemalloc
 import unittest
 import uuid
+from email.parser import BytesParser
+from http.server import BaseHTTPRequestHandler, HTTPServer
 from pathlib import Path
 
+import requests
 import requests_mock
 
 from canvasapi.canvas import Canvas
-from canvasapi.upload import Uploader
+from canvasapi.exceptions import (
+    CanvasException,
+    RateLimitExceeded,
+    ResourceDoesNotExist,
+)
+from canvasapi.folder import Folder
+from canvasapi.requester import Requester
+from canvasapi.upload import (
+    DeduplicatingUploader,
+    Uploader,
+    UploadManifest,
+    upload_concurrently,
+)
 from tests import settings
 from tests.util import cleanup_file, register_uris
 
@@ -35,6 +58,20 @@ class TestUploader(unittest.TestCase):
         self.assertIsInstance(result[1], dict)
         self.assertIn("url", result[1])
 
+    def test_start_prefixed_response(self, m):
+        register_uris({"uploader": ["upload_response"]}, m)
+        m.register_uri(
+            "POST",
+            settings.BASE_URL_WITH_VERSION + "upload_response_upload_url",
+            text='while(1);{"url": "great_url_success"}',
+        )
+
+        uploader = Uploader(self.requester, "upload_response", self.file)
+        result = uploader.start()
+
+        self.assertTrue(result[0])
+        self.assertEqual(result[1], {"url": "great_url_success"})
+
     def test_start_pathlib(self, m):
         requires = {"uploader": ["upload_response", "upload_response_upload_url"]}
         register_uris(requires, m)
@@ -78,6 +115,93 @@ class TestUploader(unittest.TestCase):
                 self.requester, "upload_response_no_upload_params", self.filename
             ).start()
 
+    def test_upload_streams_multipart(self, m):
+        register_uris({"uploader": ["upload_response"]}, m)
+        received = {}
+
+        def upload(request, context):
+            received["content_type"] = request.headers["Content-Type"]
+            received["content_length"] = request.headers["Content-Length"]
+            received["body"] = request.body.read()
+            return {"url": "great_url_success"}
+
+        m.register_uri(
+            "POST",
+            settings.BASE_URL_WITH_VERSION + "upload_response_upload_url",
+            json=upload,
+        )
+        self.file.write("file contents")
+        self.file.seek(0)
+        calls = []
+
+        uploader = Uploader(
+            self.requester,
+            "upload_response",
+            self.filename,
+            progress=lambda sent, total: calls.append((sent, total)),
+        )
+        result = uploader.start()
+
+        self.assertTrue(result[0])
+        self.assertNotIn("progress", m.request_history[0].text)
+        self.assertEqual(int(received["content_length"]), len(received["body"]))
+        self.assertEqual(calls[-1], (len(received["body"]), len(received["body"])))
+
+        message = BytesParser().parsebytes(
+            b"Content-Type: "
+            + received["content_type"].encode()
+            + b"\r\n\r\n"
+            + received["body"]
+        )
+        parts = {
+            part.get_param("name", header="content-disposition"): part
+            for part in message.get_payload()
+        }
+        self.assertEqual(list(parts), ["some_param", "a_different_param", "file"])
+        self.assertEqual(parts["some_param"].get_payload(), "param123")
+        self.assertEqual(parts["file"].get_filename(), self.filename)
+        self.assertEqual(parts["file"].get_payload(decode=True), b"file contents")
+
+    def test_upload_untellable_file(self, m):
+        requires = {"uploader": ["upload_response", "upload_response_upload_url"]}
+        register_uris(requires, m)
+        self.file.write("file contents")
+        self.file.close()
+
+        class UntellableFile(io.FileIO):
+            def tell(self):
+                raise OSError("Illegal seek")
+
+        with UntellableFile(self.filename) as file:
+            result = Uploader(self.requester, "upload_response", file).start()
+
+        self.assertTrue(result[0])
+        self.assertIn(b"file contents", m.last_request.body)
+
+    def test_upload_file_without_path(self, m):
+        register_uris({"uploader": ["upload_response"]}, m)
+        bodies = []
+
+        def upload(request, context):
+            bodies.append(request.body.read())
+            return {"url": "great_url_success"}
+
+        m.register_uri(
+            "POST",
+            settings.BASE_URL_WITH_VERSION + "upload_response_upload_url",
+            json=upload,
+        )
+
+        with tempfile.TemporaryFile() as file:
+            file.write(b"file contents")
+            file.seek(0)
+            result = Uploader(self.requester, "upload_response", file).start()
+
+        self.assertTrue(result[0])
+        self.assertIn("name=file", m.request_history[0].text)
+        self.assertIn(b'filename="file"', bodies[0])
+        self.assertIn(b"file contents", bodies[0])
+
     def test_upload_fail(self, m):
         requires = {"uploader": ["upload_fail", "upload_response_fail"]}
         register_uris(requires, m)
@@ -88,3 +212,337 @@ class TestUploader(unittest.TestCase):
         self.assertFalse(result[0])
         self.assertIsInstance(result[1], dict)
         self.assertNotIn("url", result[1])
+
+
+@requests_mock.Mocker()
+class TestUploadManifest(unittest.TestCase):
+    def setUp(self):
+        self.canvas = Canvas(settings.BASE_URL, settings.API_KEY)
+        self.requester = self.canvas._Canvas__requester
+        self.folder = Folder(self.requester, {"id": 1})
+
+        self.directory = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.directory.name, "handout.pdf")
+        with open(self.filename, "wb") as file:
+            file.write(b"handout")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def list_files(self, m, files):
+        m.register_uri(
+            "GET", settings.BASE_URL_WITH_VERSION + "folders/1/files", json=files
+        )
+
+    # add()
+    def test_add_keeps_hash(self, m):
+        manifest = UploadManifest()
+        attributes = {"id": 1, "display_name": "a", "size": 3, "updated_at": "x"}
+        manifest.add(attributes, "abc")
+
+        manifest.add(attributes)
+        self.assertEqual(list(manifest.find("abc", "a", 3)), [manifest._files[1]])
+
+        # A changed file loses its hash.
+        manifest.add(dict(attributes, updated_at="y"))
+        self.assertEqual(list(manifest.find("abc", "a", 3)), [])
+
+    # prime()
+    def test_prime_forgets_deleted(self, m):
+        manifest = UploadManifest()
+        manifest.add({"id": 1, "folder_id": 1, "display_name": "a", "size": 3})
+        manifest.add({"id": 2, "folder_id": 2, "display_name": "b", "size": 3})
+        self.list_files(m, [{"id": 3, "display_name": "c", "size": 3}])
+
+        manifest.prime(self.folder)
+
+        self.assertEqual(sorted(manifest._files), [2, 3])
+        self.assertEqual(manifest._files[3]["folder_id"], 1)
+
+    # save()
+    def test_save(self, m):
+        path = os.path.join(self.directory.name, "manifest.json")
+        manifest = UploadManifest(path)
+        manifest.add({"id": 1, "folder_id": 1, "display_name": "a", "size": 3}, "abc")
+        manifest.save()
+
+        loaded = UploadManifest(path)
+        self.assertEqual(len(loaded), 1)
+        self.assertEqual([entry["id"] for entry in loaded.find("abc", "a", 3)], [1])
+        self.assertFalse(os.path.exists(path + ".tmp"))
+
+    # DeduplicatingUploader
+    def test_copy_deleted_uploads(self, m):
+        m.register_uri(
+            "POST",
+            settings.BASE_URL_WITH_VERSION + "folders/1/copy_file",
+            status_code=404,
+        )
+        register_uris({"folder": ["upload", "upload_final"]}, m)
+        manifest = UploadManifest()
+        manifest.add(
+            {"id": 5, "folder_id": 2, "display_name": "handout.pdf", "size": 7},
+            hashlib.sha256(b"handout").hexdigest(),
+        )
+
+        with open(self.filename, "rb") as file:
+            uploaded, response = DeduplicatingUploader(
+                self.requester, self.folder, file, manifest
+            ).start()
+
+        self.assertTrue(uploaded)
+        self.assertEqual(response["url"], "great_url_success")
+        self.assertEqual(len(manifest), 0)
+
+
+class UploadTarget(object):
+    """
+    Stands in for a course, group, user or folder, failing each file with the
+    given errors before uploading it.
+    """
+
+    def __init__(self, requester, errors=None, delay=0):
+        self.requester = requester
+        self.errors = errors or {}
+        self.delay = delay
+        self.attempts = {}
+        self.running = 0
+        self.most_running = 0
+        self.lock = threading.Lock()
+
+    def upload(self, file, **kwargs):
+        name = getattr(file, "name", file)
+        with self.lock:
+            self.attempts[name] = self.attempts.get(name, 0) + 1
+            attempt = self.attempts[name]
+            self.running += 1
+            self.most_running = max(self.most_running, self.running)
+        try:
+            time.sleep(self.delay)
+            errors = self.errors.get(name, [])
+            if attempt <= len(errors):
+                if hasattr(file, "read"):
+                    # Fail partway through sending the file.
+                    file.read(3)
+                raise errors[attempt - 1]
+            return Uploader(self.requester, "upload_response", file, **kwargs).start()
+        finally:
+            with self.lock:
+                self.running -= 1
+
+
+@requests_mock.Mocker()
+class TestUploadConcurrently(unittest.TestCase):
+    def setUp(self):
+        self.canvas = Canvas(settings.BASE_URL, settings.API_KEY)
+        self.requester = self.canvas._Canvas__requester
+
+        self.directory = tempfile.TemporaryDirectory()
+        self.filenames = []
+        for i in range(6):
+            filename = os.path.join(self.directory.name, "file{}.txt".format(i))
+            with open(filename, "w") as file:
+                file.write("contents of file {}".format(i))
+            self.filenames.append(filename)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def register(self, m):
+        register_uris(
+            {"uploader": ["upload_response", "upload_response_upload_url"]}, m
+        )
+
+    def test_upload_concurrently(self, m):
+        self.register(m)
+        target = UploadTarget(self.requester, delay=0.02)
+
+        results = dict(upload_concurrently(target, iter(self.filenames), max_workers=2))
+
+        self.assertEqual(set(results), set(self.filenames))
+        for success, response in results.values():
+            self.assertTrue(success)
+            self.assertIn("url", response)
+        self.assertEqual(target.most_running, 2)
+        self.assertEqual(len(m.request_history), 12)
+
+    def test_upload_concurrently_retries(self, m):
+        self.register(m)
+        target = UploadTarget(
+            self.requester,
+            errors={
+                self.filenames[0]: [
+                    CanvasException("502", status_code=502),
+                    CanvasException("503", status_code=503),
+                ],
+                self.filenames[1]: [requests.ConnectionError()],
+                self.filenames[2]: [RateLimitExceeded("Rate Limit Exceeded")],
+            },
+        )
+
+        results = dict(upload_concurrently(target, self.filenames, backoff=0.01))
+
+        self.assertTrue(all(success for success, _ in results.values()))
+        self.assertEqual(target.attempts[self.filenames[0]], 3)
+        self.assertEqual(target.attempts[self.filenames[1]], 2)
+        self.assertEqual(target.attempts[self.filenames[2]], 2)
+        self.assertEqual(target.attempts[self.filenames[3]], 1)
+
+    def test_upload_concurrently_rewinds_files(self, m):
+        self.register(m)
+        with open(self.filenames[0], "rb") as file:
+            file.read(5)
+            target = UploadTarget(
+                self.requester,
+                errors={file.name: [CanvasException("500", status_code=500)]},
+            )
+
+            results = list(upload_concurrently(target, [file], backoff=0))
+
+            body = m.last_request.body.read()
+            self.assertTrue(results[0][1][0])
+            self.assertIn(b"\r\n\r\nnts of file 0\r\n", body)
+
+    def test_upload_concurrently_gives_up(self, m):
+        self.register(m)
+        target = UploadTarget(
+            self.requester,
+            errors={
+                self.filenames[0]: [ResourceDoesNotExist("Not Found")],
+                self.filenames[1]: [CanvasException("500", status_code=500)] * 3,
+            },
+        )
+
+        results = dict(
+            upload_concurrently(
+                target, self.filenames, retries=2, backoff=0, return_exceptions=True
+            )
+        )
+
+        self.assertIsInstance(results[self.filenames[0]], ResourceDoesNotExist)
+        self.assertIsInstance(results[self.filenames[1]], CanvasException)
+        self.assertEqual(target.attempts[self.filenames[0]], 1)
+        self.assertEqual(target.attempts[self.filenames[1]], 3)
+        self.assertTrue(results[self.filenames[2]][0])
+
+    def test_upload_concurrently_raises(self, m):
+        self.register(m)
+        target = UploadTarget(
+            self.requester, errors={self.filenames[0]: [ResourceDoesNotExist("")]}
+        )
+
+        with self.assertRaises(ResourceDoesNotExist):
+            list(upload_concurrently(target, self.filenames))
+
+    def test_upload_concurrently_invalid_max_workers(self, m):
+        with self.assertRaises(ValueError):
+            list(upload_concurrently(None, self.filenames, max_workers=0))
+
+
+class StubUploadHandler(BaseHTTPRequestHandler):
+    """
+    Stands in for Canvas and its file store, hashing the file part of each
+    upload as it is read rather than keeping the body.
+    """
+
+    def do_POST(self):
+        if self.path.startswith("/api/v1/"):
+            body = {
+                "upload_url": "http://{}:{}/upload".format(*self.server.server_address),
+                "upload_params": {"key": "value"},
+            }
+        else:
+            body = self.read_upload()
+
+        content = json.dumps(body).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, *args):
+        pass
+
+    def read_upload(self):
+        boundary = self.headers["Content-Type"].split("boundary=")[1].encode()
+        remaining = int(self.headers["Content-Length"])
+
+        # The fields and the headers of the file part come first.
+        head = self.rfile.read(min(remaining, 4096))
+        start = head.index(b"\r\n\r\n", head.index(b'name="file"')) + 4
+        tail = b"\r\n--" + boundary + b"--\r\n"
+        size = remaining - start - len(tail)
+
+        digest = hashlib.sha256(head[start:])
+        read = len(head)
+        ending = b""
+        while read < remaining:
+            chunk = self.rfile.read(min(remaining - read, 1024 * 1024))
+            read += len(chunk)
+            ending = (ending + chunk)[-len(tail) :]  # noqa: E203
+            digest.update(chunk)
+
+        self.server.uploads.append(
+            {
+                "size": size,
+                "tail": ending == tail,
+                "tail_bytes": ending,
+                "digest": digest,
+            }
+        )
+        return {"url": "great_url_success", "size": size}
+
+
+class TestUploaderLargeFile(unittest.TestCase):
+    SIZE = 64 * 1024 * 1024
+
+    def setUp(self):
+        self.server = HTTPServer(("127.0.0.1", 0), StubUploadHandler)
+        self.server.uploads = []
+        self.thread = threading.Thread(target=self.server.serve_forever)
+        self.thread.start()
+
+        base_url = "http://{}:{}".format(*self.server.server_address)
+        self.requester = Requester(base_url, settings.API_KEY)
+
+        self.directory = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.directory.name, "lecture.mp4")
+        with open(self.filename, "wb") as file:
+            file.truncate(self.SIZE)
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self.thread.join()
+        self.directory.cleanup()
+
+    def test_upload_large_sparse_file(self):
+        calls = []
+
+        tracemalloc.start()
+        try:
+            result = Uploader(
+                self.requester,
+                "upload_token",
+                self.filename,
+                progress=lambda sent, total: calls.append(sent),
+            ).start()
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        self.assertTrue(result[0])
+        self.assertEqual(result[1]["size"], self.SIZE)
+        self.assertLess(peak, 8 * 1024 * 1024)
+
+        upload = self.server.uploads[0]
+        self.assertTrue(upload["tail"])
+        expected = hashlib.sha256()
+        zeros = bytes(1024 * 1024)
+        for _ in range(self.SIZE // len(zeros)):
+            expected.update(zeros)
+        expected.update(upload["tail_bytes"])
+        self.assertEqual(upload["digest"].digest(), expected.digest())
+        self.assertGreater(len(calls), 100)
+        self.assertEqual(calls, sorted(calls))
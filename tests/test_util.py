@@ -1,21 +1,33 @@
+import random
+import sys
 import unittest
 import uuid
+from datetime import datetime
 from itertools import chain
 
+import requests
 import requests_mock
 
 from canvasapi import Canvas
 from canvasapi.course import CourseNickname
+from canvasapi.exceptions import (
+    CanvasException,
+    RateLimitExceeded,
+    RequestEntityTooLarge,
+)
 from canvasapi.user import User
 from canvasapi.util import (
     clean_headers,
     combine_kwargs,
     file_or_path,
+    flatten_kwarg,
     get_institution_url,
     is_multivalued,
+    is_transient_error,
     normalize_bool,
     obj_or_id,
     obj_or_str,
+    safe_filename,
 )
 from tests import settings
 from tests.util import cleanup_file, register_uris
@@ -375,6 +387,69 @@ class TestUtil(unittest.TestCase):
             < result.index(("dict_list[key][]", "item2"))
         )
 
+    def test_combine_kwargs_matches_recursive(self, m):
+        # Compare against the original recursive implementation on random
+        # nested payloads.
+        rng = random.Random(0)
+
+        for _ in range(500):
+            kwargs = {
+                "kw{}".format(i): random_kwarg(rng, rng.randint(0, 4))
+                for i in range(rng.randint(0, 4))
+            }
+            self.assertEqual(
+                combine_kwargs(**kwargs), recursive_combine_kwargs(**kwargs)
+            )
+
+    def test_combine_kwargs_matches_recursive_iterables(self, m):
+        values = [1, "two", None, 4.5, True, datetime(2024, 1, 1)]
+
+        for make_kwarg in (
+            lambda: tuple(values),
+            lambda: set(values[:4]),
+            lambda: iter(values),
+            lambda: (value for value in values),
+            lambda: {"key": zip(values, values)},
+            lambda: [[value] for value in values],
+        ):
+            self.assertEqual(
+                combine_kwargs(kwarg=make_kwarg()),
+                recursive_combine_kwargs(kwarg=make_kwarg()),
+            )
+
+    def test_combine_kwargs_non_str_keys(self, m):
+        result = combine_kwargs(grade_data={1: {"posted_grade": "A"}, 2: [3, 4]})
+
+        self.assertEqual(
+            result,
+            [
+                ("grade_data[1][posted_grade]", "A"),
+                ("grade_data[2][]", 3),
+                ("grade_data[2][]", 4),
+            ],
+        )
+
+    def test_combine_kwargs_deep(self, m):
+        # Nesting deeper than the recursion limit still flattens.
+        kwarg = "value"
+        for _ in range(sys.getrecursionlimit() + 100):
+            kwarg = {"k": kwarg}
+
+        ((key, value),) = combine_kwargs(kwarg=kwarg)
+
+        self.assertEqual(key, "kwarg" + "[k]" * (sys.getrecursionlimit() + 100))
+        self.assertEqual(value, "value")
+
+    # flatten_kwarg()
+    def test_flatten_kwarg_matches_recursive(self, m):
+        rng = random.Random(1)
+
+        for _ in range(500):
+            obj = random_kwarg(rng, rng.randint(0, 4))
+            self.assertEqual(
+                flatten_kwarg("key", obj), recursive_flatten_kwarg("key", obj)
+            )
+
     # obj_or_id()
     def test_obj_or_id_int(self, m):
         user_id = obj_or_id(1, "user_id", (User,))
@@ -541,6 +616,24 @@ class TestUtil(unittest.TestCase):
 
         self.assertIn("Parameter `value` must", cm.exception.args[0])
 
+    # is_transient_error()
+    def test_is_transient_error(self, m):
+        self.assertTrue(is_transient_error(requests.ConnectionError()))
+        self.assertTrue(is_transient_error(requests.Timeout()))
+        self.assertTrue(is_transient_error(RateLimitExceeded("Rate Limit Exceeded")))
+        self.assertTrue(is_transient_error(CanvasException("503", status_code=503)))
+        self.assertFalse(is_transient_error(CanvasException("410", status_code=410)))
+        self.assertFalse(is_transient_error(RequestEntityTooLarge("Too large")))
+        self.assertFalse(is_transient_error(CanvasException("Unknown")))
+        self.assertFalse(is_transient_error(ValueError()))
+
+    # safe_filename()
+    def test_safe_filename(self, m):
+        self.assertEqual(safe_filename("notes.txt"), "notes.txt")
+        self.assertEqual(safe_filename("../etc/passwd"), ".._etc_passwd")
+        self.assertEqual(safe_filename(".."), "_")
+        self.assertEqual(safe_filename(""), "_")
+
     # clean_headers()
     def test_clean_headers_no_authorization(self, m):
         headers = {"Content-Type": "application/json"}
@@ -572,3 +665,57 @@ class TestUtil(unittest.TestCase):
 
         cleaned_headers = clean_headers(headers)
         self.assertEqual(cleaned_headers["Authorization"], "****3,45")
+
+
+def random_kwarg(rng, depth):
+    """
+    Build a random kwarg value of nested dicts, lists and scalars.
+    """
+    kind = rng.choice(("scalar", "dict", "list")) if depth else "scalar"
+    if kind == "dict":
+        return {
+            rng.choice(("a", "b", "grade", "posted_grade", ""))
+            + str(i): random_kwarg(rng, depth - 1)
+            for i in range(rng.randint(0, 3))
+        }
+    elif kind == "list":
+        return [random_kwarg(rng, depth - 1) for _ in range(rng.randint(0, 3))]
+    return rng.choice((0, 1, -5, 2.5, "", "text", "A+", None, True, False))
+
+
+def recursive_combine_kwargs(**kwargs):
+    # The original recursive implementation of `combine_kwargs`.
+    combined_kwargs = []
+
+    for kw, arg in kwargs.items():
+        if isinstance(arg, dict):
+            for k, v in arg.items():
+                for tup in recursive_flatten_kwarg(k, v):
+                    combined_kwargs.append(("{}{}".format(kw, tup[0]), tup[1]))
+        elif is_multivalued(arg):
+            for i in arg:
+                for tup in recursive_flatten_kwarg("", i):
+                    combined_kwargs.append(("{}{}".format(kw, tup[0]), tup[1]))
+        else:
+            combined_kwargs.append((str(kw), arg))
+
+    return combined_kwargs
+
+
+def recursive_flatten_kwarg(key, obj):
+    # The original recursive implementation of `flatten_kwarg`.
+    if isinstance(obj, dict):
+        new_list = []
+        for k, v in obj.items():
+            for tup in recursive_flatten_kwarg(k, v):
+                new_list.append(("[{}]{}".format(key, tup[0]), tup[1]))
+        return new_list
+
+    elif is_multivalued(obj):
+        new_list = []
+        for i in obj:
+            for tup in recursive_flatten_kwarg(key + "][", i):
+                new_list.append((tup[0], tup[1]))
+        return new_list
+    else:
+        return [("[{}]".format(str(key)), obj)]